@@ -76,9 +76,35 @@ class Admin:
         """Blocks a guest from making further bookings."""
         print(f"Guest {guest_id} has been blocked.")
 
-    def change_room_prices(self, new_price: float, room_type: str) -> None:
-        """Updates the price for a specific type of room."""
-        print(f"Updated price of {room_type} rooms to {new_price}.")
+    def change_room_prices(self, new_price: float, room_type: str, inventory: "RoomInventory" = None) -> None:
+        """
+        Updates the price for a specific type of room.
+
+        :param new_price: The new price per night.
+        :param room_type: The room type to reprice.
+        :param inventory: The RoomInventory whose rooms are repriced; only rooms of that type are visited.
+        """
+        if inventory is None:
+            print(f"Updated price of {room_type} rooms to {new_price}.")
+            return
+        count = inventory.reprice_type(room_type, new_price)
+        print(f"Updated price of {count} {room_type} rooms to {new_price}.")
+
+    def change_room_prices_for_dates(self, new_price: float, room_type: str, start_date: str, end_date: str, rate_calendar: "RateCalendar") -> None:
+        """
+        Updates the nightly rate of a room type for a date range.
+
+        :param new_price: The new nightly rate.
+        :param room_type: The room type to reprice.
+        :param start_date: The first night with the new rate, in YYYY-MM-DD format.
+        :param end_date: The first night after the new rate, in YYYY-MM-DD format.
+        :param rate_calendar: The RateCalendar to write into.
+        """
+        if not rate_calendar.has_rates(room_type):
+            print(f"No rates found for {room_type} rooms.")
+            return
+        nights = rate_calendar.set_rate(room_type, start_date, end_date, new_price)
+        print(f"Updated price of {room_type} rooms to {new_price} for {nights} nights from {start_date}.")
 
     def add_new_employee(self, employee: "Employee") -> None:
         """Adds a new employee to the system."""
@@ -0,0 +1,172 @@
+# AllocationService class
+import random
+import threading
+import time
+
+
+class AllocationService:
+    """
+    Confirms bookings from many worker threads without ever selling the same room twice.
+
+    Rooms must have a RoomCalendar: taking the calendar hold is what guarantees that two
+    bookings never get overlapping dates in the same room. On top of that, every room has a
+    version counter that goes up each time one of its bookings is confirmed. A worker reads the
+    version, checks availability without locking, and then confirms with a compare-and-swap:
+    the write only happens if the version is still the one it read. If another worker got there
+    first the result is RETRY and the worker starts again with fresh data, so a stale "available"
+    answer is re-checked instead of reported.
+    """
+
+    CONFIRMED = "Confirmed"
+    RETRY = "Retry"  # The room changed since its version was read
+    CONFLICT = "Conflict"  # The room is held by another booking for these dates
+
+    def __init__(self, lock_stripes: int = 64):
+        """
+        Initializes an AllocationService.
+
+        :param lock_stripes: The number of locks shared out between rooms; rooms with different
+            stripes never wait for each other.
+        """
+        self.__locks = [threading.Lock() for _ in range(lock_stripes)]
+        self.__versions = {}  # room_number -> version counter
+
+    def __lock_for(self, room_number: int) -> threading.Lock:
+        return self.__locks[hash(room_number) % len(self.__locks)]
+
+    @staticmethod
+    def __require_calendar(room: "Room") -> "RoomCalendar":
+        calendar = room.get_calendar()
+        if calendar is None:
+            raise ValueError(f"Room {room.get_room_number()} has no calendar, so its bookings cannot be allocated safely.")
+        return calendar
+
+    def get_version(self, room_number: int) -> int:
+        """Returns the current version of a room."""
+        return self.__versions.get(room_number, 0)
+
+    def check(self, booking: "Booking") -> tuple:
+        """
+        Reads a room's version and checks, without locking, whether the booking could be confirmed.
+
+        :param booking: The booking to check.
+        :return: A (version, available) pair to pass to try_confirm.
+        :raises ValueError: If the booking's room has no calendar.
+        """
+        room = booking.get_room()
+        calendar = self.__require_calendar(room)
+        version = self.get_version(room.get_room_number())
+        available = booking.has_room_hold() or calendar.find_conflict(
+            room.get_room_number(), booking.get_check_in_day(), booking.get_check_out_day(), booking.get_booking_id()) is None
+        return version, available
+
+    def try_confirm(self, booking: "Booking", expected_version: int) -> str:
+        """
+        Confirms a booking only if its room's version still matches the one read earlier.
+
+        :param booking: The booking to confirm.
+        :param expected_version: The room version returned by check.
+        :return: CONFIRMED, RETRY if the room changed in between, or CONFLICT if the dates are taken.
+        :raises ValueError: If the booking's room has no calendar.
+        """
+        self.__require_calendar(booking.get_room())
+        room_number = booking.get_room().get_room_number()
+        with self.__lock_for(room_number):
+            if self.__versions.get(room_number, 0) != expected_version:
+                return self.RETRY
+            if not booking.confirm_booking():
+                return self.CONFLICT
+            self.__versions[room_number] = expected_version + 1
+            return self.CONFIRMED
+
+    def confirm(self, booking: "Booking", max_attempts: int = 8) -> str:
+        """
+        Confirms a booking, retrying while other workers keep changing the room.
+
+        :param booking: The booking to confirm.
+        :param max_attempts: How many times to retry before giving up with RETRY.
+        :return: CONFIRMED, CONFLICT, or RETRY if every attempt lost the race.
+        :raises ValueError: If the booking's room has no calendar.
+        """
+        for _ in range(max_attempts):
+            version, available = self.check(booking)
+            if not available:
+                return self.CONFLICT
+            result = self.try_confirm(booking, version)
+            if result != self.RETRY:
+                return result
+        return self.RETRY
+
+    def __str__(self) -> str:
+        """Returns a string representation of the AllocationService object."""
+        return f"AllocationService(Rooms: {len(self.__versions)}, Confirms: {sum(self.__versions.values())})"
+
+
+def benchmark_concurrent_confirms(thread_counts: tuple = (1, 4, 16), rooms: int = 200, bookings: int = 20_000, seed: int = 7) -> list:
+    """
+    Confirms the same set of competing bookings from several threads and checks for double bookings.
+
+    Bookings are spread over a few rooms and a short date window, so many of them compete for
+    the same nights.
+
+    :param thread_counts: The numbers of worker threads to measure.
+    :param rooms: The number of rooms bookings compete for.
+    :param bookings: The number of bookings to confirm per run.
+    :param seed: Seed for the random stays, so every run competes over the same data.
+    :return: One dict per thread count with confirms, conflicts, double bookings and confirms per second.
+    """
+    from Booking import Booking
+    from ConflictDetector import ConflictDetector
+    from Guest import Guest
+    from Room import Room
+    from RoomCalendar import RoomCalendar
+
+    results = []
+    for thread_count in thread_counts:
+        rng = random.Random(seed)
+        guest = Guest(1, "Benchmark Guest", "bench@example.com")
+        room_objects = [Room(100 + i, "Double", [], 120.0) for i in range(rooms)]
+        stays = []
+        for booking_id in range(bookings):
+            check_in = 739433 + rng.randrange(60)
+            stays.append(Booking(booking_id, guest, rng.choice(room_objects), check_in, check_in + rng.randint(1, 4)))
+        calendar = RoomCalendar()
+        for room in room_objects:
+            room.set_calendar(calendar)
+
+        service = AllocationService()
+        outcomes = {AllocationService.CONFIRMED: 0, AllocationService.CONFLICT: 0, AllocationService.RETRY: 0}
+        outcome_lock = threading.Lock()
+
+        def worker(chunk: list) -> None:
+            counts = dict.fromkeys(outcomes, 0)
+            for booking in chunk:
+                counts[service.confirm(booking)] += 1
+            with outcome_lock:
+                for result, count in counts.items():
+                    outcomes[result] += count
+
+        threads = [threading.Thread(target=worker, args=(stays[i::thread_count],)) for i in range(thread_count)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        confirmed = [booking for booking in stays if booking.get_status() == "Confirmed"]
+        results.append({
+            "threads": thread_count,
+            "confirmed": outcomes[AllocationService.CONFIRMED],
+            "conflicts": outcomes[AllocationService.CONFLICT],
+            "gave_up": outcomes[AllocationService.RETRY],
+            "double_bookings": len(ConflictDetector.find_conflicts(confirmed)),
+            "confirms_per_second": round(outcomes[AllocationService.CONFIRMED] / elapsed),
+        })
+    return results
+
+
+# Example Usage
+if __name__ == "__main__":
+    for row in benchmark_concurrent_confirms():
+        print(row)
@@ -0,0 +1,107 @@
+# AmenityRegistry class
+class AmenityRegistry:
+    """
+    Interns amenity names and assigns each one a bit, so a set of amenities can be stored as an integer mask.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty AmenityRegistry.
+        """
+        self.__bits = {}  # amenity name -> bit position
+        self.__names = []  # bit position -> interned amenity name
+        self.__decoded = {}  # mask -> tuple of names, shared by every room with that mask
+
+    def intern(self, amenity: str) -> int:
+        """
+        Returns the bit position of an amenity, registering it if it is new.
+
+        :param amenity: The amenity name (e.g., Wi-Fi, TV).
+        :return: The bit position assigned to the amenity.
+        """
+        bit = self.__bits.get(amenity)
+        if bit is None:
+            bit = len(self.__names)
+            self.__bits[amenity] = bit
+            self.__names.append(amenity)
+        return bit
+
+    def get_bit(self, amenity: str) -> int:
+        """Returns the bit position of an amenity, or -1 if it was never registered."""
+        return self.__bits.get(amenity, -1)
+
+    def to_mask(self, amenities) -> int:
+        """
+        Encodes amenity names as a bitmask, registering any new names.
+
+        :param amenities: An iterable of amenity names.
+        :return: The combined bitmask.
+        """
+        mask = 0
+        for amenity in amenities:
+            mask |= 1 << self.intern(amenity)
+        return mask
+
+    def lookup_mask(self, amenities) -> int:
+        """
+        Encodes amenity names as a bitmask without registering new names.
+
+        Unknown names are skipped, since no room can have them.
+        """
+        mask = 0
+        for amenity in amenities:
+            bit = self.__bits.get(amenity)
+            if bit is not None:
+                mask |= 1 << bit
+        return mask
+
+    def to_names(self, mask: int) -> list:
+        """
+        Decodes a bitmask into amenity names in registration order.
+
+        :param mask: The bitmask to decode.
+        :return: A new list of amenity names.
+        """
+        names = self.__decoded.get(mask)
+        if names is None:
+            bits = []
+            remaining = mask
+            while remaining:
+                lowest = remaining & -remaining
+                bits.append(self.__names[lowest.bit_length() - 1])
+                remaining ^= lowest
+            names = tuple(bits)
+            self.__decoded[mask] = names
+        return list(names)
+
+    @staticmethod
+    def matches(mask: int, required_mask: int, excluded_mask: int = 0) -> bool:
+        """Checks whether a mask has every required amenity and none of the excluded ones."""
+        return mask & required_mask == required_mask and not mask & excluded_mask
+
+    def __len__(self) -> int:
+        """Returns the number of registered amenities."""
+        return len(self.__names)
+
+    def __str__(self) -> str:
+        """Returns a string representation of the AmenityRegistry object."""
+        return f"AmenityRegistry(Amenities: {', '.join(self.__names)})"
+
+
+# Shared registry used by every Room
+AMENITIES = AmenityRegistry()
+
+
+# Example Usage
+if __name__ == "__main__":
+    registry = AmenityRegistry()
+    suite = registry.to_mask(["Wi-Fi", "TV", "Mini-Bar"])
+    deluxe = registry.to_mask(["Wi-Fi", "TV", "Jacuzzi"])
+
+    print(registry.to_names(suite))  # Output: ['Wi-Fi', 'TV', 'Mini-Bar']
+
+    # Wi-Fi AND Mini-Bar AND NOT Jacuzzi
+    required = registry.lookup_mask(["Wi-Fi", "Mini-Bar"])
+    excluded = registry.lookup_mask(["Jacuzzi"])
+    print(registry.matches(suite, required, excluded))  # Output: True
+    print(registry.matches(deluxe, required, excluded))  # Output: False
@@ -1,10 +1,22 @@
+from datetime import date
+
+from NotificationSink import ConsoleSink, NotificationSink
+from RoomCalendar import to_ordinal
+from SpecialRequestRegistry import SPECIAL_REQUESTS
+
 
 #Booking Class
 class Booking:
     """
     Represents a hotel booking with guest details, room assignment, and booking status.
+
+    Bookings report what they do as events to a NotificationSink rather than printing.
+    The default sink discards events; use set_default_sink or set_notification_sink to
+    send them to the console, a buffer or a background writer.
     """
 
+    _default_sink = NotificationSink()  # Shared by every booking without its own sink
+
     def __init__(self, booking_id: int, guest: "Guest", room: "Room", check_in_date: str, check_out_date: str, status: str = "Pending"):
         """
         Initializes a Booking instance.
@@ -15,14 +27,33 @@ class Booking:
         :param check_in_date: The check-in date in YYYY-MM-DD format.
         :param check_out_date: The check-out date in YYYY-MM-DD format.
         :param status: The booking status (e.g., Pending, Confirmed, Cancelled).
+        :raises ValueError: If check-out is not after check-in, or if the booking is not cancelled
+            and cannot hold its dates in the room's calendar, because another booking holds them
+            or already uses the booking ID.
         """
         self.__booking_id = booking_id
         self.__guest = guest
         self.__room = room
         self.__check_in_date = check_in_date
         self.__check_out_date = check_out_date
+        self.__check_in_day = to_ordinal(check_in_date)  # Parsed once; used for all date arithmetic
+        self.__check_out_day = to_ordinal(check_out_date)
+        if self.__check_out_day <= self.__check_in_day:
+            raise ValueError(f"Check-out {check_out_date} must be after check-in {check_in_date}.")
         self.__status = status
-        self.__special_requests = []
+        self.__special_requests = ()  # Interned request codes (see SPECIAL_REQUESTS)
+        self.__discount = 0.0  # Discount percentage applied to the room price
+        self.__store = None  # BookingStore indexing this booking, if any
+        self.__request_queue = None  # SpecialRequestQueue following this booking, if any
+        self.__sink = None  # NotificationSink for this booking only; None uses the default sink
+        if status != "Cancelled":
+            calendar = room.get_calendar()
+            if calendar is not None and calendar.get_hold(booking_id) is not None:
+                raise ValueError(f"Booking ID {booking_id} already holds a room in the calendar.")
+            if not self.__hold_room():
+                raise ValueError(f"Room {room.get_room_number()} is not free from {check_in_date} to {check_out_date}.")
+        self.__emit("booking_created", guest_id=guest.get_guest_id(), room_number=room.get_room_number(),
+                    check_in_date=check_in_date, check_out_date=check_out_date, status=status)
 
     # Getter and Setter for booking_id
     def get_booking_id(self) -> int:
@@ -30,83 +61,309 @@ class Booking:
         return self.__booking_id
 
     def set_booking_id(self, booking_id: int) -> None:
-        """Updates the booking ID."""
+        """
+        Updates the booking ID, moving the booking's calendar hold to the new ID.
+
+        :raises ValueError: If another booking already holds a room under the new ID, or the
+            booking's store already has another booking with it. The booking keeps its old ID.
+        """
+        old_booking_id = self.__booking_id
+        if booking_id == old_booking_id:
+            return
+        calendar = self.__room.get_calendar()
+        if calendar is not None and not calendar.rename_hold(old_booking_id, booking_id):
+            raise ValueError(f"Booking ID {booking_id} already holds a room in the calendar.")
         self.__booking_id = booking_id
+        try:
+            self.__notify_indexes()
+        except ValueError:
+            self.__booking_id = old_booking_id
+            if calendar is not None:
+                calendar.rename_hold(booking_id, old_booking_id)
+            raise
+        self.__emit("booking_id_changed", old_booking_id=old_booking_id)
+
+    # Getter and Setter for store
+    def get_store(self) -> "BookingStore":
+        """Returns the BookingStore indexing this booking, or None."""
+        return self.__store
+
+    def set_store(self, store: "BookingStore") -> None:
+        """Links the booking to the BookingStore that indexes it (called by BookingStore.add_booking)."""
+        self.__store = store
+
+    # Getters and Setters for notification sinks
+    @staticmethod
+    def get_default_sink() -> NotificationSink:
+        """Returns the sink used by bookings without a sink of their own."""
+        return Booking._default_sink
+
+    @staticmethod
+    def set_default_sink(sink: NotificationSink) -> None:
+        """Sets the sink used by bookings without a sink of their own."""
+        Booking._default_sink = sink
+
+    def set_notification_sink(self, sink: NotificationSink) -> None:
+        """Sets a sink for this booking only (None falls back to the default sink)."""
+        self.__sink = sink
+
+    def __emit(self, event_type: str, **fields) -> None:
+        """Sends an event to the booking's sink; nothing is built when the sink discards events."""
+        sink = self.__sink if self.__sink is not None else Booking._default_sink
+        if sink.active:
+            fields["type"] = event_type
+            fields["booking_id"] = self.__booking_id
+            sink.emit(fields)
+
+    # Getter and Setter for request_queue
+    def get_request_queue(self) -> "SpecialRequestQueue":
+        """Returns the SpecialRequestQueue following this booking, or None."""
+        return self.__request_queue
+
+    def set_request_queue(self, request_queue: "SpecialRequestQueue") -> None:
+        """Links the booking to a SpecialRequestQueue (called by SpecialRequestQueue.add_booking)."""
+        self.__request_queue = request_queue
+
+    def __notify_indexes(self) -> None:
+        """Lets the store and the request queue re-file the booking after an indexed value changed."""
+        if self.__store is not None:
+            self.__store.on_booking_changed(self)
+        if self.__request_queue is not None:
+            self.__request_queue.on_booking_changed(self)
+
+    # Getters for guest, room and dates
+    def get_guest(self) -> "Guest":
+        """Returns the Guest object associated with the booking."""
+        return self.__guest
+
+    def get_room(self) -> "Room":
+        """Returns the Room object assigned to the booking."""
+        return self.__room
+
+    def get_check_in_date(self) -> str:
+        """Returns the check-in date in YYYY-MM-DD format."""
+        return self.__check_in_date
+
+    def get_check_out_date(self) -> str:
+        """Returns the check-out date in YYYY-MM-DD format."""
+        return self.__check_out_date
+
+    def get_check_in_day(self) -> int:
+        """Returns the check-in date as a day ordinal."""
+        return self.__check_in_day
+
+    def get_check_out_day(self) -> int:
+        """Returns the check-out date as a day ordinal."""
+        return self.__check_out_day
+
+    def get_nights(self) -> int:
+        """Returns the number of nights of the stay."""
+        return self.__check_out_day - self.__check_in_day
+
+    def __hold_room(self, room: "Room" = None, check_in_day: int = None, check_out_day: int = None) -> bool:
+        """
+        Holds a date range in a room's calendar, if the room has one (defaults: the booking's own room and dates).
+
+        The check and the write are a single O(log n) calendar operation. If another booking
+        already holds an overlapping range, nothing changes and the clash is reported.
+        """
+        room = self.__room if room is None else room
+        check_in_day = self.__check_in_day if check_in_day is None else check_in_day
+        check_out_day = self.__check_out_day if check_out_day is None else check_out_day
+        calendar = room.get_calendar()
+        if calendar is None or calendar.move(self.__booking_id, room.get_room_number(), check_in_day, check_out_day):
+            return True
+        conflict = calendar.find_conflict(room.get_room_number(), check_in_day, check_out_day, self.__booking_id)
+        if conflict is None:
+            self.__emit("invalid_dates")
+        else:
+            self.__emit("room_conflict", room_number=room.get_room_number(), conflicting_booking_id=conflict)
+        return False
+
+    def has_room_hold(self) -> bool:
+        """Checks whether the booking holds its dates in the room's calendar (always True without a calendar)."""
+        calendar = self.__room.get_calendar()
+        return calendar is None or calendar.get_hold(self.__booking_id) is not None
+
+    def __release_room(self) -> None:
+        """Releases the booking's dates from the room's calendar, if the room has one."""
+        calendar = self.__room.get_calendar()
+        if calendar is not None:
+            calendar.release(self.__booking_id)
 
     # Getter and Setter for status
     def get_status(self) -> str:
         """Returns the current booking status."""
         return self.__status
 
-    def set_status(self, status: str) -> None:
-        """Updates the booking status."""
+    def set_status(self, status: str) -> bool:
+        """
+        Updates the booking status, releasing or re-taking the room's calendar hold as needed.
+
+        :return: False if the booking is reactivated but its dates are now held by another booking.
+        """
+        if status == "Cancelled":
+            self.__release_room()
+        elif not self.has_room_hold() and not self.__hold_room():
+            return False
         self.__status = status
+        self.__notify_indexes()
+        self.__emit("status_changed", status=status)
+        return True
 
     # Getter and Setter for special_requests
     def get_special_requests(self) -> list:
         """Returns the list of special requests made for the booking."""
+        return [SPECIAL_REQUESTS.get_text(code) for code in self.__special_requests]
+
+    def get_special_request_codes(self) -> tuple:
+        """Returns the interned codes of the booking's special requests."""
         return self.__special_requests
 
-    def add_special_request(self, request: str) -> None:
-        """Adds a special request for the booking."""
-        self.__special_requests.append(request)
-        print(f"Special request added: {request}")
+    def add_special_request(self, request: str) -> int:
+        """
+        Adds a special request for the booking and queues it if the booking has a request queue.
+
+        :return: The interned code of the request.
+        """
+        code = SPECIAL_REQUESTS.intern(request)
+        self.__special_requests += (code,)
+        if self.__request_queue is not None:
+            self.__request_queue.push(self, code)
+        self.__emit("special_request_added", request=request, code=code)
+        return code
+
+    def confirm_booking(self) -> bool:
+        """
+        Confirms the booking by updating its status.
 
-    def confirm_booking(self) -> None:
-        """Confirms the booking by updating its status."""
+        :return: False if the room's dates are held by another booking, in which case the status is unchanged.
+        """
+        if not self.has_room_hold() and not self.__hold_room():
+            return False
         self.__status = "Confirmed"
-        print(f"Booking {self.__booking_id} confirmed.")
+        self.__notify_indexes()
+        self.__emit("booking_confirmed")
+        return True
 
     def cancel_booking(self) -> None:
         """Cancels the booking by updating its status."""
         self.__status = "Cancelled"
-        print(f"Booking {self.__booking_id} cancelled.")
+        self.__release_room()
+        self.__notify_indexes()
+        self.__emit("booking_cancelled")
 
-    def modify_booking(self, new_dates: tuple) -> None:
+    def modify_booking(self, new_dates: tuple) -> bool:
         """
         Modifies the booking dates.
 
         :param new_dates: A tuple containing (new_check_in_date, new_check_out_date).
+        :return: False if check-out is not after check-in or the new dates conflict with another
+            booking of the room, in which case nothing changes.
         """
+        check_in_day, check_out_day = to_ordinal(new_dates[0]), to_ordinal(new_dates[1])
+        if check_out_day <= check_in_day:
+            self.__emit("invalid_dates")
+            return False
+        if self.__status != "Cancelled" and not self.__hold_room(self.__room, check_in_day, check_out_day):
+            return False
         self.__check_in_date, self.__check_out_date = new_dates
-        print(f"Booking {self.__booking_id} modified to new dates: {new_dates}")
+        self.__check_in_day, self.__check_out_day = check_in_day, check_out_day
+        self.__notify_indexes()
+        self.__emit("booking_modified", new_dates=new_dates)
+        return True
 
-    def calculate_total_cost(self) -> float:
+    def calculate_total_cost(self, rate_calendar: "RateCalendar" = None) -> float:
         """
-        Calculates the total cost of the booking based on room price and duration.
+        Calculates the total cost of the booking based on room price, discount and duration.
 
+        :param rate_calendar: Optional RateCalendar with per-date rates. Rates set for the room
+            number take precedence over rates for the room type; nights without a rate use the
+            room's price per night.
         :return: The total cost of the stay.
         """
-        num_nights = int(self.__check_out_date.split('-')[2]) - int(self.__check_in_date.split('-')[2])
-        return num_nights * self.__room.get_price()
+        if rate_calendar is not None:
+            key = self.__room.get_room_number()
+            if not rate_calendar.has_rates(key):
+                key = self.__room.get_room_type()
+            total = rate_calendar.quote(key, self.__check_in_day, self.__check_out_day, self.__room.get_price())
+            return total * (1 - self.__discount / 100)
+        return (self.__check_out_day - self.__check_in_day) * self.__room.calculate_discounted_price(self.__discount)
+
+    @staticmethod
+    def calculate_total_costs(bookings: list) -> list:
+        """
+        Calculates the total cost of many bookings at once.
+
+        The discounted nightly price is computed once per (room, discount) pair and
+        shared by every booking of that room, so each booking costs one multiplication.
+
+        :param bookings: The Booking objects to price.
+        :return: The total cost of each booking, in the same order.
+        """
+        nightly = {}
+        totals = []
+        for booking in bookings:
+            key = (id(booking.__room), booking.__discount)
+            price = nightly.get(key)
+            if price is None:
+                price = booking.__room.calculate_discounted_price(booking.__discount)
+                nightly[key] = price
+            totals.append((booking.__check_out_day - booking.__check_in_day) * price)
+        return totals
+
+    # Getter for discount
+    def get_discount(self) -> float:
+        """Returns the discount percentage applied to the booking."""
+        return self.__discount
 
     def apply_discount(self, discount: float) -> None:
         """
-        Applies a discount to the room price.
+        Applies a discount to the room price for this booking.
+
+        The discount is kept on the booking and used by calculate_total_cost.
 
         :param discount: The discount percentage (0-100).
         """
+        self.__discount = discount
         new_price = self.__room.calculate_discounted_price(discount)
-        print(f"Discount applied. New room price: {new_price}")
+        self.__emit("discount_applied", discount=discount, new_price=new_price)
 
-    def extend_booking(self, extra_days: int) -> None:
+    def extend_booking(self, extra_days: int) -> bool:
         """
         Extends the booking by a given number of days.
 
         :param extra_days: The number of additional days to extend the booking.
+        :return: False if the stay would end on or before check-in or the extra days conflict with
+            another booking of the room, in which case nothing changes.
         """
-        new_checkout_day = int(self.__check_out_date.split('-')[2]) + extra_days
-        self.__check_out_date = f"{self.__check_out_date[:8]}{new_checkout_day}"
-        print(f"Booking {self.__booking_id} extended for {extra_days} extra days.")
-
-    def assign_room(self, room: "Room") -> None:
+        check_out_day = self.__check_out_day + extra_days
+        if check_out_day <= self.__check_in_day:
+            self.__emit("invalid_dates")
+            return False
+        if self.__status != "Cancelled" and not self.__hold_room(self.__room, self.__check_in_day, check_out_day):
+            return False
+        self.__check_out_day = check_out_day
+        self.__check_out_date = date.fromordinal(check_out_day).isoformat()
+        self.__notify_indexes()
+        self.__emit("booking_extended", extra_days=extra_days, check_out_date=self.__check_out_date)
+        return True
+
+    def assign_room(self, room: "Room") -> bool:
         """
         Assigns a new room to the booking.
 
         :param room: The new Room object.
+        :return: False if the new room is already held for the booking's dates, in which case nothing changes.
         """
+        if self.__status != "Cancelled" and not self.__hold_room(room):
+            return False
+        if room.get_calendar() is not self.__room.get_calendar():
+            self.__release_room()
         self.__room = room
-        print(f"Booking {self.__booking_id} assigned to Room {room.get_room_number()}")
+        self.__notify_indexes()
+        self.__emit("room_assigned", room_number=room.get_room_number())
+        return True
 
     def change_guest_details(self, new_guest: "Guest") -> None:
         """
@@ -115,11 +372,12 @@ class Booking:
         :param new_guest: The new Guest object.
         """
         self.__guest = new_guest
-        print(f"Guest details updated for Booking {self.__booking_id}")
+        self.__notify_indexes()
+        self.__emit("guest_changed", guest_id=new_guest.get_guest_id())
 
     def notify_guest(self) -> None:
         """Sends a notification to the guest about their booking."""
-        print(f"Notification sent to Guest {self.__guest.get_name()} for Booking {self.__booking_id}")
+        self.__emit("guest_notified", guest_name=self.__guest.get_name())
 
     def generate_booking_summary(self) -> str:
         """Generates a summary of the booking details."""
@@ -131,25 +389,31 @@ class Booking:
 
 
 # Example Usage
-guest1 = Guest(301, "Alice Smith", "alice@email.com")
-room1 = Room(101, "Suite", ["Wi-Fi", "TV", "Mini-Bar"], 150.0)
+if __name__ == "__main__":
+    from Guest import Guest
+    from Room import Room
+
+    Booking.set_default_sink(ConsoleSink())  # Show booking events on the console
+
+    guest1 = Guest(301, "Alice Smith", "alice@email.com")
+    room1 = Room(101, "Suite", ["Wi-Fi", "TV", "Mini-Bar"], 150.0)
 
-booking1 = Booking(1001, guest1, room1, "2025-07-01", "2025-07-05")
+    booking1 = Booking(1001, guest1, room1, "2025-07-01", "2025-07-05")
 
-# Testing Getter Methods
-print(booking1.get_booking_id())  # Output: 1001
-print(booking1.get_status())  # Output: Pending
-print(booking1.get_special_requests())  # Output: []
+    # Testing Getter Methods
+    print(booking1.get_booking_id())  # Output: 1001
+    print(booking1.get_status())  # Output: Pending
+    print(booking1.get_special_requests())  # Output: []
 
-# Testing Setter Methods
-booking1.set_status("Confirmed")
-booking1.add_special_request("Extra towels")
+    # Testing Setter Methods
+    booking1.set_status("Confirmed")
+    booking1.add_special_request("Extra towels")
 
-# Confirm Booking
-booking1.confirm_booking()
+    # Confirm Booking
+    booking1.confirm_booking()
 
-# Testing total cost calculation
-print(f"Total Cost: ${booking1.calculate_total_cost()}")  # Output: Total Cost: $600.0
+    # Testing total cost calculation
+    print(f"Total Cost: ${booking1.calculate_total_cost()}")  # Output: Total Cost: $600.0
 
-# Printing Updated Booking Info
-print(booking1)  # Output: Booking ID: 1001, Guest: Alice Smith, Room: 101, Status: Confirmed
+    # Printing Updated Booking Info
+    print(booking1)  # Output: Booking ID: 1001, Guest: Alice Smith, Room: 101, Status: Confirmed
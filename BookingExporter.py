@@ -0,0 +1,152 @@
+# BookingExporter class
+import csv
+import io
+import json
+
+
+# Column name -> function reading that column from a booking
+COLUMNS = {
+    "booking_id": lambda booking: booking.get_booking_id(),
+    "guest_id": lambda booking: booking.get_guest().get_guest_id(),
+    "guest_name": lambda booking: booking.get_guest().get_name(),  # Cached per guest by BookingExporter.iter_rows
+    "room_number": lambda booking: booking.get_room().get_room_number(),
+    "room_type": lambda booking: booking.get_room().get_room_type(),
+    "check_in_date": lambda booking: booking.get_check_in_date(),
+    "check_out_date": lambda booking: booking.get_check_out_date(),
+    "nights": lambda booking: booking.get_nights(),
+    "status": lambda booking: booking.get_status(),
+    "discount": lambda booking: booking.get_discount(),
+    "total_cost": lambda booking: booking.calculate_total_cost(),
+    "special_requests": lambda booking: "; ".join(booking.get_special_requests()),
+}
+
+DEFAULT_COLUMNS = ("booking_id", "guest_name", "room_number", "status")  # Same fields as generate_booking_summary
+
+
+class BookingExporter:
+    """
+    Streams bookings to CSV or JSON Lines with bounded memory.
+
+    Bookings are read one at a time from any iterable (a list, a BookingStore or a generator),
+    only the requested columns are computed, and rows are written in chunks so each write call
+    carries thousands of rows. Guest names are looked up once per guest, not once per booking,
+    from a cache keyed by guest ID and capped in size.
+    """
+
+    def __init__(self, columns: list = DEFAULT_COLUMNS, chunk_rows: int = 10_000, name_cache_size: int = 100_000):
+        """
+        Initializes a BookingExporter.
+
+        :param columns: The columns to export, in order. See COLUMNS for the names available.
+        :param chunk_rows: The number of rows buffered before each write.
+        :param name_cache_size: The most guest names cached during an export.
+        """
+        unknown = [column for column in columns if column not in COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown export columns: {', '.join(unknown)}")
+        self.__columns = tuple(columns)
+        self.__chunk_rows = chunk_rows
+        self.__name_cache_size = name_cache_size
+
+    def get_columns(self) -> tuple:
+        """Returns the exported column names."""
+        return self.__columns
+
+    def iter_rows(self, bookings):
+        """
+        Yields one tuple of column values per booking.
+
+        :param bookings: An iterable of Booking objects.
+        """
+        names = {}  # guest_id -> name, for this export only
+        readers = []
+        for column in self.__columns:
+            if column == "guest_name":
+                def read_name(booking, names=names, limit=self.__name_cache_size):
+                    guest = booking.get_guest()
+                    guest_id = guest.get_guest_id()
+                    name = names.get(guest_id)
+                    if name is None:
+                        if len(names) >= limit:
+                            names.clear()  # Keeps memory bounded; names are simply read again
+                        name = names[guest_id] = guest.get_name()
+                    return name
+                readers.append(read_name)
+            else:
+                readers.append(COLUMNS[column])
+        for booking in bookings:
+            yield tuple(read(booking) for read in readers)
+
+    def __chunks(self, rows):
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= self.__chunk_rows:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def export_csv(self, bookings, stream, header: bool = True) -> int:
+        """
+        Writes bookings to a text stream as CSV.
+
+        :param bookings: An iterable of Booking objects.
+        :param stream: The text stream to write to (open files with newline="").
+        :param header: Whether to write the column names first.
+        :return: The number of bookings written.
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        if header:
+            writer.writerow(self.__columns)
+        count = 0
+        for chunk in self.__chunks(self.iter_rows(bookings)):
+            writer.writerows(chunk)
+            stream.write(buffer.getvalue())
+            buffer.seek(0)
+            buffer.truncate()
+            count += len(chunk)
+        stream.write(buffer.getvalue())
+        return count
+
+    def export_jsonl(self, bookings, stream) -> int:
+        """
+        Writes bookings to a text stream as JSON Lines, one object per booking.
+
+        :param bookings: An iterable of Booking objects.
+        :param stream: The text stream to write to.
+        :return: The number of bookings written.
+        """
+        columns = self.__columns
+        encode = json.JSONEncoder(default=str).encode
+        count = 0
+        for chunk in self.__chunks(self.iter_rows(bookings)):
+            stream.write("".join(encode(dict(zip(columns, row))) + "\n" for row in chunk))
+            count += len(chunk)
+        return count
+
+    def __str__(self) -> str:
+        """Returns a string representation of the BookingExporter object."""
+        return f"BookingExporter(Columns: {', '.join(self.__columns)})"
+
+
+# Example Usage
+if __name__ == "__main__":
+    import sys
+
+    from Booking import Booking
+    from Guest import Guest
+    from Room import Room
+
+    alice = Guest(301, "Alice Smith", "alice@email.com")
+    suite = Room(101, "Suite", ["Wi-Fi", "TV", "Mini-Bar"], 150.0)
+    bookings = (Booking(1000 + i, alice, suite, "2025-07-01", "2025-07-05") for i in range(3))
+
+    exporter = BookingExporter(["booking_id", "guest_name", "room_number", "total_cost"])
+    exporter.export_csv(bookings, sys.stdout)
+    # Output:
+    # booking_id,guest_name,room_number,total_cost
+    # 1000,Alice Smith,101,600.0
+    # 1001,Alice Smith,101,600.0
+    # 1002,Alice Smith,101,600.0
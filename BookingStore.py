@@ -0,0 +1,201 @@
+# BookingStore class
+import threading
+from bisect import bisect_left, insort
+
+from RoomCalendar import to_ordinal
+
+
+class BookingStore:
+    """
+    Owns a set of bookings and indexes them by guest, room, status, check-in and check-out date.
+
+    Bookings added to the store report their own changes back to it, and the store watches
+    their guests and rooms so guest ID and room number changes are re-indexed too. Each change
+    moves the booking between index entries under the store's lock, so readers never see a
+    booking listed under both its old and new keys.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty BookingStore.
+        """
+        self.__lock = threading.RLock()
+        self.__bookings = {}  # booking_id -> Booking
+        self.__keys = {}  # id(Booking) -> index key the booking is currently filed under
+        self.__by_guest = {}  # guest_id -> {booking_id: Booking}
+        self.__by_room = {}  # room_number -> {booking_id: Booking}
+        self.__by_status = {}  # status -> {booking_id: Booking}
+        self.__check_ins = []  # Sorted (check_in_day, booking_id) pairs
+        self.__check_outs = []  # Sorted (check_out_day, booking_id) pairs
+
+    @staticmethod
+    def index_key(booking: "Booking") -> tuple:
+        """Returns the values a booking is indexed by: (booking_id, guest_id, room_number, status, check_in_day, check_out_day)."""
+        return (booking.get_booking_id(), booking.get_guest().get_guest_id(), booking.get_room().get_room_number(),
+                booking.get_status(), booking.get_check_in_day(), booking.get_check_out_day())
+
+    def __file(self, booking: "Booking", key: tuple) -> None:
+        booking_id, guest_id, room_number, status, check_in_day, check_out_day = key
+        self.__bookings[booking_id] = booking
+        self.__keys[id(booking)] = key
+        self.__by_guest.setdefault(guest_id, {})[booking_id] = booking
+        self.__by_room.setdefault(room_number, {})[booking_id] = booking
+        self.__by_status.setdefault(status, {})[booking_id] = booking
+        insort(self.__check_ins, (check_in_day, booking_id))
+        insort(self.__check_outs, (check_out_day, booking_id))
+        booking.get_guest().add_watcher(self)
+        booking.get_room().add_watcher(self)
+
+    def __unfile(self, booking: "Booking") -> None:
+        booking_id, guest_id, room_number, status, check_in_day, check_out_day = self.__keys.pop(id(booking))
+        del self.__bookings[booking_id]
+        for index, value in ((self.__by_guest, guest_id), (self.__by_room, room_number), (self.__by_status, status)):
+            bucket = index[value]
+            del bucket[booking_id]
+            if not bucket:
+                del index[value]
+        if guest_id not in self.__by_guest:
+            booking.get_guest().remove_watcher(self)
+        if room_number not in self.__by_room:
+            booking.get_room().remove_watcher(self)
+        for dates, entry in ((self.__check_ins, (check_in_day, booking_id)), (self.__check_outs, (check_out_day, booking_id))):
+            del dates[bisect_left(dates, entry)]
+
+    def add_booking(self, booking: "Booking") -> bool:
+        """
+        Adds a booking to the store and indexes it.
+
+        :param booking: The Booking object to add.
+        :return: True if the booking was added, False if its booking ID is already taken.
+        """
+        with self.__lock:
+            if booking.get_booking_id() in self.__bookings:
+                return False
+            self.__file(booking, self.index_key(booking))
+            booking.set_store(self)
+            return True
+
+    def remove_booking(self, booking_id: int) -> "Booking":
+        """
+        Removes a booking from the store.
+
+        :param booking_id: The ID of the booking to remove.
+        :return: The removed Booking object, or None if it was not in the store.
+        """
+        with self.__lock:
+            booking = self.__bookings.get(booking_id)
+            if booking is not None:
+                self.__unfile(booking)
+                booking.set_store(None)
+            return booking
+
+    def on_booking_changed(self, booking: "Booking") -> None:
+        """
+        Re-files a booking after one of its indexed values changed (called by Booking).
+
+        :raises ValueError: If another booking in the store already has the new booking ID; nothing changes.
+        """
+        with self.__lock:
+            old_key = self.__keys.get(id(booking))
+            new_key = self.index_key(booking)
+            if old_key is None or old_key == new_key:
+                return
+            other = self.__bookings.get(new_key[0])
+            if other is not None and other is not booking:
+                raise ValueError(f"Booking ID {new_key[0]} is already taken in the store.")
+            self.__unfile(booking)
+            self.__file(booking, new_key)
+
+    def on_guest_id_changed(self, guest: "Guest", old_guest_id: int) -> None:
+        """Re-files the bookings of a guest whose ID changed (called by Guest)."""
+        with self.__lock:
+            for booking in list(self.__by_guest.get(old_guest_id, {}).values()):
+                if booking.get_guest() is guest:
+                    self.on_booking_changed(booking)
+
+    def on_room_number_changed(self, room: "Room", old_room_number: int) -> None:
+        """Re-files the bookings of a room whose number changed (called by Room)."""
+        with self.__lock:
+            for booking in list(self.__by_room.get(old_room_number, {}).values()):
+                if booking.get_room() is room:
+                    self.on_booking_changed(booking)
+
+    def get_booking(self, booking_id: int) -> "Booking":
+        """Returns the booking with the given ID, or None."""
+        return self.__bookings.get(booking_id)
+
+    def get_bookings_by_guest(self, guest_id: int) -> list:
+        """Returns all bookings made by a guest."""
+        with self.__lock:
+            return list(self.__by_guest.get(guest_id, {}).values())
+
+    def get_bookings_by_room(self, room_number: int) -> list:
+        """Returns all bookings assigned to a room."""
+        with self.__lock:
+            return list(self.__by_room.get(room_number, {}).values())
+
+    def get_bookings_by_status(self, status: str) -> list:
+        """Returns all bookings with the given status (e.g., Pending, Confirmed, Cancelled)."""
+        with self.__lock:
+            return list(self.__by_status.get(status, {}).values())
+
+    def __iter_range(self, dates: list, first_day: int, last_day: int):
+        with self.__lock:
+            first = bisect_left(dates, (first_day,))
+            last = bisect_left(dates, (last_day + 1,))
+            booking_ids = [booking_id for _, booking_id in dates[first:last]]
+        for booking_id in booking_ids:
+            booking = self.__bookings.get(booking_id)
+            if booking is not None:
+                yield booking
+
+    def iter_arrivals(self, start_date, end_date=None):
+        """
+        Yields the bookings checking in between two dates (inclusive), in check-in order.
+
+        :param start_date: The first check-in date, as YYYY-MM-DD or a day ordinal.
+        :param end_date: The last check-in date; defaults to start_date.
+        """
+        first_day = to_ordinal(start_date)
+        return self.__iter_range(self.__check_ins, first_day, first_day if end_date is None else to_ordinal(end_date))
+
+    def iter_departures(self, start_date, end_date=None):
+        """
+        Yields the bookings checking out between two dates (inclusive), in check-out order.
+
+        :param start_date: The first check-out date, as YYYY-MM-DD or a day ordinal.
+        :param end_date: The last check-out date; defaults to start_date.
+        """
+        first_day = to_ordinal(start_date)
+        return self.__iter_range(self.__check_outs, first_day, first_day if end_date is None else to_ordinal(end_date))
+
+    def __iter__(self):
+        """Iterates over every booking in the store."""
+        return iter(list(self.__bookings.values()))
+
+    def __len__(self) -> int:
+        """Returns the number of bookings in the store."""
+        return len(self.__bookings)
+
+    def __str__(self) -> str:
+        """Returns a string representation of the BookingStore object."""
+        return f"BookingStore(Bookings: {len(self.__bookings)}, Guests: {len(self.__by_guest)}, Rooms: {len(self.__by_room)})"
+
+
+# Example Usage
+if __name__ == "__main__":
+    from Booking import Booking
+    from Guest import Guest
+    from Room import Room
+
+    store = BookingStore()
+    alice = Guest(301, "Alice Smith", "alice@email.com")
+    suite = Room(101, "Suite", ["Wi-Fi", "TV"], 150.0)
+    store.add_booking(Booking(1001, alice, suite, "2025-07-01", "2025-07-05"))
+    store.add_booking(Booking(1002, alice, suite, "2025-07-10", "2025-07-12"))
+
+    print([b.get_booking_id() for b in store.get_bookings_by_status("Pending")])  # Output: [1001, 1002]
+    store.get_booking(1001).confirm_booking()
+    print([b.get_booking_id() for b in store.get_bookings_by_status("Pending")])  # Output: [1002]
+    print([b.get_booking_id() for b in store.iter_arrivals("2025-07-01", "2025-07-31")])  # Output: [1001, 1002]
+    print(store)  # Output: BookingStore(Bookings: 2, Guests: 1, Rooms: 1)
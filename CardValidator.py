@@ -0,0 +1,179 @@
+# CardValidator class
+import random
+import time
+from bisect import bisect_right
+
+
+# Doubles a Luhn digit and adds the digits of the result: 0->0, 1->2, ..., 5->1 (10), ..., 9->9 (18)
+_LUHN_DOUBLE = bytes.maketrans(b"0123456789", b"0246813579")
+_SEPARATORS = b" -"
+
+# (first BIN, last BIN, issuer) on the first six digits of the card number, without overlaps
+BIN_RANGES = (
+    (222100, 272099, "Mastercard"),
+    (300000, 305999, "Diners Club"),
+    (340000, 349999, "American Express"),
+    (352800, 358999, "JCB"),
+    (360000, 369999, "Diners Club"),
+    (370000, 379999, "American Express"),
+    (380000, 399999, "Diners Club"),
+    (400000, 499999, "Visa"),
+    (500000, 509999, "Maestro"),
+    (510000, 559999, "Mastercard"),
+    (560000, 589999, "Maestro"),
+    (601100, 601199, "Discover"),
+    (620000, 629999, "UnionPay"),
+    (644000, 659999, "Discover"),
+)
+
+
+class CardValidator:
+    """
+    Validates card numbers with the Luhn check and names their issuer from a BIN-range table.
+
+    The Luhn sum is computed on the number's bytes: the doubled digits go through one
+    bytes.translate call and both halves are added with sum(), so no Python code runs per digit.
+    Issuers are found by binary search over the sorted range starts.
+    """
+
+    MIN_LENGTH = 12
+    MAX_LENGTH = 19
+
+    def __init__(self, bin_ranges: tuple = BIN_RANGES):
+        """
+        Initializes a CardValidator.
+
+        :param bin_ranges: (first BIN, last BIN, issuer) triples on six-digit prefixes; they must not overlap.
+        """
+        ranges = sorted(bin_ranges)
+        for (_, previous_end, _), (start, _, _) in zip(ranges, ranges[1:]):
+            if start <= previous_end:
+                raise ValueError(f"BIN ranges overlap at {start}")
+        self.__starts = [start for start, _, _ in ranges]
+        self.__ends = [end for _, end, _ in ranges]
+        self.__issuers = [issuer for _, _, issuer in ranges]
+
+    @staticmethod
+    def normalize(card_number: str) -> bytes:
+        """Returns the card number as ASCII bytes without spaces or dashes."""
+        return card_number.encode().translate(None, _SEPARATORS)
+
+    @staticmethod
+    def luhn_valid(digits: bytes) -> bool:
+        """Checks the Luhn checksum of a normalized number (ASCII digits only)."""
+        reversed_digits = digits[::-1]
+        total = sum(reversed_digits[::2]) + sum(reversed_digits[1::2].translate(_LUHN_DOUBLE)) - 48 * len(digits)
+        return total % 10 == 0
+
+    @staticmethod
+    def is_valid(card_number: str) -> bool:
+        """
+        Checks that a card number has 12 to 19 digits and passes the Luhn check.
+
+        Spaces and dashes between digit groups are ignored.
+        """
+        digits = CardValidator.normalize(card_number)
+        return CardValidator.MIN_LENGTH <= len(digits) <= CardValidator.MAX_LENGTH and digits.isdigit() and CardValidator.luhn_valid(digits)
+
+    def get_issuer(self, card_number: str) -> str:
+        """Returns the issuer of a card number from its first six digits, or None if no range covers it."""
+        digits = self.normalize(card_number)
+        if len(digits) < 6 or not digits[:6].isdigit():
+            return None
+        prefix = int(digits[:6])
+        index = bisect_right(self.__starts, prefix) - 1
+        if index >= 0 and prefix <= self.__ends[index]:
+            return self.__issuers[index]
+        return None
+
+    def validate_many(self, card_numbers) -> list:
+        """
+        Validates a batch of card numbers.
+
+        :param card_numbers: An iterable of card number strings.
+        :return: One (valid, issuer) pair per number; issuer is None for invalid or unknown numbers.
+        """
+        starts, ends, issuers = self.__starts, self.__ends, self.__issuers
+        double, separators = _LUHN_DOUBLE, _SEPARATORS
+        min_length, max_length = self.MIN_LENGTH, self.MAX_LENGTH
+        results = []
+        for card_number in card_numbers:
+            digits = card_number.encode().translate(None, separators)
+            reversed_digits = digits[::-1]
+            valid = (min_length <= len(digits) <= max_length and digits.isdigit()
+                     and (sum(reversed_digits[::2]) + sum(reversed_digits[1::2].translate(double)) - 48 * len(digits)) % 10 == 0)
+            issuer = None
+            if valid:
+                prefix = int(digits[:6])
+                index = bisect_right(starts, prefix) - 1
+                if index >= 0 and prefix <= ends[index]:
+                    issuer = issuers[index]
+            results.append((valid, issuer))
+        return results
+
+    def __str__(self) -> str:
+        """Returns a string representation of the CardValidator object."""
+        return f"CardValidator(BIN ranges: {len(self.__starts)})"
+
+
+def _luhn_loop(card_number: str) -> bool:
+    """The textbook per-digit Luhn check, kept as the benchmark baseline."""
+    total = 0
+    for position, character in enumerate(reversed(card_number)):
+        digit = int(character)
+        if position % 2:
+            digit *= 2
+            if digit > 9:
+                digit -= 9
+        total += digit
+    return total % 10 == 0
+
+
+def benchmark_validation(card_count: int = 200_000, seed: int = 4) -> dict:
+    """
+    Compares CardValidator.validate_many with a per-call loop doing a per-digit Luhn check and a linear BIN scan.
+
+    :param card_count: The number of generated card numbers (about half pass Luhn).
+    :param seed: Seed for the generated numbers.
+    :return: Seconds for each approach and whether they agreed.
+    """
+    rng = random.Random(seed)
+    prefixes = ["4", "51", "37", "6011", "35", "62"]
+    cards = []
+    for _ in range(card_count):
+        prefix = rng.choice(prefixes)
+        length = rng.choice((15, 16, 19))
+        cards.append(prefix + "".join(rng.choice("0123456789") for _ in range(length - len(prefix))))
+
+    def per_call(card_number: str) -> tuple:
+        valid = 12 <= len(card_number) <= 19 and card_number.isdigit() and _luhn_loop(card_number)
+        issuer = None
+        if valid:
+            prefix = int(card_number[:6])
+            issuer = next((name for start, end, name in BIN_RANGES if start <= prefix <= end), None)
+        return valid, issuer
+
+    started = time.perf_counter()
+    expected = [per_call(card) for card in cards]
+    loop_seconds = time.perf_counter() - started
+
+    validator = CardValidator()
+    started = time.perf_counter()
+    results = validator.validate_many(cards)
+    bulk_seconds = time.perf_counter() - started
+    return {
+        "cards": card_count,
+        "per_call_seconds": round(loop_seconds, 3),
+        "bulk_seconds": round(bulk_seconds, 3),
+        "agree": results == expected,
+    }
+
+
+# Example Usage
+if __name__ == "__main__":
+    validator = CardValidator()
+    print(validator.is_valid("4111 1111 1111 1111"))  # Output: True
+    print(validator.is_valid("4111111111111112"))  # Output: False (fails Luhn)
+    print(validator.validate_many(["378282246310005", "6011000990139424"]))  # Output: [(True, 'American Express'), (True, 'Discover')]
+
+    print(benchmark_validation())
@@ -0,0 +1,76 @@
+# ConflictDetector class
+import heapq
+
+
+class ConflictDetector:
+    """
+    Finds bookings that put the same room on overlapping dates.
+
+    Intervals are grouped by room, sorted by check-in and swept once with a min-heap of
+    the stays still in progress, so a full scan costs O(n log n) plus one step per conflict.
+    """
+
+    @staticmethod
+    def iter_interval_conflicts(intervals):
+        """
+        Yields every pair of overlapping intervals in the same room.
+
+        :param intervals: An iterable of (room_number, check_in_day, check_out_day, booking_id)
+            tuples, with dates as day ordinals and check-out exclusive.
+        :return: A generator of (room_number, earlier_booking_id, later_booking_id) tuples.
+        """
+        by_room = {}
+        for room_number, start, end, booking_id in intervals:
+            by_room.setdefault(room_number, []).append((start, end, booking_id))
+        for room_number, stays in by_room.items():
+            stays.sort(key=lambda stay: stay[0])
+            active = []  # Min-heap of (check_out_day, booking_id) for stays not yet over
+            for start, end, booking_id in stays:
+                while active and active[0][0] <= start:
+                    heapq.heappop(active)
+                for _, other_id in active:
+                    yield room_number, other_id, booking_id
+                heapq.heappush(active, (end, booking_id))
+
+    @staticmethod
+    def booking_intervals(bookings, include_cancelled: bool = False):
+        """
+        Yields the (room_number, check_in_day, check_out_day, booking_id) interval of each booking.
+
+        :param bookings: The Booking objects to read.
+        :param include_cancelled: Whether cancelled bookings take part.
+        """
+        for booking in bookings:
+            if include_cancelled or booking.get_status() != "Cancelled":
+                yield booking.get_room().get_room_number(), booking.get_check_in_day(), booking.get_check_out_day(), booking.get_booking_id()
+
+    @staticmethod
+    def find_conflicts(bookings: list, include_cancelled: bool = False) -> list:
+        """
+        Returns every pair of bookings that hold the same room on overlapping dates.
+
+        :param bookings: The Booking objects to check.
+        :param include_cancelled: Whether cancelled bookings take part.
+        :return: A list of (room_number, earlier_booking_id, later_booking_id) tuples.
+        """
+        return list(ConflictDetector.iter_interval_conflicts(ConflictDetector.booking_intervals(bookings, include_cancelled)))
+
+    @staticmethod
+    def has_conflicts(bookings: list) -> bool:
+        """Checks whether any two active bookings overlap in the same room."""
+        for _ in ConflictDetector.iter_interval_conflicts(ConflictDetector.booking_intervals(bookings)):
+            return True
+        return False
+
+
+# Example Usage
+if __name__ == "__main__":
+    from RoomCalendar import to_ordinal
+
+    intervals = [
+        (101, to_ordinal("2025-07-01"), to_ordinal("2025-07-05"), 1001),
+        (101, to_ordinal("2025-07-04"), to_ordinal("2025-07-06"), 1002),
+        (101, to_ordinal("2025-07-05"), to_ordinal("2025-07-07"), 1003),
+        (102, to_ordinal("2025-07-01"), to_ordinal("2025-07-05"), 1004),
+    ]
+    print(list(ConflictDetector.iter_interval_conflicts(intervals)))  # Output: [(101, 1001, 1002), (101, 1002, 1003)]
@@ -0,0 +1,254 @@
+# CouponRegistry class
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+
+from Money import to_basis_points, to_cents
+from RoomCalendar import to_ordinal
+
+
+class CouponRegistry:
+    """
+    Holds promotion codes and checks them against payments.
+
+    Codes are found in a dict, so lookup is O(1) however many campaigns are live. A code's rules
+    (expiry, room types, minimum spend, usage limit) are compiled once into a tuple of small
+    predicates; compiled codes are kept in an LRU cache, so hot codes are never recompiled and
+    cold ones cost only their stored definition. Redemption checks the usage limit and counts
+    the use in one step under a lock striped by code, so limits hold under concurrent checkout.
+    """
+
+    UNKNOWN_CODE = "unknown_code"
+    EXPIRED = "expired"
+    ROOM_TYPE = "room_type"
+    MIN_SPEND = "min_spend"
+    USAGE_LIMIT = "usage_limit"
+
+    def __init__(self, cache_size: int = 4096, lock_stripes: int = 64):
+        """
+        Initializes an empty CouponRegistry.
+
+        :param cache_size: The number of compiled codes kept in the LRU cache.
+        :param lock_stripes: The number of locks shared out between codes for redemption counting.
+        """
+        self.__definitions = {}  # code -> (discount_bp, expires_day, room_types, min_spend_cents, usage_limit)
+        self.__redemptions = {}  # code -> times redeemed
+        self.__compiled = OrderedDict()  # code -> (discount_bp, rules, usage_limit), least recently used first
+        self.__cache_size = cache_size
+        self.__cache_lock = threading.Lock()
+        self.__locks = [threading.Lock() for _ in range(lock_stripes)]
+
+    @staticmethod
+    def normalize(code: str) -> str:
+        """Returns a code as it is stored: trimmed and upper-case."""
+        return code.strip().upper()
+
+    def add_coupon(self, code: str, discount: float, expires=None, room_types: list = None, min_spend: float = None, usage_limit: int = None) -> None:
+        """
+        Adds a coupon, or replaces the rules of an existing one (its redemption count is kept).
+
+        :param code: The coupon code; case and surrounding spaces are ignored.
+        :param discount: The discount percentage (e.g., 10 for 10% off).
+        :param expires: The last day the coupon is valid (ordinal, date or YYYY-MM-DD), or None.
+        :param room_types: The room types the coupon is valid for, or None for all.
+        :param min_spend: The smallest payment amount the coupon applies to, or None.
+        :param usage_limit: The most times the coupon can be redeemed, or None for no limit.
+        """
+        code = self.normalize(code)
+        self.__definitions[code] = (
+            to_basis_points(discount),
+            None if expires is None else to_ordinal(expires),
+            None if room_types is None else frozenset(room_types),
+            None if min_spend is None else to_cents(min_spend),
+            usage_limit,
+        )
+        self.__redemptions.setdefault(code, 0)
+        with self.__cache_lock:
+            self.__compiled.pop(code, None)
+
+    def remove_coupon(self, code: str) -> bool:
+        """Removes a coupon; returns False if the code was not registered."""
+        code = self.normalize(code)
+        self.__redemptions.pop(code, None)
+        with self.__cache_lock:
+            self.__compiled.pop(code, None)
+            return self.__definitions.pop(code, None) is not None
+
+    @staticmethod
+    def compile_rules(definition: tuple) -> tuple:
+        """
+        Turns a coupon definition into a tuple of (predicate, reason) pairs.
+
+        Each predicate takes (payment, today_ordinal) and only rules the coupon actually has are included.
+        """
+        _, expires_day, room_types, min_spend_cents, _ = definition
+        rules = []
+        if expires_day is not None:
+            rules.append((lambda payment, today: today <= expires_day, CouponRegistry.EXPIRED))
+        if room_types is not None:
+            def room_type_allowed(payment, today):
+                booking = payment.get_booking()
+                return booking is not None and booking.get_room().get_room_type() in room_types
+            rules.append((room_type_allowed, CouponRegistry.ROOM_TYPE))
+        if min_spend_cents is not None:
+            rules.append((lambda payment, today: payment.get_amount_cents() >= min_spend_cents, CouponRegistry.MIN_SPEND))
+        return tuple(rules)
+
+    def __get_compiled(self, code: str) -> tuple:
+        """
+        Returns (discount_bp, rules, usage_limit) for a code from the LRU cache, compiling it on a miss.
+
+        Compiling happens outside the cache lock, so the result is only cached if the definition
+        was not replaced or removed in the meantime; otherwise a stale entry could outlive the
+        invalidation in add_coupon or remove_coupon.
+        """
+        with self.__cache_lock:
+            compiled = self.__compiled.get(code)
+            if compiled is not None:
+                self.__compiled.move_to_end(code)
+                return compiled
+        definition = self.__definitions.get(code)
+        if definition is None:
+            return None
+        compiled = (definition[0], self.compile_rules(definition), definition[4])
+        with self.__cache_lock:
+            if self.__definitions.get(code) is not definition:
+                return compiled
+            self.__compiled[code] = compiled
+            if len(self.__compiled) > self.__cache_size:
+                self.__compiled.popitem(last=False)
+        return compiled
+
+    def validate(self, code: str, payment: "Payment", today=None) -> tuple:
+        """
+        Checks whether a coupon applies to a payment without redeeming it.
+
+        :param code: The coupon code.
+        :param payment: The payment the coupon would apply to.
+        :param today: The day to check expiry against (default: today).
+        :return: A (discount_bp, reason) pair: the discount in basis points and None if the
+            coupon applies, or None and the reason it does not.
+        """
+        code = self.normalize(code)
+        compiled = self.__get_compiled(code)
+        if compiled is None:
+            return None, self.UNKNOWN_CODE
+        discount_bp, rules, usage_limit = compiled
+        today = date.today().toordinal() if today is None else to_ordinal(today)
+        for rule, reason in rules:
+            if not rule(payment, today):
+                return None, reason
+        if usage_limit is not None and self.__redemptions.get(code, 0) >= usage_limit:
+            return None, self.USAGE_LIMIT
+        return discount_bp, None
+
+    def redeem(self, code: str, payment: "Payment", today=None) -> tuple:
+        """
+        Validates a coupon and counts one use of it, atomically.
+
+        :return: A (discount_bp, reason) pair as returned by validate.
+        """
+        code = self.normalize(code)
+        with self.__locks[hash(code) % len(self.__locks)]:
+            discount_bp, reason = self.validate(code, payment, today)
+            if discount_bp is not None:
+                self.__redemptions[code] = self.__redemptions.get(code, 0) + 1
+            return discount_bp, reason
+
+    def get_redemptions(self, code: str) -> int:
+        """Returns how many times a coupon has been redeemed."""
+        return self.__redemptions.get(self.normalize(code), 0)
+
+    def __contains__(self, code: str) -> bool:
+        """Checks whether a coupon code is registered."""
+        return self.normalize(code) in self.__definitions
+
+    def __len__(self) -> int:
+        """Returns the number of registered coupons."""
+        return len(self.__definitions)
+
+    def __str__(self) -> str:
+        """Returns a string representation of the CouponRegistry object."""
+        return f"CouponRegistry(Coupons: {len(self.__definitions)}, Cached: {len(self.__compiled)})"
+
+
+def benchmark_validations(codes: int = 20_000, threads: int = 8, checks_per_thread: int = 25_000, seed: int = 9) -> dict:
+    """
+    Validates and redeems coupons from several checkout threads at once.
+
+    Most checks hit a small set of hot codes, as during a campaign, and the rest are spread
+    over every code.
+
+    :param codes: The number of registered coupons.
+    :param threads: The number of concurrent checkout threads.
+    :param checks_per_thread: The number of redemptions each thread attempts.
+    :param seed: Seed for the generated coupons and checkouts.
+    :return: Validations per second, redemptions accepted and whether any usage limit was exceeded.
+    """
+    import random
+
+    from Booking import Booking
+    from Guest import Guest
+    from Payment import Payment
+    from Room import Room
+
+    rng = random.Random(seed)
+    registry = CouponRegistry(cache_size=1024)
+    room_types = ["Single", "Double", "Deluxe", "Suite"]
+    limits = {}
+    for i in range(codes):
+        limits[f"PROMO{i}"] = rng.choice([None, 50, 1000])
+        registry.add_coupon(f"PROMO{i}", rng.choice([5, 10, 15, 20]), expires="2099-12-31",
+                            room_types=rng.sample(room_types, 2), min_spend=rng.choice([0, 100, 300]), usage_limit=limits[f"PROMO{i}"])
+    guest = Guest(1, "Benchmark Guest", "bench@example.com")
+    payments = [Payment(i, Booking(i, guest, Room(100 + i, room_types[i % 4], [], 120.0), 739433, 739435), 50 + i * 7 % 500, "Credit Card")
+                for i in range(1000)]
+    hot = [f"PROMO{i}" for i in range(50)]
+    work = [[(rng.choice(hot) if rng.random() < 0.9 else f"PROMO{rng.randrange(codes)}", rng.choice(payments))
+             for _ in range(checks_per_thread)] for _ in range(threads)]
+    accepted = [0] * threads
+
+    def checkout(index: int) -> None:
+        count = 0
+        for code, payment in work[index]:
+            if registry.redeem(code, payment)[0] is not None:
+                count += 1
+        accepted[index] = count
+
+    workers = [threading.Thread(target=checkout, args=(i,)) for i in range(threads)]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - started
+    over_limit = [code for code, limit in limits.items() if limit is not None and registry.get_redemptions(code) > limit]
+    return {
+        "threads": threads,
+        "validations_per_second": round(threads * checks_per_thread / elapsed),
+        "redeemed": sum(accepted),
+        "usage_limits_exceeded": len(over_limit),
+    }
+
+
+# Example Usage
+if __name__ == "__main__":
+    from Booking import Booking
+    from Guest import Guest
+    from Payment import Payment
+    from Room import Room
+
+    registry = CouponRegistry()
+    registry.add_coupon("SUMMER25", 25, expires="2025-08-31", room_types=["Suite"], min_spend=300, usage_limit=1)
+
+    guest1 = Guest(301, "Alice Smith", "alice@email.com")
+    suite = Booking(1001, guest1, Room(101, "Suite", ["Wi-Fi"], 150.0), "2025-07-01", "2025-07-05")
+    double = Booking(1002, guest1, Room(102, "Double", ["TV"], 100.0), "2025-07-01", "2025-07-05")
+
+    print(registry.redeem("summer25", Payment(5001, suite, 600.0, "Credit Card"), today="2025-07-01"))  # Output: (2500, None)
+    print(registry.redeem("SUMMER25", Payment(5002, suite, 600.0, "Credit Card"), today="2025-07-01"))  # Output: (None, 'usage_limit')
+    print(registry.validate("SUMMER25", Payment(5003, double, 600.0, "Credit Card"), today="2025-07-01"))  # Output: (None, 'room_type')
+    print(registry.validate("WINTER", Payment(5004, double, 600.0, "Credit Card")))  # Output: (None, 'unknown_code')
+
+    print(benchmark_validations())
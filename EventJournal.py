@@ -0,0 +1,331 @@
+# EventJournal class
+import json
+import os
+import struct
+import tempfile
+import threading
+import time
+import zlib
+
+from NotificationSink import NotificationSink
+
+
+class JournalState:
+    """
+    The Booking and Payment state rebuilt from journal events.
+    """
+
+    # Event type -> booking status it leaves behind
+    BOOKING_STATUS_EVENTS = {"booking_confirmed": "Confirmed", "booking_cancelled": "Cancelled"}
+    # Payment events that carry the new status, amount or payment method
+    PAYMENT_STATUS_EVENTS = {"payment_processed", "payment_refunded", "payment_failed", "payment_status_changed"}
+    PAYMENT_AMOUNT_EVENTS = {"vat_applied", "coupon_applied", "amount_changed", "payment_amount_changed"}
+
+    def __init__(self, bookings: dict = None, payments: dict = None):
+        """
+        Initializes a JournalState.
+
+        :param bookings: booking_id -> dict of guest_id, room_number, check_in_date, check_out_date,
+            status, discount and special_requests.
+        :param payments: payment_id -> dict of booking_id, amount, payment_method and status.
+        """
+        self.bookings = bookings if bookings is not None else {}
+        self.payments = payments if payments is not None else {}
+
+    def apply(self, event: dict) -> None:
+        """Applies one event to the state. Events that do not change state are ignored."""
+        event_type = event["type"]
+        if "payment_id" in event:  # Checked first: payment events also carry their booking_id
+            if event_type == "payment_created":
+                self.payments[event["payment_id"]] = {key: event[key] for key in ("booking_id", "amount", "payment_method", "status")}
+                return
+            if event_type == "payment_id_changed":
+                self.payments[event["payment_id"]] = self.payments.pop(event["old_payment_id"], {})
+                return
+            payment = self.payments.setdefault(event["payment_id"], {})
+            if event_type in self.PAYMENT_STATUS_EVENTS:
+                payment["status"] = event["status"]
+            elif event_type in self.PAYMENT_AMOUNT_EVENTS:
+                payment["amount"] = event["amount"]
+            elif event_type == "payment_method_changed":
+                payment["payment_method"] = event["payment_method"]
+            elif event_type == "payment_split":
+                payment["payment_method"] = ", ".join(event["methods"])
+        elif "booking_id" in event:
+            booking_id = event["booking_id"]
+            if event_type == "booking_created":
+                booking = {key: event[key] for key in ("guest_id", "room_number", "check_in_date", "check_out_date", "status")}
+                booking["discount"], booking["special_requests"] = 0.0, []
+                self.bookings[booking_id] = booking
+                return
+            if event_type == "booking_id_changed":
+                old_booking_id = event["old_booking_id"]
+                self.bookings[booking_id] = self.bookings.pop(old_booking_id, {})
+                for payment in self.payments.values():  # IDs rarely change, so a scan is fine
+                    if payment.get("booking_id") == old_booking_id:
+                        payment["booking_id"] = booking_id
+                return
+            booking = self.bookings.setdefault(booking_id, {})
+            if event_type == "status_changed":
+                booking["status"] = event["status"]
+            elif event_type in self.BOOKING_STATUS_EVENTS:
+                booking["status"] = self.BOOKING_STATUS_EVENTS[event_type]
+            elif event_type == "booking_modified":
+                booking["check_in_date"], booking["check_out_date"] = event["new_dates"]
+            elif event_type == "booking_extended":
+                booking["check_out_date"] = event["check_out_date"]
+            elif event_type == "room_assigned":
+                booking["room_number"] = event["room_number"]
+            elif event_type == "guest_changed":
+                booking["guest_id"] = event["guest_id"]
+            elif event_type == "discount_applied":
+                booking["discount"] = event["discount"]
+            elif event_type == "special_request_added":
+                booking.setdefault("special_requests", []).append(event["request"])
+
+    def to_dict(self) -> dict:
+        """Returns the state as plain data for a snapshot."""
+        return {"bookings": list(self.bookings.items()), "payments": list(self.payments.items())}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "JournalState":
+        """Rebuilds a state from snapshot data."""
+        return cls(dict((key, value) for key, value in data["bookings"]), dict((key, value) for key, value in data["payments"]))
+
+
+class EventJournal(NotificationSink):
+    """
+    An append-only binary journal of Booking and Payment events, with periodic snapshots.
+
+    The journal is a NotificationSink, so bookings and payments write to it through
+    set_default_sink or set_notification_sink. Every record is a fixed header (payload length,
+    CRC-32, sequence number) followed by the event as JSON. Records are buffered and written
+    with one fsync per group, so the cost of durability is shared by the whole group; events
+    still in the buffer when the process dies are lost.
+
+    Every snapshot_every events the current state is written as a compressed snapshot and a
+    new journal segment is started; older segments and snapshots are deleted. Recovery loads
+    the newest snapshot and replays only the records after it, stopping at a torn record.
+    """
+
+    active = True
+    HEADER = struct.Struct("<IIQ")  # payload length, CRC-32 of payload, sequence number
+
+    def __init__(self, directory: str, group_size: int = 512, snapshot_every: int = 1_000_000):
+        """
+        Opens a journal directory, recovering any state already in it.
+
+        :param directory: The directory holding journal segments and snapshots.
+        :param group_size: The number of records written per fsync.
+        :param snapshot_every: The number of events between snapshots (None disables them).
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.__directory = directory
+        self.__group_size = group_size
+        self.__snapshot_every = snapshot_every
+        self.__lock = threading.Lock()
+        self.__state, self.__sequence = self.recover(directory)
+        self.__since_snapshot = 0
+        self.__buffer = bytearray()
+        self.__buffered = 0
+        self.__segment = self.__open_segment()
+
+    def __open_segment(self):
+        """Starts a new segment named after the first sequence number it will hold."""
+        path = os.path.join(self.__directory, f"journal-{self.__sequence + 1:012d}.log")
+        return open(path, "ab")
+
+    def get_state(self) -> JournalState:
+        """Returns the live state, including events not yet written to disk."""
+        return self.__state
+
+    def get_sequence(self) -> int:
+        """Returns the sequence number of the last appended event."""
+        return self.__sequence
+
+    def emit(self, event: dict) -> None:
+        """Appends an event (NotificationSink interface)."""
+        self.append(event)
+
+    def append(self, event: dict) -> int:
+        """
+        Appends an event to the journal.
+
+        :param event: A dict with a "type" key, as emitted by Booking and Payment.
+        :return: The sequence number given to the event.
+        """
+        payload = json.dumps(event, separators=(",", ":"), default=str).encode()
+        with self.__lock:
+            self.__sequence += 1
+            self.__buffer += self.HEADER.pack(len(payload), zlib.crc32(payload), self.__sequence)
+            self.__buffer += payload
+            self.__buffered += 1
+            self.__state.apply(event)
+            self.__since_snapshot += 1
+            if self.__buffered >= self.__group_size:
+                self.__commit()
+            if self.__snapshot_every is not None and self.__since_snapshot >= self.__snapshot_every:
+                self.__snapshot()
+            return self.__sequence
+
+    def __commit(self) -> None:
+        """Writes the buffered group and fsyncs it (caller holds the lock)."""
+        if self.__buffered:
+            self.__segment.write(self.__buffer)
+            self.__segment.flush()
+            os.fsync(self.__segment.fileno())
+            self.__buffer.clear()
+            self.__buffered = 0
+
+    def flush(self) -> None:
+        """Writes and fsyncs every buffered event."""
+        with self.__lock:
+            self.__commit()
+
+    def snapshot(self) -> None:
+        """Writes a snapshot of the current state and compacts older segments."""
+        with self.__lock:
+            self.__snapshot()
+
+    def __snapshot(self) -> None:
+        self.__commit()
+        data = json.dumps({"sequence": self.__sequence, "state": self.__state.to_dict()}, separators=(",", ":"), default=str)
+        descriptor, temporary = tempfile.mkstemp(dir=self.__directory, suffix=".tmp")
+        with os.fdopen(descriptor, "wb") as snapshot_file:
+            snapshot_file.write(zlib.compress(data.encode(), 1))
+            snapshot_file.flush()
+            os.fsync(snapshot_file.fileno())
+        os.replace(temporary, os.path.join(self.__directory, f"snapshot-{self.__sequence:012d}.bin"))
+        self.__segment.close()
+        self.__segment = self.__open_segment()
+        self.__since_snapshot = 0
+        current_segment = os.path.basename(self.__segment.name)
+        for name in os.listdir(self.__directory):
+            obsolete_snapshot = name.startswith("snapshot-") and int(name[9:21]) < self.__sequence
+            obsolete_segment = name.startswith("journal-") and name != current_segment
+            if obsolete_snapshot or obsolete_segment:
+                os.remove(os.path.join(self.__directory, name))
+
+    def close(self) -> None:
+        """Writes every buffered event and closes the current segment."""
+        with self.__lock:
+            self.__commit()
+            self.__segment.close()
+
+    @staticmethod
+    def read_segment(path: str, after_sequence: int = 0):
+        """
+        Yields (sequence, event) pairs from a segment file, stopping at the first torn or corrupt record.
+
+        :param path: The segment file to read.
+        :param after_sequence: Records with this sequence number or lower are skipped.
+        """
+        unpack_from, header_size = EventJournal.HEADER.unpack_from, EventJournal.HEADER.size
+        decode = json.JSONDecoder().decode
+        with open(path, "rb") as segment:
+            data = memoryview(segment.read())
+        offset, size = 0, len(data)
+        while offset + header_size <= size:
+            length, checksum, sequence = unpack_from(data, offset)
+            start = offset + header_size
+            offset = start + length
+            if offset > size:
+                return
+            payload = data[start:offset]
+            if zlib.crc32(payload) != checksum:
+                return
+            if sequence > after_sequence:
+                yield sequence, decode(str(payload, "utf-8"))
+
+    @staticmethod
+    def recover(directory: str) -> tuple:
+        """
+        Rebuilds the state stored in a journal directory.
+
+        :param directory: The directory holding journal segments and snapshots.
+        :return: A (JournalState, last_sequence) pair.
+        """
+        if not os.path.isdir(directory):
+            return JournalState(), 0
+        names = sorted(os.listdir(directory))
+        snapshots = [name for name in names if name.startswith("snapshot-")]
+        state, sequence = JournalState(), 0
+        if snapshots:
+            with open(os.path.join(directory, snapshots[-1]), "rb") as snapshot_file:
+                data = json.loads(zlib.decompress(snapshot_file.read()))
+            state, sequence = JournalState.from_dict(data["state"]), data["sequence"]
+        for name in names:
+            if name.startswith("journal-"):
+                for sequence_number, event in EventJournal.read_segment(os.path.join(directory, name), sequence):
+                    state.apply(event)
+                    sequence = sequence_number
+        return state, sequence
+
+    def __str__(self) -> str:
+        """Returns a string representation of the EventJournal object."""
+        return f"EventJournal(Directory: {self.__directory}, Sequence: {self.__sequence})"
+
+
+def benchmark_recovery(events: int = 10_000_000, snapshot_every: int = 1_000_000, directory: str = None) -> dict:
+    """
+    Writes a journal of synthetic booking and payment events and times its recovery.
+
+    :param events: The number of events to append.
+    :param snapshot_every: The number of events between snapshots.
+    :param directory: Where to write the journal (default: a new temporary directory).
+    :return: Append throughput, events replayed and recovery time.
+    """
+    directory = directory or tempfile.mkdtemp(prefix="journal-bench-")
+    journal = EventJournal(directory, snapshot_every=snapshot_every)
+    statuses = ("Pending", "Confirmed", "Cancelled")
+    started = time.perf_counter()
+    for i in range(events):
+        kind = i % 4
+        if kind == 0:
+            journal.append({"type": "booking_created", "booking_id": i % 50_000, "guest_id": i % 9_000, "room_number": 100 + i % 400,
+                            "check_in_date": "2025-07-01", "check_out_date": "2025-07-05", "status": "Pending"})
+        elif kind == 1:
+            journal.append({"type": "status_changed", "booking_id": i % 50_000, "status": statuses[i % 3]})
+        elif kind == 2:
+            journal.append({"type": "payment_processed", "payment_id": i % 50_000, "status": "Completed"})
+        else:
+            journal.append({"type": "vat_applied", "payment_id": i % 50_000, "vat": 5, "amount": 630.0})
+    journal.close()
+    append_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    state, sequence = EventJournal.recover(directory)
+    recovery_seconds = time.perf_counter() - started
+    return {
+        "events": events,
+        "appends_per_second": round(events / append_seconds),
+        "replayed_after_snapshot": events % snapshot_every if snapshot_every else events,
+        "recovered_sequence": sequence,
+        "recovery_seconds": round(recovery_seconds, 3),
+    }
+
+
+# Example Usage
+if __name__ == "__main__":
+    from Booking import Booking
+    from Guest import Guest
+    from Payment import Payment
+    from Room import Room
+
+    journal_directory = tempfile.mkdtemp(prefix="journal-")
+    journal = EventJournal(journal_directory)
+    Booking.set_default_sink(journal)
+    Payment.set_default_sink(journal)
+
+    booking1 = Booking(1001, Guest(301, "Alice Smith", "alice@email.com"), Room(101, "Suite", ["Wi-Fi"], 150.0), "2025-07-01", "2025-07-05")
+    booking1.confirm_booking()
+    payment1 = Payment(5001, booking1, 600.0, "Credit Card")
+    payment1.process_payment()
+    payment1.apply_vat(5)
+    journal.close()
+
+    state, sequence = EventJournal.recover(journal_directory)
+    print(sequence, state.bookings[1001]["status"], state.payments[5001])
+    # Output: 5 Confirmed {'booking_id': 1001, 'amount': 630.0, 'payment_method': 'Credit Card', 'status': 'Completed'}
+
+    print(benchmark_recovery(200_000, 50_000))
@@ -0,0 +1,155 @@
+# GroupAssigner class
+import time
+from bisect import bisect_right, insort
+
+
+class GroupAssigner:
+    """
+    Places a batch of bookings (a conference or tour group) into a set of rooms without conflicts.
+
+    Bookings are taken in check-in order, which is the classic greedy for interval partitioning:
+    it never uses more rooms than the busiest night needs. Each booking goes to the room that
+    became free most recently (best fit), which keeps gaps between stays short, and unused rooms
+    are opened in room-number order so the group stays together. Rooms are kept in a list sorted
+    by the day they become free, so each placement is a binary search plus any calendar checks.
+    """
+
+    @staticmethod
+    def plan(bookings: list, rooms: list) -> tuple:
+        """
+        Computes a conflict-free room for each booking without changing anything.
+
+        Holds that other bookings already have in a room's calendar are respected.
+
+        :param bookings: The Booking objects to place.
+        :param rooms: The Room objects available to the group.
+        :return: An (assignments, unassigned) pair: a dict of booking_id -> Room and a list of
+            bookings that did not fit.
+        """
+        rooms_by_number = {room.get_room_number(): room for room in rooms}
+        # (free_from_day, -room_number): scanning backwards from a check-in day finds the room
+        # freed most recently, and among unused rooms the lowest room number.
+        free = sorted((0, -room_number) for room_number in rooms_by_number)
+        assignments = {}
+        unassigned = []
+        for booking in sorted(bookings, key=lambda b: (b.get_check_in_day(), -b.get_check_out_day())):
+            check_in, check_out = booking.get_check_in_day(), booking.get_check_out_day()
+            index = bisect_right(free, (check_in, 0)) - 1
+            while index >= 0:
+                room = rooms_by_number[-free[index][1]]
+                calendar = room.get_calendar()
+                if calendar is None or calendar.find_conflict(room.get_room_number(), check_in, check_out, booking.get_booking_id()) is None:
+                    break
+                index -= 1
+            if index < 0:
+                unassigned.append(booking)
+                continue
+            entry = free.pop(index)
+            insort(free, (check_out, entry[1]))
+            assignments[booking.get_booking_id()] = room
+        return assignments, unassigned
+
+    @staticmethod
+    def assign(bookings: list, rooms: list) -> tuple:
+        """
+        Places a batch of bookings and moves each one into its planned room.
+
+        Calendar holds the group's own bookings already have are released before planning,
+        so members can be reshuffled freely. Bookings that do not fit get their old hold back
+        before anything moves, and the rest of the group is planned again around those holds
+        until every planned room is free. If a move still fails (another writer took the room
+        in the meantime) the booking tries to get its old hold back; when that slot is gone too,
+        the booking is cancelled rather than left in a room it does not hold.
+
+        :param bookings: The Booking objects to place.
+        :param rooms: The Room objects available to the group.
+        :return: An (assignments, unassigned) pair as returned by plan. Bookings whose move
+            failed are listed as unassigned instead of assigned.
+        """
+        released = {}  # booking_id -> (calendar, (room_number, check_in_day, check_out_day))
+        for booking in bookings:
+            calendar = booking.get_room().get_calendar()
+            hold = None if calendar is None else calendar.get_hold(booking.get_booking_id())
+            if hold is not None:
+                calendar.release(booking.get_booking_id())
+                released[booking.get_booking_id()] = (calendar, hold)
+
+        def restore(booking: "Booking") -> bool:
+            entry = released.get(booking.get_booking_id())
+            if entry is None:
+                return True
+            calendar, (room_number, check_in_day, check_out_day) = entry
+            return calendar.reserve(room_number, check_in_day, check_out_day, booking.get_booking_id())
+
+        remaining = bookings
+        unassigned = []
+        while True:
+            assignments, left_over = GroupAssigner.plan(remaining, rooms)
+            if not left_over:
+                break
+            # Nothing has moved yet, so each left-over slot is still free; holding it again may
+            # take a room the plan had given to another member, so plan the rest again.
+            for booking in left_over:
+                restore(booking)
+            unassigned.extend(left_over)
+            dropped = {id(booking) for booking in left_over}
+            remaining = [booking for booking in remaining if id(booking) not in dropped]
+
+        by_id = {booking.get_booking_id(): booking for booking in remaining}
+        for booking_id, room in list(assignments.items()):
+            booking = by_id[booking_id]
+            if not booking.assign_room(room):
+                del assignments[booking_id]
+                unassigned.append(booking)
+                if not restore(booking):
+                    booking.cancel_booking()
+        return assignments, unassigned
+
+def benchmark_group_assignment(bookings: int = 10_000, rooms: int = 400, batches: int = 3) -> dict:
+    """
+    Measures how many bookings per second GroupAssigner.assign places.
+
+    :param bookings: The number of bookings per batch.
+    :param rooms: The number of rooms available to each batch.
+    :param batches: The number of batches to time.
+    :return: Bookings placed, bookings left over, rooms used and bookings per second.
+    """
+    import random
+
+    from Booking import Booking
+    from Guest import Guest
+    from Room import Room
+    from RoomCalendar import RoomCalendar
+
+    rng = random.Random(11)
+    placed = left_over = used = 0
+    elapsed = 0.0
+    for batch in range(batches):
+        guest = Guest(batch, "Group Leader", "group@example.com")
+        room_objects = [Room(1000 + i, "Double", [], 120.0) for i in range(rooms)]
+        group = []
+        for booking_id in range(bookings):
+            check_in = 739433 + rng.randrange(180)
+            group.append(Booking(booking_id, guest, room_objects[0], check_in, check_in + rng.randint(1, 5)))
+        calendar = RoomCalendar()
+        for room in room_objects:
+            room.set_calendar(calendar)
+
+        started = time.perf_counter()
+        assignments, unassigned = GroupAssigner.assign(group, room_objects)
+        elapsed += time.perf_counter() - started
+        placed += len(assignments)
+        left_over += len(unassigned)
+        used += len({room.get_room_number() for room in assignments.values()})
+    return {
+        "bookings_per_batch": bookings,
+        "placed": placed,
+        "unassigned": left_over,
+        "rooms_used_per_batch": used / batches,
+        "bookings_per_second": round((placed + left_over) / elapsed),
+    }
+
+
+# Example Usage
+if __name__ == "__main__":
+    print(benchmark_group_assignment())
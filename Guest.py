@@ -1,4 +1,7 @@
 # Guest class
+from itertools import islice
+
+
 class Guest:
     """
     Represents a guest with personal details and loyalty program status.
@@ -19,7 +22,10 @@ class Guest:
         self.__contact_info = contact_info
         self.__loyalty_status = loyalty_status
         self.__loyalty_points = 0  # Start with 0 points
-        self.__reservation_history = []  # List of booking IDs
+        self.__loyalty_ledger = None  # LoyaltyLedger keeping this guest's points, if any
+        self.__reservation_history = {}  # Booking IDs in the order they were added (values unused)
+        self.__directory = None  # GuestDirectory indexing this guest, if any
+        self.__watchers = ()  # Objects told when the guest ID changes (e.g., a BookingStore)
 
     # Getter and Setter for guest_id
     def get_guest_id(self) -> int:
@@ -27,8 +33,33 @@ class Guest:
         return self.__guest_id
 
     def set_guest_id(self, guest_id: int) -> None:
-        """Sets a new guest ID."""
+        """
+        Sets a new guest ID.
+
+        The directory and every watcher are told. If one of them rejects the new ID, those
+        already told are moved back and the guest keeps its old ID. Once the new ID is accepted,
+        the guest's loyalty balance is transferred to it in the ledger.
+
+        :raises ValueError: If the directory or a watcher already has another guest with that ID.
+        """
+        old_guest_id = self.__guest_id
+        if guest_id == old_guest_id:
+            return
         self.__guest_id = guest_id
+        notified = []
+        try:
+            self.__notify_directory()
+            for watcher in self.__watchers:
+                watcher.on_guest_id_changed(self, old_guest_id)
+                notified.append(watcher)
+        except ValueError:
+            self.__guest_id = old_guest_id
+            self.__notify_directory()
+            for watcher in reversed(notified):
+                watcher.on_guest_id_changed(self, guest_id)
+            raise
+        if self.__loyalty_ledger is not None:
+            self.__loyalty_ledger.transfer(old_guest_id, guest_id)
 
     # Getter and Setter for name
     def get_name(self) -> str:
@@ -38,6 +69,7 @@ class Guest:
     def set_name(self, name: str) -> None:
         """Updates the guest's name."""
         self.__name = name
+        self.__notify_directory()
 
     # Getter and Setter for contact_info
     def get_contact_info(self) -> str:
@@ -47,6 +79,31 @@ class Guest:
     def set_contact_info(self, contact_info: str) -> None:
         """Updates the guest's contact information."""
         self.__contact_info = contact_info
+        self.__notify_directory()
+
+    # Getter and Setter for directory
+    def get_directory(self) -> "GuestDirectory":
+        """Returns the GuestDirectory indexing this guest, or None."""
+        return self.__directory
+
+    def set_directory(self, directory: "GuestDirectory") -> None:
+        """Links the guest to the GuestDirectory that indexes it (called by GuestDirectory.add_guest)."""
+        self.__directory = directory
+
+    # Watchers of the guest ID
+    def add_watcher(self, watcher) -> None:
+        """Registers an object whose on_guest_id_changed(guest, old_guest_id) is called when the guest ID changes."""
+        if watcher not in self.__watchers:
+            self.__watchers += (watcher,)
+
+    def remove_watcher(self, watcher) -> None:
+        """Stops telling an object about guest ID changes."""
+        self.__watchers = tuple(other for other in self.__watchers if other is not watcher)
+
+    def __notify_directory(self) -> None:
+        """Lets the directory re-file the guest after its ID, name or contact info changed."""
+        if self.__directory is not None:
+            self.__directory.on_guest_changed(self)
 
     # Getter and Setter for loyalty_status
     def get_loyalty_status(self) -> bool:
@@ -58,26 +115,43 @@ class Guest:
         self.__loyalty_status = status
 
     # Getter for reservation history
-    def get_reservation_history(self) -> list:
-        """Returns the guest's reservation history."""
-        return self.__reservation_history
+    def get_reservation_history(self, offset: int = 0, limit: int = None) -> list:
+        """
+        Returns the guest's reservation history in the order the bookings were added.
+
+        :param offset: The number of bookings to skip, for paging.
+        :param limit: The most booking IDs returned (default: all).
+        :return: A list of booking IDs.
+        """
+        stop = None if limit is None else offset + limit
+        return list(islice(self.__reservation_history, offset, stop))
+
+    def has_reservation(self, booking_id: int) -> bool:
+        """Checks whether a booking is in the guest's reservation history."""
+        return booking_id in self.__reservation_history
 
     def create_account(self, name: str, contact_info: str) -> None:
         """Creates a guest account."""
         self.__name = name
         self.__contact_info = contact_info
+        self.__notify_directory()
         print("Account created successfully.")
 
     def update_profile(self, new_name: str, new_contact: str) -> None:
         """Updates guest profile details."""
         self.__name = new_name
         self.__contact_info = new_contact
+        self.__notify_directory()
         print("Profile updated successfully.")
 
     def join_loyalty_program(self) -> None:
         """Enrolls the guest in the loyalty program."""
         if not self.__loyalty_status:
             self.__loyalty_status = True
+            if self.__loyalty_ledger is not None:
+                missing = 50 - self.view_loyalty_points()  # Top the balance up to the bonus, if needed
+                if missing > 0:
+                    self.__loyalty_ledger.earn(self.__guest_id, missing)
             self.__loyalty_points = 50  # Give initial bonus points
             print("Joined loyalty program successfully. Earned 50 points!")
         else:
@@ -90,7 +164,7 @@ class Guest:
     def cancel_booking(self, booking_id: int) -> None:
         """Cancels a booking and removes it from the reservation history."""
         if booking_id in self.__reservation_history:
-            self.__reservation_history.remove(booking_id)
+            del self.__reservation_history[booking_id]
             print(f"Booking {booking_id} has been canceled.")
         else:
             print(f"Booking {booking_id} not found.")
@@ -101,8 +175,25 @@ class Guest:
 
     def view_loyalty_points(self) -> int:
         """Returns the number of loyalty points the guest has."""
+        if self.__loyalty_ledger is not None:
+            return self.__loyalty_ledger.get_balance(self.__guest_id)
         return self.__loyalty_points
 
+    # Getter and Setter for loyalty_ledger
+    def get_loyalty_ledger(self) -> "LoyaltyLedger":
+        """Returns the LoyaltyLedger keeping the guest's points, or None."""
+        return self.__loyalty_ledger
+
+    def set_loyalty_ledger(self, ledger: "LoyaltyLedger") -> None:
+        """
+        Moves the guest's points into a LoyaltyLedger; from then on every change is a ledger entry.
+
+        Points the guest already has become an opening entry in the ledger.
+        """
+        if ledger is not None and self.__loyalty_points:
+            ledger.earn(self.__guest_id, self.__loyalty_points)
+        self.__loyalty_ledger = ledger
+
     def earn_loyalty_points(self, amount_spent: float) -> None:
         """
         Adds loyalty points based on the amount spent on bookings.
@@ -110,21 +201,39 @@ class Guest:
         - Earn 1 point per $10 spent.
         """
         points_earned = int(amount_spent / 10)
-        self.__loyalty_points += points_earned
+        if self.__loyalty_ledger is not None:
+            if points_earned > 0:
+                self.__loyalty_points = self.__loyalty_ledger.earn(self.__guest_id, points_earned)
+            else:
+                self.__loyalty_points = self.__loyalty_ledger.get_balance(self.__guest_id)
+        else:
+            self.__loyalty_points += points_earned
         print(f"You earned {points_earned} loyalty points! Total: {self.__loyalty_points} points.")
 
     def redeem_loyalty_points(self, points: int) -> bool:
-        """Redeems loyalty points if the guest has enough."""
-        if points > self.__loyalty_points:
+        """
+        Redeems loyalty points if the guest has enough (redeeming 0 points changes nothing).
+
+        :raises ValueError: If points is negative.
+        """
+        if points < 0:
+            raise ValueError(f"Points redeemed cannot be negative, got {points}.")
+        if self.__loyalty_ledger is not None:
+            if points and not self.__loyalty_ledger.redeem(self.__guest_id, points):
+                print("Not enough loyalty points.")
+                return False
+            self.__loyalty_points = self.__loyalty_ledger.get_balance(self.__guest_id)
+        elif points > self.__loyalty_points:
             print("Not enough loyalty points.")
             return False
-        self.__loyalty_points -= points
+        else:
+            self.__loyalty_points -= points
         print(f"{points} loyalty points redeemed successfully. Remaining: {self.__loyalty_points} points.")
         return True
 
     def add_reservation(self, booking_id: int) -> None:
-        """Adds a booking ID to the guest's reservation history."""
-        self.__reservation_history.append(booking_id)
+        """Adds a booking ID to the guest's reservation history (a booking already in it keeps its place)."""
+        self.__reservation_history.setdefault(booking_id)
 
     def view_invoice(self, booking_id: int) -> str:
         """Displays invoice details for a given booking."""
@@ -139,21 +248,22 @@ class Guest:
 
 
 # Example Usage
-guest1 = Guest(301, "Alice Smith", "alice@email.com")
+if __name__ == "__main__":
+    guest1 = Guest(301, "Alice Smith", "alice@email.com")
 
-# Testing Getter Methods
-print(guest1.get_name())  # Output: Alice Smith
-print(guest1.get_guest_id())  # Output: 301
-print(guest1.get_loyalty_status())  # Output: False
-print(guest1.get_reservation_history())  # Output: []
+    # Testing Getter Methods
+    print(guest1.get_name())  # Output: Alice Smith
+    print(guest1.get_guest_id())  # Output: 301
+    print(guest1.get_loyalty_status())  # Output: False
+    print(guest1.get_reservation_history())  # Output: []
 
-# Testing Setter Methods
-guest1.set_name("Alice Johnson")
-guest1.set_contact_info("newalice@email.com")
-guest1.join_loyalty_program()
+    # Testing Setter Methods
+    guest1.set_name("Alice Johnson")
+    guest1.set_contact_info("newalice@email.com")
+    guest1.join_loyalty_program()
 
-# Adding a reservation
-guest1.add_reservation(5001)
+    # Adding a reservation
+    guest1.add_reservation(5001)
 
-# Printing Updated Guest Info
-print(guest1)  # Output: Guest(ID: 301, Name: Alice Johnson, Contact: newalice@email.com, Loyalty: Enrolled)
+    # Printing Updated Guest Info
+    print(guest1)  # Output: Guest(ID: 301, Name: Alice Johnson, Contact: newalice@email.com, Loyalty: Enrolled)
@@ -0,0 +1,227 @@
+# GuestDeduplicator class
+import hashlib
+import os
+import random
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from GuestDirectory import GuestDirectory
+
+
+def shingles(name: str, contact_info: str, size: int = 3) -> frozenset:
+    """
+    Returns the character shingles of a guest's name and contact info.
+
+    Both fields are normalized as GuestDirectory does, and shingles are tagged with their field
+    so a name never matches a contact string. An e-mail domain is one shingle, not many, so
+    guests do not look alike just because they share a mail provider.
+
+    :param name: The guest's name.
+    :param contact_info: The guest's contact details.
+    :param size: The shingle length in characters.
+    """
+    contact = GuestDirectory.normalize_contact(contact_info)
+    local, _, domain = contact.rpartition("@")
+    fields = (("n", f" {GuestDirectory.normalize_name(name)} "), ("c", f" {local or contact} "))  # Spaces mark word edges
+    result = {tag + text[start:start + size] for tag, text in fields for start in range(max(1, len(text) - size + 1))}
+    if local:
+        result.add("d" + domain)
+    return frozenset(result)
+
+
+def _shingle_hashes(shingle: str, salts: tuple, cache: dict) -> tuple:
+    """
+    Returns one 32-bit hash of a shingle per signature position.
+
+    Each salt gives a different BLAKE2b digest of 16 values, so the hashes are independent and
+    the same in every process (unlike hash()). Shingles repeat across guests, so they are cached.
+    """
+    values = cache.get(shingle)
+    if values is None:
+        data = shingle.encode()
+        digest = b"".join([hashlib.blake2b(data, digest_size=64, salt=salt).digest() for salt in salts])
+        values = cache[shingle] = struct.unpack(f"<{len(digest) // 4}I", digest)
+    return values
+
+
+def _signature_chunk(rows: list, salts: tuple, length: int, size: int) -> list:
+    """Computes (guest_id, MinHash signature) for a chunk of (guest_id, name, contact_info) rows."""
+    cache = {}
+    signatures = []
+    for guest_id, name, contact_info in rows:
+        columns = zip(*(_shingle_hashes(shingle, salts, cache) for shingle in shingles(name, contact_info, size)))
+        signatures.append((guest_id, tuple(map(min, columns))[:length]))
+    return signatures
+
+
+def _verify_chunk(pairs: list, profiles: dict, size: int, threshold: float) -> list:
+    """Returns the pairs whose exact shingle Jaccard similarity reaches the threshold."""
+    matches = []
+    for first, second in pairs:
+        first_shingles = shingles(*profiles[first], size)
+        second_shingles = shingles(*profiles[second], size)
+        similarity = len(first_shingles & second_shingles) / len(first_shingles | second_shingles)
+        if similarity >= threshold:
+            matches.append((first, second, round(similarity, 3)))
+    return matches
+
+
+class GuestDeduplicator:
+    """
+    Finds guest profiles that are probably the same person, without comparing every pair.
+
+    Each guest's name and contact info are cut into character shingles and summarized by a
+    MinHash signature. Signatures are split into bands, and guests that share any band land in
+    the same bucket and become candidates; the chance of that rises steeply with similarity.
+    Only candidate pairs are checked against the exact Jaccard similarity of their shingles,
+    so the job runs in near-linear time. Signatures and checks are spread over a process pool.
+    """
+
+    def __init__(self, threshold: float = 0.6, bands: int = 20, rows: int = 4, shingle_size: int = 3,
+                 processes: int = None, max_bucket: int = 200, seed: int = 1):
+        """
+        Initializes a GuestDeduplicator.
+
+        :param threshold: The Jaccard similarity at which two guests are reported as duplicates.
+        :param bands: The number of LSH bands.
+        :param rows: The signature values per band; signatures have bands * rows values.
+        :param shingle_size: The shingle length in characters.
+        :param processes: Worker processes (default: one per CPU; 1 runs in this process).
+        :param max_bucket: Buckets larger than this are skipped; they hold common shingles, not duplicates.
+        :param seed: Seed for the MinHash hash functions, so results are repeatable.
+        """
+        rng = random.Random(seed)
+        self.__salts = tuple(rng.randbytes(16) for _ in range(-(-bands * rows // 16)))
+        self.__threshold = threshold
+        self.__bands = bands
+        self.__rows = rows
+        self.__shingle_size = shingle_size
+        self.__processes = processes or os.cpu_count() or 1
+        self.__max_bucket = max_bucket
+
+    def __map(self, function, chunks: list, *args) -> list:
+        """Runs function over chunks in the process pool (or inline for one process) and joins the results."""
+        if self.__processes == 1 or len(chunks) == 1:
+            return [item for chunk in chunks for item in function(chunk, *args)]
+        with ProcessPoolExecutor(self.__processes) as pool:
+            futures = [pool.submit(function, chunk, *args) for chunk in chunks]
+            return [item for future in futures for item in future.result()]
+
+    def __chunks(self, items: list) -> list:
+        size = max(1, -(-len(items) // (self.__processes * 4)))
+        return [items[start:start + size] for start in range(0, len(items), size)]
+
+    def candidate_pairs(self, signatures: list) -> set:
+        """
+        Buckets signatures band by band and returns the guest ID pairs that share a bucket.
+
+        :param signatures: (guest_id, signature) pairs.
+        :return: A set of (smaller_id, larger_id) pairs.
+        """
+        pairs = set()
+        rows = self.__rows
+        for band in range(self.__bands):
+            buckets = {}
+            start = band * rows
+            for guest_id, signature in signatures:
+                buckets.setdefault(signature[start:start + rows], []).append(guest_id)
+            for members in buckets.values():
+                if 1 < len(members) <= self.__max_bucket:
+                    members.sort()
+                    for i, first in enumerate(members):
+                        for second in members[i + 1:]:
+                            pairs.add((first, second))
+        return pairs
+
+    def find_duplicates(self, guests) -> list:
+        """
+        Finds likely duplicate guests.
+
+        :param guests: An iterable of Guest objects (e.g., a GuestDirectory's guests).
+        :return: A list of (guest_id, other_guest_id, similarity) merge candidates, most similar first.
+        """
+        profiles = {guest.get_guest_id(): (guest.get_name(), guest.get_contact_info()) for guest in guests}
+        rows = [(guest_id, name, contact_info) for guest_id, (name, contact_info) in profiles.items()]
+        signatures = self.__map(_signature_chunk, self.__chunks(rows), self.__salts, self.__bands * self.__rows, self.__shingle_size)
+        pairs = sorted(self.candidate_pairs(signatures))
+        chunks = self.__chunks(pairs)
+        # Each verification chunk only needs the profiles it compares
+        work = [(chunk, {guest_id: profiles[guest_id] for pair in chunk for guest_id in pair}) for chunk in chunks]
+        matches = []
+        if self.__processes == 1 or len(work) <= 1:
+            for chunk, chunk_profiles in work:
+                matches.extend(_verify_chunk(chunk, chunk_profiles, self.__shingle_size, self.__threshold))
+        else:
+            with ProcessPoolExecutor(self.__processes) as pool:
+                futures = [pool.submit(_verify_chunk, chunk, chunk_profiles, self.__shingle_size, self.__threshold)
+                           for chunk, chunk_profiles in work]
+                for future in futures:
+                    matches.extend(future.result())
+        matches.sort(key=lambda match: (-match[2], match[0], match[1]))
+        return matches
+
+    def __str__(self) -> str:
+        """Returns a string representation of the GuestDeduplicator object."""
+        return f"GuestDeduplicator(Threshold: {self.__threshold}, Bands: {self.__bands}x{self.__rows}, Processes: {self.__processes})"
+
+
+def benchmark_deduplication(guests: int = 100_000, duplicate_share: float = 0.1, processes: int = None, seed: int = 5) -> dict:
+    """
+    Generates guests with misspelled duplicates and measures how many duplicates are found and how fast.
+
+    :param guests: The number of original guests.
+    :param duplicate_share: The share of guests that get a second, slightly different profile.
+    :param processes: Worker processes for the deduplicator.
+    :param seed: Seed for the generated guests.
+    :return: Profiles, candidates reported, recall of the planted duplicates and seconds taken.
+    """
+    from Guest import Guest
+
+    rng = random.Random(seed)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+
+    def word(length: int) -> str:
+        return "".join(rng.choice(letters) for _ in range(length)).capitalize()
+
+    def misspell(text: str) -> str:
+        position = rng.randrange(1, len(text))
+        return text[:position] + rng.choice(letters) + text[position + 1:]
+
+    profiles = []
+    planted = set()
+    for guest_id in range(guests):
+        first, last = word(rng.randint(4, 8)), word(rng.randint(5, 10))
+        email = f"{first}.{last}{rng.randrange(100)}@example.com".lower()
+        profiles.append(Guest(guest_id, f"{first} {last}", email))
+        if rng.random() < duplicate_share:
+            duplicate_id = guests + len(planted)
+            profiles.append(Guest(duplicate_id, f"{misspell(first)} {last}", email.upper()))
+            planted.add((guest_id, duplicate_id))
+
+    started = time.perf_counter()
+    matches = GuestDeduplicator(processes=processes).find_duplicates(profiles)
+    elapsed = time.perf_counter() - started
+    found = {(first, second) for first, second, _ in matches}
+    return {
+        "profiles": len(profiles),
+        "reported": len(matches),
+        "recall": round(len(found & planted) / len(planted), 3),
+        "seconds": round(elapsed, 2),
+    }
+
+
+# Example Usage
+if __name__ == "__main__":
+    from Guest import Guest
+
+    guests = [
+        Guest(301, "Alice Smith", "alice@email.com"),
+        Guest(302, "Alice  Smyth", "ALICE@email.com"),
+        Guest(303, "Bob Brown", "+971 50 123 4567"),
+        Guest(304, "Bob Browne", "+971501234567"),
+        Guest(305, "Carla Diaz", "carla@email.com"),
+    ]
+    print(GuestDeduplicator(processes=1).find_duplicates(guests))  # Output: [(303, 304, 0.875), (301, 302, 0.7)]
+
+    print(benchmark_deduplication(20_000))
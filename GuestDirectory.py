@@ -0,0 +1,226 @@
+# GuestDirectory class
+import re
+import threading
+import time
+from bisect import bisect_left, insort
+
+
+class GuestDirectory:
+    """
+    Finds guests by ID, by contact details, or by the first letters of their name.
+
+    Guests are kept in a dict by guest ID and in hash buckets by normalized contact info.
+    For type-ahead search, names are kept as a sorted list of "name\\0guest_id" keys: all names
+    starting with a prefix sit next to each other, so a search is one binary search plus a scan
+    of the k results. Guests tell the directory when their ID, name or contact info change.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty GuestDirectory.
+        """
+        self.__guests = {}  # guest_id -> Guest
+        self.__by_contact = {}  # normalized contact info -> {guest_id: Guest}
+        self.__names = []  # Sorted "normalized name\0guest_id" keys
+        self.__keys = {}  # id(guest) -> (guest_id, contact key, name key) the guest is filed under
+        self.__lock = threading.RLock()
+
+    @staticmethod
+    def normalize_name(name: str) -> str:
+        """Returns a name in the form it is searched by: trimmed, single-spaced and case-folded."""
+        return " ".join(name.split()).casefold()
+
+    @staticmethod
+    def normalize_contact(contact_info: str) -> str:
+        """
+        Returns contact info in the form it is matched by.
+
+        E-mail addresses are trimmed and case-folded; anything else is treated as a phone number
+        and reduced to its digits, keeping a leading "+".
+        """
+        contact_info = contact_info.strip().casefold()
+        if "@" in contact_info:
+            return contact_info
+        digits = re.sub(r"\D", "", contact_info)
+        return "+" + digits if contact_info.startswith("+") else digits
+
+    def __index_key(self, guest: "Guest") -> tuple:
+        guest_id = guest.get_guest_id()
+        return guest_id, self.normalize_contact(guest.get_contact_info()), f"{self.normalize_name(guest.get_name())}\0{guest_id}"
+
+    def __file(self, guest: "Guest", key: tuple) -> None:
+        guest_id, contact_key, name_key = key
+        self.__guests[guest_id] = guest
+        self.__by_contact.setdefault(contact_key, {})[guest_id] = guest
+        insort(self.__names, name_key)
+        self.__keys[id(guest)] = key
+
+    def __unfile(self, guest: "Guest") -> None:
+        guest_id, contact_key, name_key = self.__keys.pop(id(guest))
+        del self.__guests[guest_id]
+        bucket = self.__by_contact[contact_key]
+        del bucket[guest_id]
+        if not bucket:
+            del self.__by_contact[contact_key]
+        index = bisect_left(self.__names, name_key)
+        del self.__names[index]
+
+    def add_guest(self, guest: "Guest") -> bool:
+        """
+        Adds a guest to the directory.
+
+        :param guest: The Guest object to add.
+        :return: True if the guest was added, False if its guest ID is already taken.
+        """
+        with self.__lock:
+            if guest.get_guest_id() in self.__guests:
+                return False
+            self.__file(guest, self.__index_key(guest))
+            guest.set_directory(self)
+            return True
+
+    def add_guests(self, guests) -> int:
+        """
+        Adds many guests at once, sorting the name index once instead of inserting one by one.
+
+        :param guests: An iterable of Guest objects. Guests whose ID is already taken are skipped.
+        :return: The number of guests added.
+        """
+        with self.__lock:
+            added = []
+            for guest in guests:
+                guest_id, contact_key, name_key = key = self.__index_key(guest)
+                if guest_id in self.__guests:
+                    continue
+                self.__guests[guest_id] = guest
+                self.__by_contact.setdefault(contact_key, {})[guest_id] = guest
+                self.__keys[id(guest)] = key
+                added.append(name_key)
+                guest.set_directory(self)
+            self.__names.extend(added)
+            self.__names.sort()
+            return len(added)
+
+    def remove_guest(self, guest_id: int) -> "Guest":
+        """
+        Removes a guest from the directory.
+
+        :param guest_id: The ID of the guest to remove.
+        :return: The removed Guest object, or None if it was not in the directory.
+        """
+        with self.__lock:
+            guest = self.__guests.get(guest_id)
+            if guest is not None:
+                self.__unfile(guest)
+                guest.set_directory(None)
+            return guest
+
+    def on_guest_changed(self, guest: "Guest") -> None:
+        """
+        Re-files a guest after its ID, name or contact info changed (called by Guest).
+
+        :raises ValueError: If another guest in the directory already has the new ID; nothing changes.
+        """
+        with self.__lock:
+            old_key = self.__keys.get(id(guest))
+            new_key = self.__index_key(guest)
+            if old_key is None or old_key == new_key:
+                return
+            other = self.__guests.get(new_key[0])
+            if other is not None and other is not guest:
+                raise ValueError(f"Guest ID {new_key[0]} is already taken in the directory.")
+            self.__unfile(guest)
+            self.__file(guest, new_key)
+
+    def get_guest(self, guest_id: int) -> "Guest":
+        """Returns the guest with the given ID, or None."""
+        return self.__guests.get(guest_id)
+
+    def find_by_contact(self, contact_info: str) -> list:
+        """Returns every guest whose contact info matches, ignoring case, spacing and phone punctuation."""
+        with self.__lock:
+            return list(self.__by_contact.get(self.normalize_contact(contact_info), {}).values())
+
+    def search_by_name(self, prefix: str, limit: int = 10) -> list:
+        """
+        Returns guests whose name starts with a prefix, in alphabetical order.
+
+        :param prefix: The letters typed so far; case and extra spaces are ignored.
+        :param limit: The most guests returned.
+        :return: A list of Guest objects.
+        """
+        prefix = self.normalize_name(prefix)
+        results = []
+        with self.__lock:
+            names = self.__names
+            index = bisect_left(names, prefix)
+            while index < len(names) and len(results) < limit and names[index].startswith(prefix):
+                results.append(self.__guests[int(names[index].rpartition("\0")[2])])
+                index += 1
+        return results
+
+    def __len__(self) -> int:
+        """Returns the number of guests in the directory."""
+        return len(self.__guests)
+
+    def __str__(self) -> str:
+        """Returns a string representation of the GuestDirectory object."""
+        return f"GuestDirectory(Guests: {len(self.__guests)})"
+
+
+def benchmark_type_ahead(guests: int = 5_000_000, searches: int = 10_000, seed: int = 3) -> dict:
+    """
+    Fills a directory with generated guests and times type-ahead searches.
+
+    Every search types a name one letter at a time (2 to 6 letters), like a front-desk search box.
+
+    :param guests: The number of guests in the directory.
+    :param searches: The number of keystroke searches to time.
+    :param seed: Seed for the generated names.
+    :return: Load time and the median and 99th percentile search latency in microseconds.
+    """
+    import random
+
+    from Guest import Guest
+
+    rng = random.Random(seed)
+    first = ["Alice", "Bob", "Carla", "Dmitri", "Elena", "Farah", "Goran", "Hana", "Ivan", "Jia", "Khalid", "Lena", "Mona", "Noah"]
+    last = ["Smith", "Johnson", "Alnaqbi", "Garcia", "Kim", "Nguyen", "Okafor", "Rossi", "Silva", "Tanaka", "Weber", "Young"]
+    directory = GuestDirectory()
+    started = time.perf_counter()
+    directory.add_guests(
+        Guest(i, f"{rng.choice(first)} {rng.choice(last)}{rng.randrange(1000)}", f"guest{i}@example.com") for i in range(guests))
+    load_seconds = time.perf_counter() - started
+
+    latencies = []
+    for _ in range(searches // 5):
+        name = f"{rng.choice(first)} {rng.choice(last)}"
+        for length in range(2, 7):
+            started = time.perf_counter()
+            directory.search_by_name(name[:length])
+            latencies.append(time.perf_counter() - started)
+    latencies.sort()
+    return {
+        "guests": len(directory),
+        "load_seconds": round(load_seconds, 1),
+        "p50_us": round(latencies[len(latencies) // 2] * 1e6, 1),
+        "p99_us": round(latencies[int(len(latencies) * 0.99)] * 1e6, 1),
+    }
+
+
+# Example Usage
+if __name__ == "__main__":
+    from Guest import Guest
+
+    directory = GuestDirectory()
+    directory.add_guest(Guest(301, "Alice Smith", "alice@email.com"))
+    directory.add_guest(Guest(302, "Alina Stone", "+971 (50) 123-4567"))
+    directory.add_guest(Guest(303, "Bob Brown", "bob@email.com"))
+
+    print([guest.get_name() for guest in directory.search_by_name("ali")])  # Output: ['Alice Smith', 'Alina Stone']
+    print(directory.find_by_contact("+971501234567")[0].get_name())  # Output: Alina Stone
+
+    directory.get_guest(301).set_contact_info("Alice@Example.com")
+    print(directory.find_by_contact("alice@example.com")[0].get_guest_id())  # Output: 301
+
+    print(benchmark_type_ahead(200_000))
@@ -0,0 +1,174 @@
+# IdentityMap class
+import threading
+import tracemalloc
+from weakref import WeakValueDictionary
+
+from Guest import Guest
+from Room import Room
+
+
+class IdentityMap:
+    """
+    Keeps one in-memory object per guest ID and per room number.
+
+    Loaders ask the map for an entity instead of constructing it. If an object with that ID is
+    already alive it is returned, so every Booking, Payment and Feedback built from the map
+    shares it; otherwise a new one is built and remembered. Entities are held through weak
+    references, so once nothing else uses an object it is freed and drops out of the map.
+    The map watches the objects it holds, so a changed guest ID or room number re-keys them.
+    """
+
+    # Entity class -> method returning its identity
+    KEY_GETTERS = {Guest: Guest.get_guest_id, Room: Room.get_room_number}
+
+    def __init__(self):
+        """
+        Initializes an empty IdentityMap.
+        """
+        self.__entities = {cls: WeakValueDictionary() for cls in self.KEY_GETTERS}
+        self.__lock = threading.Lock()
+
+    def __base_class(self, cls: type) -> type:
+        """Returns the class in KEY_GETTERS that cls is or inherits from."""
+        for base in cls.__mro__:
+            if base in self.KEY_GETTERS:
+                return base
+        raise TypeError(f"IdentityMap does not hold {cls.__name__} objects.")
+
+    def add(self, entity) -> object:
+        """
+        Registers an existing Guest or Room object (or an object of a subclass).
+
+        :param entity: The object to register.
+        :return: The canonical object for its ID: the one already registered, or entity itself.
+        """
+        cls = self.__base_class(type(entity))
+        key = self.KEY_GETTERS[cls](entity)
+        with self.__lock:
+            canonical = self.__entities[cls].setdefault(key, entity)
+        if canonical is entity:
+            entity.add_watcher(self)
+        return canonical
+
+    def get(self, cls: type, key) -> object:
+        """Returns the live object of a class with the given ID, or None."""
+        return self.__entities[self.__base_class(cls)].get(key)
+
+    def __rekey(self, entity, old_key) -> None:
+        """
+        Moves an entity to its new key after its ID changed.
+
+        :raises ValueError: If another live object already has the new key; nothing changes.
+        """
+        cls = self.__base_class(type(entity))
+        entities = self.__entities[cls]
+        new_key = self.KEY_GETTERS[cls](entity)
+        with self.__lock:
+            other = entities.get(new_key)
+            if other is not None and other is not entity:
+                raise ValueError(f"{cls.__name__} {new_key} is already loaded in the identity map.")
+            if entities.get(old_key) is entity:
+                del entities[old_key]
+            entities[new_key] = entity
+
+    def on_guest_id_changed(self, guest: Guest, old_guest_id: int) -> None:
+        """Re-keys a guest whose ID changed (called by Guest)."""
+        self.__rekey(guest, old_guest_id)
+
+    def on_room_number_changed(self, room: Room, old_room_number: int) -> None:
+        """Re-keys a room whose number changed (called by Room)."""
+        self.__rekey(room, old_room_number)
+
+    def load(self, cls: type, key, *args, **kwargs) -> object:
+        """
+        Returns the live object with the given ID, constructing and registering it if there is none.
+
+        The remaining arguments are only used when a new object is constructed; an existing
+        object is returned unchanged.
+
+        :param cls: Guest or Room, or a subclass of either.
+        :param key: The guest ID or room number, passed as the first constructor argument.
+        """
+        entities = self.__entities[self.__base_class(cls)]
+        entity = entities.get(key)
+        if entity is None:
+            with self.__lock:
+                entity = entities.get(key)
+                if entity is None:
+                    entity = cls(key, *args, **kwargs)
+                    entities[key] = entity
+                    entity.add_watcher(self)
+        return entity
+
+    def get_guest(self, guest_id: int, name: str, contact_info: str, loyalty_status: bool = False) -> Guest:
+        """Returns the canonical Guest for a guest ID, constructing it from the other arguments if needed."""
+        return self.load(Guest, guest_id, name, contact_info, loyalty_status)
+
+    def get_room(self, room_number: int, room_type: str, amenities: list, price_per_night: float, availability_status: bool = True) -> Room:
+        """Returns the canonical Room for a room number, constructing it from the other arguments if needed."""
+        return self.load(Room, room_number, room_type, amenities, price_per_night, availability_status)
+
+    def __len__(self) -> int:
+        """Returns the number of live entities in the map."""
+        return sum(len(entities) for entities in self.__entities.values())
+
+    def __str__(self) -> str:
+        """Returns a string representation of the IdentityMap object."""
+        return f"IdentityMap(Guests: {len(self.__entities[Guest])}, Rooms: {len(self.__entities[Room])})"
+
+
+def benchmark_memory(bookings: int = 200_000, guests: int = 20_000, rooms: int = 500) -> dict:
+    """
+    Loads the same booking rows with and without an IdentityMap and compares the memory held.
+
+    Every row carries its guest's and room's details, as an export or OTA feed would, so a
+    plain loader builds a Guest and a Room per booking.
+
+    :param bookings: The number of booking rows.
+    :param guests: The number of distinct guests in the rows.
+    :param rooms: The number of distinct rooms in the rows.
+    :return: Bytes held by each load, the ratio, and the objects per load.
+    """
+    from Booking import Booking
+
+    room_types = ("Single", "Double", "Deluxe", "Suite")
+    amenity_sets = (["Wi-Fi", "TV"], ["Wi-Fi", "TV", "Mini-Bar"], ["Wi-Fi", "TV", "Jacuzzi"], ["Wi-Fi"])
+    rows = [(i, i % guests, f"Guest {i % guests}", f"guest{i % guests}@example.com", 100 + i % rooms, 739433 + i % 300)
+            for i in range(bookings)]
+
+    def plain_load():
+        return [Booking(booking_id, Guest(guest_id, name, email), Room(room_number, room_types[room_number % 4], amenity_sets[room_number % 4], 120.0),
+                        check_in, check_in + 2) for booking_id, guest_id, name, email, room_number, check_in in rows]
+
+    def mapped_load():
+        session = IdentityMap()
+        return [Booking(booking_id, session.get_guest(guest_id, name, email),
+                        session.get_room(room_number, room_types[room_number % 4], amenity_sets[room_number % 4], 120.0),
+                        check_in, check_in + 2) for booking_id, guest_id, name, email, room_number, check_in in rows]
+
+    results = {"bookings": bookings}
+    for label, loader in (("plain", plain_load), ("identity_map", mapped_load)):
+        tracemalloc.start()
+        loaded = loader()
+        results[f"{label}_bytes"] = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        results[f"{label}_guest_objects"] = len({id(booking.get_guest()) for booking in loaded})
+        del loaded
+    results["ratio"] = round(results["plain_bytes"] / results["identity_map_bytes"], 2)
+    return results
+
+
+# Example Usage
+if __name__ == "__main__":
+    session = IdentityMap()
+    guest1 = session.get_guest(301, "Alice Smith", "alice@email.com")
+    guest2 = session.get_guest(301, "Alice Smith", "alice@email.com")
+    print(guest1 is guest2)  # Output: True
+
+    suite = session.get_room(101, "Suite", ["Wi-Fi", "TV"], 150.0)
+    print(session.add(Room(101, "Suite", ["Wi-Fi", "TV"], 150.0)) is suite)  # Output: True
+
+    del guest1, guest2
+    print(session.get(Guest, 301))  # Output: None (released once unused)
+
+    print(benchmark_memory())
@@ -0,0 +1,264 @@
+# LoyaltyLedger class
+import threading
+import time
+from array import array
+from bisect import bisect_right
+from itertools import compress, repeat
+from operator import floordiv
+
+
+class LoyaltyLedger:
+    """
+    An append-only record of every loyalty point earned or redeemed.
+
+    Entries are stored column by column in typed arrays (time, guest ID, payment ID, points),
+    so the ledger grows by a few dozen bytes per entry and is never rewritten. Each guest also
+    has a running balance and a history of (time, balance) pairs for point-in-time queries.
+    A whole batch of payments is accrued from columns (payment IDs, guest IDs, cents) with
+    C-level map, compress and array extends under one lock, and redeeming checks and debits the
+    balance under the same lock, so it is atomic.
+    """
+
+    POINTS_PER_DOLLAR = 0.1  # 1 point per $10 spent, as in Guest.earn_loyalty_points
+    CENTS_PER_POINT = round(100 / POINTS_PER_DOLLAR)
+    NO_PAYMENT = -1  # Payment ID column value for entries not tied to a payment
+
+    def __init__(self):
+        """
+        Initializes an empty LoyaltyLedger.
+        """
+        self.__times = array("d")
+        self.__guest_ids = array("q")
+        self.__payment_ids = array("q")
+        self.__points = array("q")  # Positive for accruals, negative for redemptions
+        self.__balances = {}  # guest_id -> current balance
+        self.__history = {}  # guest_id -> flat list [time, balance, time, balance, ...] of balance changes
+        self.__accrued = set()  # Payment IDs already accrued, so a payment never earns twice
+        self.__lock = threading.Lock()
+
+    @classmethod
+    def points_for(cls, amount: float) -> int:
+        """Returns the points earned by spending an amount."""
+        return int(amount * cls.POINTS_PER_DOLLAR)
+
+    def __append(self, at: float, guest_ids, payment_ids, points) -> None:
+        """Appends entries and updates the balances they touch (caller holds the lock)."""
+        self.__times.extend(array("d", (at,)) * len(guest_ids))
+        self.__guest_ids.extend(guest_ids)
+        self.__payment_ids.extend(payment_ids)
+        self.__points.extend(points)
+        totals = dict.fromkeys(guest_ids, 0)
+        for guest_id, change in zip(guest_ids, points):
+            totals[guest_id] += change
+        balances, history = self.__balances, self.__history
+        for guest_id, change in totals.items():
+            balance = balances[guest_id] = balances.get(guest_id, 0) + change
+            changes = history.get(guest_id)
+            if changes is None:
+                history[guest_id] = [at, balance]  # One small list per guest is much cheaper than two arrays
+            elif changes[-2] == at:
+                changes[-1] = balance
+            else:
+                changes += (at, balance)
+
+    def __now(self, at: float) -> float:
+        """Returns the entry time, never earlier than the last entry so histories stay sorted."""
+        at = time.time() if at is None else at
+        return max(at, self.__times[-1]) if self.__times else at
+
+    def accrue_columns(self, payment_ids, guest_ids, amount_cents, at: float = None) -> int:
+        """
+        Accrues points for a batch of completed payments given as columns.
+
+        Points are whole cents divided by CENTS_PER_POINT, and filtering and de-duplicating run
+        through map, compress and set, so no Python code runs per payment except to sum each
+        guest's change. Payments that earn nothing, that were already accrued, or that appear
+        earlier in the same batch are skipped.
+
+        :param payment_ids: The ID of each payment (e.g., an array("q")).
+        :param guest_ids: The ID of the guest who made each payment.
+        :param amount_cents: The amount of each payment in cents.
+        :param at: The time of the entries in seconds since the epoch (default: now).
+        :return: The total points accrued.
+        """
+        points = array("q", map(floordiv, amount_cents, repeat(self.CENTS_PER_POINT)))
+        earning = list(map((0).__lt__, points))
+        if all(earning):
+            payment_ids, guest_ids = array("q", payment_ids), array("q", guest_ids)
+        else:
+            payment_ids = array("q", compress(payment_ids, earning))
+            guest_ids = array("q", compress(guest_ids, earning))
+            points = array("q", compress(points, earning))
+        if len(set(payment_ids)) != len(payment_ids):
+            # Walking backwards, the last index written for each ID is its first occurrence
+            first = dict(zip(reversed(payment_ids), range(len(payment_ids) - 1, -1, -1)))
+            keep = sorted(first.values())
+            payment_ids, guest_ids, points = ([column[i] for i in keep] for column in (payment_ids, guest_ids, points))
+        with self.__lock:
+            accrued = self.__accrued
+            if not accrued.isdisjoint(payment_ids):
+                keep = [i for i, payment_id in enumerate(payment_ids) if payment_id not in accrued]
+                payment_ids, guest_ids, points = ([column[i] for i in keep] for column in (payment_ids, guest_ids, points))
+            if not payment_ids:
+                return 0
+            accrued.update(payment_ids)
+            self.__append(self.__now(at), guest_ids, payment_ids, points)
+            return sum(points)
+
+    def accrue_payments(self, payments, at: float = None) -> int:
+        """
+        Accrues points for a batch of Payment objects; see accrue_columns.
+
+        Only completed payments earn points. Reading the columns off the objects costs a few
+        getter calls per payment, so callers that already have the columns should use
+        accrue_columns directly.
+
+        :param payments: An iterable of Payment objects.
+        :param at: The time of the entries in seconds since the epoch (default: now).
+        :return: The total points accrued.
+        """
+        completed = [payment for payment in payments if payment.get_payment_status() == "Completed"]
+        return self.accrue_columns([payment.get_payment_id() for payment in completed],
+                                   [payment.get_booking().get_guest().get_guest_id() for payment in completed],
+                                   [payment.get_amount_cents() for payment in completed], at)
+
+    def earn(self, guest_id: int, points: int, at: float = None) -> int:
+        """
+        Adds points to a guest's balance without a payment (e.g., a sign-up bonus).
+
+        :return: The guest's new balance.
+        :raises ValueError: If points is not positive.
+        """
+        if points <= 0:
+            raise ValueError(f"Points earned must be positive, got {points}.")
+        with self.__lock:
+            self.__append(self.__now(at), [guest_id], [self.NO_PAYMENT], [points])
+            return self.__balances[guest_id]
+
+    def redeem(self, guest_id: int, points: int, at: float = None) -> bool:
+        """
+        Redeems points if the guest has enough; the check and the debit are one atomic step.
+
+        :return: True if the points were redeemed, False if the balance was too low.
+        :raises ValueError: If points is not positive.
+        """
+        if points <= 0:
+            raise ValueError(f"Points redeemed must be positive, got {points}.")
+        with self.__lock:
+            if points > self.__balances.get(guest_id, 0):
+                return False
+            self.__append(self.__now(at), [guest_id], [self.NO_PAYMENT], [-points])
+            return True
+
+    def transfer(self, from_guest_id: int, to_guest_id: int, at: float = None) -> int:
+        """
+        Moves a guest's whole balance to another guest ID (e.g., after the guest's ID changed).
+
+        The move is two entries written together, a debit and a credit, so the ledger stays
+        append-only and the old ID's history still shows what it held.
+
+        :return: The points moved.
+        """
+        with self.__lock:
+            points = self.__balances.get(from_guest_id, 0)
+            if points and from_guest_id != to_guest_id:
+                self.__append(self.__now(at), [from_guest_id, to_guest_id], [self.NO_PAYMENT] * 2, [-points, points])
+                return points
+            return 0
+
+    def get_balance(self, guest_id: int, at: float = None) -> int:
+        """
+        Returns a guest's balance now, or as it was at a point in time.
+
+        :param guest_id: The guest to look up.
+        :param at: A time in seconds since the epoch (default: now).
+        """
+        if at is None:
+            return self.__balances.get(guest_id, 0)
+        with self.__lock:
+            changes = self.__history.get(guest_id, [])
+            index = bisect_right(changes[0::2], at) - 1
+            return changes[2 * index + 1] if index >= 0 else 0
+
+    def get_entries(self, guest_id: int = None) -> list:
+        """
+        Returns ledger entries in the order they were written.
+
+        :param guest_id: Only return this guest's entries (default: all).
+        :return: A list of (time, guest_id, payment_id, points) tuples; payment_id is NO_PAYMENT for other entries.
+        """
+        with self.__lock:
+            entries = zip(self.__times, self.__guest_ids, self.__payment_ids, self.__points)
+            return [entry for entry in entries if guest_id is None or entry[1] == guest_id]
+
+    def __len__(self) -> int:
+        """Returns the number of ledger entries."""
+        return len(self.__points)
+
+    def __str__(self) -> str:
+        """Returns a string representation of the LoyaltyLedger object."""
+        return f"LoyaltyLedger(Entries: {len(self.__points)}, Guests: {len(self.__balances)})"
+
+
+def benchmark_accrual(payments: int = 1_000_000, guests: int = 50_000) -> dict:
+    """
+    Compares accruing a batch of completed payments with the per-guest earn_loyalty_points loop.
+
+    :param payments: The number of completed payments in the batch.
+    :param guests: The number of distinct guests paying.
+    :return: Seconds for the ledger batch from columns, the ledger batch from Payment objects
+        and the per-call loop.
+    """
+    import contextlib
+    import io
+
+    from Booking import Booking
+    from Guest import Guest
+    from Payment import Payment
+    from Room import Room
+
+    guest_objects = [Guest(i, f"Guest {i}", f"guest{i}@example.com") for i in range(guests)]
+    room = Room(101, "Double", [], 120.0)
+    batch = []
+    for i in range(payments):
+        booking = Booking(i, guest_objects[i % guests], room, 739433, 739435)
+        batch.append(Payment(i, booking, 100.0 + i % 500, "Credit Card", "Completed"))
+    payment_ids = array("q", range(payments))
+    guest_ids = array("q", (i % guests for i in range(payments)))
+    amount_cents = array("q", (payment.get_amount_cents() for payment in batch))
+
+    started = time.perf_counter()
+    LoyaltyLedger().accrue_columns(payment_ids, guest_ids, amount_cents)
+    columns_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    LoyaltyLedger().accrue_payments(batch)
+    objects_seconds = time.perf_counter() - started
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        started = time.perf_counter()
+        for payment in batch:
+            payment.get_booking().get_guest().earn_loyalty_points(payment.get_amount())
+        loop_seconds = time.perf_counter() - started
+    return {"payments": payments, "ledger_columns_seconds": round(columns_seconds, 3),
+            "ledger_objects_seconds": round(objects_seconds, 3), "per_call_seconds": round(loop_seconds, 3)}
+
+
+# Example Usage
+if __name__ == "__main__":
+    from Booking import Booking
+    from Guest import Guest
+    from Payment import Payment
+    from Room import Room
+
+    ledger = LoyaltyLedger()
+    guest1 = Guest(301, "Alice Smith", "alice@email.com")
+    booking1 = Booking(1001, guest1, Room(101, "Suite", ["Wi-Fi"], 150.0), "2025-07-01", "2025-07-05")
+    payment1 = Payment(5001, booking1, 600.0, "Credit Card", "Completed")
+
+    print(ledger.accrue_payments([payment1], at=1000.0))  # Output: 60
+    print(ledger.accrue_payments([payment1], at=2000.0))  # Output: 0 (already accrued)
+    print(ledger.redeem(301, 25, at=3000.0))  # Output: True
+    print(ledger.get_balance(301), ledger.get_balance(301, at=1500.0))  # Output: 35 60
+
+    print(benchmark_accrual(200_000))
@@ -0,0 +1,154 @@
+# Money class
+from decimal import ROUND_HALF_UP, Decimal
+from functools import total_ordering
+
+
+CENTS_PER_UNIT = 100
+BASIS_POINTS = 10_000  # 100% in basis points
+
+
+def to_cents(amount) -> int:
+    """
+    Converts an amount to integer cents, rounding half away from zero.
+
+    Floats are read by their shortest decimal form, so 600.1 is 60010 cents, not 60009.
+
+    :param amount: An int, float, str, Decimal or Money.
+    """
+    if isinstance(amount, Money):
+        return amount.get_cents()
+    if isinstance(amount, int):
+        return amount * CENTS_PER_UNIT
+    return int((Decimal(str(amount)) * CENTS_PER_UNIT).quantize(Decimal(1), ROUND_HALF_UP))
+
+
+def to_basis_points(percent) -> int:
+    """Converts a percentage (e.g., 7.5) to integer basis points (750)."""
+    return int((Decimal(str(percent)) * 100).quantize(Decimal(1), ROUND_HALF_UP))
+
+
+def scale(cents: int, factor_bp: int) -> int:
+    """
+    Multiplies an amount by a factor in basis points and rounds half away from zero.
+
+    :param cents: The amount in cents.
+    :param factor_bp: The factor in basis points (10_500 adds 5%, 9_000 takes 10% off).
+    """
+    if cents >= 0:
+        return (cents * factor_bp + BASIS_POINTS // 2) // BASIS_POINTS
+    return -((-cents * factor_bp + BASIS_POINTS // 2) // BASIS_POINTS)
+
+
+def scale_all(cents, factor_bp: int) -> list:
+    """
+    Applies scale to every amount in one pass.
+
+    :param cents: An iterable of amounts in cents.
+    :param factor_bp: The factor in basis points.
+    :return: A list of scaled amounts in cents.
+    """
+    half = BASIS_POINTS // 2
+    return [(c * factor_bp + half) // BASIS_POINTS if c >= 0 else -((-c * factor_bp + half) // BASIS_POINTS) for c in cents]
+
+
+def allocate(cents: int, weights: list) -> list:
+    """
+    Splits an amount in proportion to weights so the parts add up exactly to the amount.
+
+    Leftover cents go to the parts with the largest remainders.
+
+    :param cents: The amount in cents (not negative).
+    :param weights: Non-negative weights, one per part.
+    :return: A list of amounts in cents.
+    """
+    total = sum(weights)
+    if total <= 0:
+        raise ValueError("Allocation weights must add up to more than zero.")
+    parts = [cents * weight // total for weight in weights]
+    remainders = sorted(range(len(weights)), key=lambda i: cents * weights[i] % total, reverse=True)
+    for i in remainders[:cents - sum(parts)]:
+        parts[i] += 1
+    return parts
+
+
+@total_ordering
+class Money:
+    """
+    An exact amount of money stored as integer cents.
+
+    Adding and subtracting are exact, and percentages round half away from zero once, to the cent.
+    """
+
+    __slots__ = ("__cents",)
+
+    def __init__(self, amount=0):
+        """
+        Initializes a Money object.
+
+        :param amount: The amount in currency units (e.g., 600.0 or "19.99"); see to_cents.
+        """
+        self.__cents = to_cents(amount)
+
+    @classmethod
+    def from_cents(cls, cents: int) -> "Money":
+        """Returns a Money object for an amount already in cents."""
+        money = cls.__new__(cls)
+        money.__cents = cents
+        return money
+
+    def get_cents(self) -> int:
+        """Returns the amount in cents."""
+        return self.__cents
+
+    def add_percent(self, percent) -> "Money":
+        """Returns the amount increased by a percentage (e.g., VAT), rounded to the cent."""
+        return Money.from_cents(scale(self.__cents, BASIS_POINTS + to_basis_points(percent)))
+
+    def discount(self, percent) -> "Money":
+        """Returns the amount reduced by a percentage, rounded to the cent."""
+        return Money.from_cents(scale(self.__cents, BASIS_POINTS - to_basis_points(percent)))
+
+    def allocate(self, weights: list) -> list:
+        """Splits the amount in proportion to weights; the parts add up exactly to the amount."""
+        return [Money.from_cents(part) for part in allocate(self.__cents, weights)]
+
+    def __add__(self, other: "Money") -> "Money":
+        return Money.from_cents(self.__cents + to_cents(other))
+
+    __radd__ = __add__  # Lets sum() start from 0
+
+    def __sub__(self, other: "Money") -> "Money":
+        return Money.from_cents(self.__cents - to_cents(other))
+
+    def __neg__(self) -> "Money":
+        return Money.from_cents(-self.__cents)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Money) and self.__cents == other.__cents
+
+    def __lt__(self, other: "Money") -> bool:
+        return self.__cents < other.__cents
+
+    def __hash__(self) -> int:
+        return hash(self.__cents)
+
+    def __float__(self) -> float:
+        return self.__cents / CENTS_PER_UNIT
+
+    def __repr__(self) -> str:
+        return f"Money('{self}')"
+
+    def __str__(self) -> str:
+        """Returns the amount with two decimals (e.g., 715.00)."""
+        sign = "-" if self.__cents < 0 else ""
+        units, cents = divmod(abs(self.__cents), CENTS_PER_UNIT)
+        return f"{sign}{units}.{cents:02d}"
+
+
+# Example Usage
+if __name__ == "__main__":
+    price = Money("0.10") + Money("0.20")
+    print(price == Money("0.30"))  # Output: True (0.1 + 0.2 != 0.3 with floats)
+
+    print(Money(650).add_percent(10))  # Output: 715.00
+    print(Money("100.00").allocate([1, 1, 1]))  # Output: [Money('33.34'), Money('33.33'), Money('33.33')]
@@ -0,0 +1,265 @@
+# NotificationSink classes
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from collections import deque
+
+
+# Console text for each event type, matching the messages bookings and payments used to print.
+# Event types without an entry are state changes that never printed anything.
+MESSAGES = {
+    "special_request_added": "Special request added: {request}",
+    "booking_confirmed": "Booking {booking_id} confirmed.",
+    "booking_cancelled": "Booking {booking_id} cancelled.",
+    "booking_modified": "Booking {booking_id} modified to new dates: {new_dates}",
+    "booking_extended": "Booking {booking_id} extended for {extra_days} extra days.",
+    "discount_applied": "Discount applied. New room price: {new_price}",
+    "room_assigned": "Booking {booking_id} assigned to Room {room_number}",
+    "guest_changed": "Guest details updated for Booking {booking_id}",
+    "guest_notified": "Notification sent to Guest {guest_name} for Booking {booking_id}",
+    "room_conflict": "Error: Room {room_number} is already held by booking {conflicting_booking_id} for these dates.",
+    "invalid_dates": "Error: Booking {booking_id} has a check-out date on or before its check-in date.",
+    "payment_processed": "Payment processed successfully.",
+    "payment_not_processed": "Payment failed or already processed.",
+    "payment_refunded": "Payment refunded successfully.",
+    "vat_applied": "VAT applied. New amount: {amount}",
+    "payment_split": "Payment successfully split across methods: {methods}",
+    "split_mismatch": "Error: Split payment amounts do not match the total amount.",
+    "receipt_sent": "Receipt sent for Payment ID {payment_id}",
+    "coupon_applied": "Coupon applied successfully.",
+    "coupon_rejected": "Invalid coupon code.",
+    "payment_failed": "Payment failed and recorded.",
+    "illegal_transition": "Error: Payment {payment_id} cannot go from {from_status} to {status}.",
+}
+
+
+def format_event(event: dict) -> str:
+    """Returns the console message for an event, or None if the event type has no message."""
+    template = MESSAGES.get(event["type"])
+    if template is None:
+        return None
+    return template.format(**event)
+
+
+class NotificationSink:
+    """
+    Receives structured events (dicts with a "type" key) instead of printing them.
+
+    This base class discards everything and is the default, so hot paths pay nothing for
+    notifications. Emitters skip building the event when `active` is False.
+    """
+
+    active = False
+
+    def emit(self, event: dict) -> None:
+        """Handles one event."""
+
+    def flush(self) -> None:
+        """Writes out any buffered events."""
+
+    def close(self) -> None:
+        """Flushes and releases any resources held by the sink."""
+        self.flush()
+
+
+class ConsoleSink(NotificationSink):
+    """
+    Writes every event to a stream as soon as it arrives, like the old print() calls.
+    """
+
+    active = True
+
+    def __init__(self, stream=None):
+        """
+        Initializes a ConsoleSink.
+
+        :param stream: The text stream to write to (default: sys.stdout at the time of each event).
+        """
+        self.__stream = stream
+
+    def emit(self, event: dict) -> None:
+        """Writes the event's message on its own line."""
+        message = format_event(event)
+        if message is not None:
+            print(message, file=self.__stream or sys.stdout)
+
+
+class BufferedSink(NotificationSink):
+    """
+    Keeps events in memory, for tests and for jobs that inspect what happened afterwards.
+    """
+
+    active = True
+
+    def __init__(self, max_events: int = None):
+        """
+        Initializes a BufferedSink.
+
+        :param max_events: Maximum number of events kept; the oldest are dropped first. None keeps all.
+        """
+        self.__events = deque(maxlen=max_events)
+
+    def emit(self, event: dict) -> None:
+        """Stores the event."""
+        self.__events.append(event)
+
+    def get_events(self, event_type: str = None) -> list:
+        """Returns the stored events, optionally only those of one type."""
+        if event_type is None:
+            return list(self.__events)
+        return [event for event in self.__events if event["type"] == event_type]
+
+    def clear(self) -> None:
+        """Discards all stored events."""
+        self.__events.clear()
+
+    def __len__(self) -> int:
+        """Returns the number of stored events."""
+        return len(self.__events)
+
+
+class AsyncQueueSink(NotificationSink):
+    """
+    Hands events to a background thread that writes them to a stream in batches.
+
+    emit only puts the event on a queue. The writer thread formats whatever has queued up,
+    up to batch_size events, and writes it with a single call, so callers never wait for I/O.
+    An event that cannot be formatted, or a batch that cannot be written, is counted and
+    skipped rather than stopping the writer.
+    """
+
+    active = True
+
+    def __init__(self, stream=None, batch_size: int = 1000, flush_interval: float = 0.5, as_json: bool = False):
+        """
+        Initializes an AsyncQueueSink and starts its writer thread.
+
+        :param stream: The text stream to write to (default: sys.stdout).
+        :param batch_size: The most events written in one call.
+        :param flush_interval: Seconds the writer waits for more events before writing a partial batch.
+        :param as_json: Write every event as JSON Lines instead of console messages.
+        """
+        self.__stream = stream or sys.stdout
+        self.__batch_size = batch_size
+        self.__flush_interval = flush_interval
+        self.__format = (lambda event: json.dumps(event, default=str)) if as_json else format_event
+        self.__queue = queue.SimpleQueue()
+        self.__closed = False
+        self.__errors = 0  # Events that could not be formatted or written
+        self.__writer = threading.Thread(target=self.__run, name="AsyncQueueSink", daemon=True)
+        self.__writer.start()
+
+    def emit(self, event: dict) -> None:
+        """Queues the event for the writer thread."""
+        self.__queue.put(event)
+
+    def __run(self) -> None:
+        running = True
+        while running:
+            try:
+                batch = [self.__queue.get(timeout=self.__flush_interval)]
+            except queue.Empty:
+                continue
+            while len(batch) < self.__batch_size:
+                try:
+                    batch.append(self.__queue.get_nowait())
+                except queue.Empty:
+                    break
+            # Flush markers (threading.Event) and the stop marker (None) ride along in the queue
+            events = [item for item in batch if isinstance(item, dict)]
+            lines = []
+            for event in events:
+                try:
+                    line = self.__format(event)
+                except Exception:  # One bad event must not stop the writer
+                    self.__errors += 1
+                    continue
+                if line is not None:
+                    lines.append(line + "\n")
+            if lines:
+                try:
+                    self.__stream.write("".join(lines))
+                    self.__stream.flush()
+                except Exception:
+                    self.__errors += len(lines)
+            for item in batch:
+                if item is None:
+                    running = False
+                elif isinstance(item, threading.Event):
+                    item.set()
+
+    def get_error_count(self) -> int:
+        """Returns the number of events that could not be formatted or written."""
+        return self.__errors
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """
+        Blocks until every event queued so far has been written.
+
+        :param timeout: The most seconds to wait.
+        :return: False if the events were not all written in time.
+        """
+        if self.__closed or not self.__writer.is_alive():
+            return self.__queue.empty()
+        written = threading.Event()
+        self.__queue.put(written)
+        return written.wait(timeout)
+
+    def close(self, timeout: float = 10.0) -> None:
+        """
+        Writes any queued events and stops the writer thread.
+
+        :param timeout: The most seconds to wait for the writer thread.
+        """
+        if not self.__closed:
+            self.__closed = True
+            self.__queue.put(None)
+            self.__writer.join(timeout)
+
+
+def benchmark_confirms(confirms: int = 100_000) -> dict:
+    """
+    Times Booking.confirm_booking with different sinks.
+
+    Console output goes to os.devnull so the terminal itself is not measured.
+
+    :param confirms: The number of confirms per sink.
+    :return: Seconds taken for each sink.
+    """
+    from Booking import Booking
+    from Guest import Guest
+    from Room import Room
+
+    guest = Guest(1, "Benchmark Guest", "bench@example.com")
+    room = Room(101, "Double", [], 120.0)
+    bookings = [Booking(i, guest, room, 739433, 739435) for i in range(confirms)]
+    results = {}
+    with open(os.devnull, "w") as devnull:
+        sinks = {
+            "no_op": NotificationSink(),
+            "buffered": BufferedSink(),
+            "async_queue": AsyncQueueSink(devnull),
+            "console": ConsoleSink(devnull),
+        }
+        previous = Booking.get_default_sink()
+        for name, sink in sinks.items():
+            Booking.set_default_sink(sink)
+            started = time.perf_counter()
+            for booking in bookings:
+                booking.confirm_booking()
+            sink.close()
+            results[name] = round(time.perf_counter() - started, 3)
+        Booking.set_default_sink(previous)
+    return results
+
+
+# Example Usage
+if __name__ == "__main__":
+    sink = BufferedSink()
+    sink.emit({"type": "booking_confirmed", "booking_id": 1001})
+    print(format_event(sink.get_events()[0]))  # Output: Booking 1001 confirmed.
+
+    print(benchmark_confirms())
@@ -1,25 +1,53 @@
+import threading
+import time
+from itertools import count
+
+from CardValidator import CardValidator
+from CouponRegistry import CouponRegistry
+from Money import BASIS_POINTS, Money, scale, scale_all, to_basis_points, to_cents
+from NotificationSink import ConsoleSink, NotificationSink
+from PaymentStateMachine import COMPLETED, FAILED, PENDING, REFUNDED, STATE_NAMES, TransitionAudit, can_transition, to_state
+
 
 # Payment Class 
 class Payment:
     """
     Handles payment processing, invoices, refunds, and validation.
+
+    Like Booking, payments report what they do as events to a NotificationSink rather than printing.
+    Amounts are kept as integer cents, so VAT, coupons and splits are exact to the cent.
+    The status is a small integer state that only changes along PaymentStateMachine.TRANSITIONS,
+    by compare-and-set under a lock striped by payment, and every change is recorded in the
+    shared transition audit.
     """
 
+    _default_sink = NotificationSink()  # Shared by every payment without its own sink
+    _coupon_registry = CouponRegistry()  # Coupons accepted by apply_coupon
+    _coupon_registry.add_coupon("DISCOUNT10", 10)
+    _transition_audit = TransitionAudit()  # Every status change of every payment
+    _transition_locks = [threading.Lock() for _ in range(64)]  # Striped by payment; guard status and amount changes
+    _stripes = count()  # Hands out stripes round-robin as payments are created
+
     def __init__(self, payment_id: int, booking: "Booking", amount: float, payment_method: str, status: str = "Pending"):
         """
         Initializes a Payment instance.
 
         :param payment_id: Unique identifier for the payment.
         :param booking: The Booking object associated with the payment.
-        :param amount: The amount to be paid.
+        :param amount: The amount to be paid (a number, decimal string or Money).
         :param payment_method: The method of payment (e.g., Credit Card, PayPal).
-        :param status: The payment status (e.g., Pending, Completed, Refunded).
+        :param status: The payment status: Pending, Completed, Refunded or Failed.
+        :raises ValueError: If the status is not one of those.
         """
         self.__payment_id = payment_id
+        self.__stripe = next(Payment._stripes) % len(Payment._transition_locks)
         self.__booking = booking
-        self.__amount = amount
+        self.__amount_cents = to_cents(amount)
         self.__payment_method = payment_method
-        self.__status = status
+        self.__state = to_state(status)
+        self.__sink = None  # NotificationSink for this payment only; None uses the default sink
+        self.__emit("payment_created", booking_id=None if booking is None else booking.get_booking_id(),
+                    amount=self.get_amount(), payment_method=payment_method, status=status)
 
     # Getter and Setter for payment_id
     def get_payment_id(self) -> int:
@@ -27,17 +55,106 @@ class Payment:
         return self.__payment_id
 
     def set_payment_id(self, payment_id: int) -> None:
-        """Updates the payment ID."""
-        self.__payment_id = payment_id
+        """Updates the payment ID; later events are reported under the new ID."""
+        old_payment_id = self.__payment_id
+        if payment_id != old_payment_id:
+            self.__payment_id = payment_id
+            self.__emit("payment_id_changed", old_payment_id=old_payment_id)
+
+    # Getters and Setters for notification sinks
+    @staticmethod
+    def get_default_sink() -> NotificationSink:
+        """Returns the sink used by payments without a sink of their own."""
+        return Payment._default_sink
+
+    @staticmethod
+    def set_default_sink(sink: NotificationSink) -> None:
+        """Sets the sink used by payments without a sink of their own."""
+        Payment._default_sink = sink
+
+    def set_notification_sink(self, sink: NotificationSink) -> None:
+        """Sets a sink for this payment only (None falls back to the default sink)."""
+        self.__sink = sink
+
+    # Getter and Setter for the coupon registry
+    @staticmethod
+    def get_coupon_registry() -> CouponRegistry:
+        """Returns the registry of coupons accepted by apply_coupon."""
+        return Payment._coupon_registry
+
+    @staticmethod
+    def set_coupon_registry(registry: CouponRegistry) -> None:
+        """Sets the registry of coupons accepted by apply_coupon."""
+        Payment._coupon_registry = registry
+
+    @staticmethod
+    def get_transition_audit() -> TransitionAudit:
+        """Returns the audit every payment records its status changes in."""
+        return Payment._transition_audit
+
+    @staticmethod
+    def set_transition_audit(audit: TransitionAudit) -> None:
+        """Replaces the audit every payment records its status changes in."""
+        Payment._transition_audit = audit
+
+    def __emit(self, event_type: str, **fields) -> None:
+        """Sends an event to the payment's sink; nothing is built when the sink discards events."""
+        sink = self.__sink if self.__sink is not None else Payment._default_sink
+        if sink.active:
+            fields["type"] = event_type
+            fields["payment_id"] = self.__payment_id
+            sink.emit(fields)
+
+    # Getter for booking
+    def get_booking(self) -> "Booking":
+        """Returns the Booking object associated with the payment."""
+        return self.__booking
 
     # Getter and Setter for amount
     def get_amount(self) -> float:
         """Returns the payment amount."""
-        return self.__amount
+        return self.__amount_cents / 100
+
+    def get_amount_cents(self) -> int:
+        """Returns the payment amount in cents."""
+        return self.__amount_cents
+
+    def get_money(self) -> Money:
+        """Returns the payment amount as Money."""
+        return Money.from_cents(self.__amount_cents)
 
     def set_amount(self, amount: float) -> None:
-        """Updates the payment amount."""
-        self.__amount = amount
+        """Updates the payment amount (a number, decimal string or Money)."""
+        self.__set_amount_cents(to_cents(amount), "amount_changed")
+
+    def __get_lock(self) -> threading.Lock:
+        """Returns the lock stripe guarding this payment's status and amount."""
+        return Payment._transition_locks[self.__stripe]
+
+    def __set_amount_cents(self, amount_cents: int, event_type: str = "payment_amount_changed", **fields) -> None:
+        """Replaces the amount under the payment's lock and reports the new amount."""
+        with self.__get_lock():
+            self.__amount_cents = amount_cents
+            self.__emit(event_type, amount=amount_cents / 100, **fields)
+
+    def __write_scaled_cents(self, read_cents: int, scaled_cents: int, factor_bp: int, **fields) -> None:
+        """
+        Writes an amount scaled from an earlier unlocked read, under the payment's lock.
+
+        If the amount changed since it was read, the current amount is scaled instead, so a
+        concurrent change is built on rather than overwritten.
+        """
+        with self.__get_lock():
+            if self.__amount_cents != read_cents:
+                scaled_cents = scale(self.__amount_cents, factor_bp)
+            self.__amount_cents = scaled_cents
+            self.__emit("payment_amount_changed", amount=scaled_cents / 100, **fields)
+
+    def __scale_amount(self, factor_bp: int, event_type: str, **fields) -> None:
+        """Multiplies the amount by a factor in basis points under the payment's lock and reports the new amount."""
+        with self.__get_lock():
+            self.__amount_cents = scale(self.__amount_cents, factor_bp)
+            self.__emit(event_type, amount=self.__amount_cents / 100, **fields)
 
     # Getter and Setter for payment_method
     def get_payment_method(self) -> str:
@@ -47,98 +164,223 @@ class Payment:
     def set_payment_method(self, payment_method: str) -> None:
         """Updates the payment method."""
         self.__payment_method = payment_method
+        self.__emit("payment_method_changed", payment_method=payment_method)
 
     # Getter and Setter for status
     def get_payment_status(self) -> str:
         """Returns the current payment status."""
-        return self.__status
+        return STATE_NAMES[self.__state]
+
+    def get_payment_state(self) -> int:
+        """Returns the current payment status as a PaymentStateMachine state code."""
+        return self.__state
+
+    def compare_and_set_state(self, expected: int, new: int) -> bool:
+        """
+        Moves the payment from one state to another in one atomic step.
 
-    def set_payment_status(self, status: str) -> None:
-        """Updates the payment status."""
-        self.__status = status
+        :param expected: The state the payment must be in.
+        :param new: The state to move to; the transition table must allow it.
+        :return: False, leaving the payment unchanged, if it was not in the expected state
+            or the transition is not allowed.
+        """
+        if not can_transition(expected, new):
+            return False
+        with self.__get_lock():
+            if self.__state != expected:
+                return False
+            self.__state = new
+            Payment._transition_audit.record(self.__payment_id, expected, new)  # Under the lock, so a payment's records stay in order
+        return True
+
+    def set_payment_status(self, status: str) -> bool:
+        """
+        Updates the payment status if the transition table allows it from the current status.
+
+        :return: False if the change is not allowed (e.g., Refunded to Pending).
+        """
+        new = to_state(status)
+        current = self.__state
+        if self.compare_and_set_state(current, new):
+            self.__emit("payment_status_changed", status=status)
+            return True
+        self.__emit("illegal_transition", from_status=STATE_NAMES[current], status=status)
+        return False
 
     def process_payment(self) -> bool:
         """Processes the payment if it's still pending."""
-        if self.__status == "Pending":
-            self.__status = "Completed"
-            print("Payment processed successfully.")
+        if self.compare_and_set_state(PENDING, COMPLETED):
+            self.__emit("payment_processed", status=STATE_NAMES[COMPLETED])
             return True
-        print("Payment failed or already processed.")
+        self.__emit("payment_not_processed", status=self.get_payment_status())
         return False
 
     def generate_invoice(self) -> str:
         """Generates an invoice for the payment."""
-        return f"Invoice: Payment ID {self.__payment_id}, Amount: {self.__amount}, Method: {self.__payment_method}, Status: {self.__status}"
+        return f"Invoice: Payment ID {self.__payment_id}, Amount: {self.get_amount()}, Method: {self.__payment_method}, Status: {self.get_payment_status()}"
 
-    def refund_payment(self) -> None:
+    def refund_payment(self) -> bool:
         """Refunds the payment if it was completed."""
-        if self.__status == "Completed":
-            self.__status = "Refunded"
-            print("Payment refunded successfully.")
+        if self.compare_and_set_state(COMPLETED, REFUNDED):
+            self.__emit("payment_refunded", status=STATE_NAMES[REFUNDED])
+            return True
+        return False
 
     def apply_vat(self, vat: float) -> None:
-        """Applies VAT to the payment amount."""
-        self.__amount += self.__amount * (vat / 100)
-        print(f"VAT applied. New amount: {self.__amount}")
+        """Applies VAT (a percentage) to the payment amount, rounding half up to the cent."""
+        self.__scale_amount(BASIS_POINTS + to_basis_points(vat), "vat_applied", vat=vat)
 
     def split_payment(self, methods: list[str], amounts: list[float]) -> None:
-        """Splits the payment across multiple methods if the total matches."""
-        if sum(amounts) == self.__amount:
+        """Splits the payment across multiple methods if the amounts add up to the total, to the cent."""
+        if sum(to_cents(amount) for amount in amounts) == self.__amount_cents:
             self.__payment_method = ", ".join(methods)
-            print(f"Payment successfully split across methods: {methods}")
+            self.__emit("payment_split", methods=methods, amounts=amounts)
         else:
-            print("Error: Split payment amounts do not match the total amount.")
+            self.__emit("split_mismatch", amounts=amounts)
 
     def validate_payment_details(self) -> bool:
         """Validates payment details (amount must be positive and a payment method must be provided)."""
-        return self.__amount > 0 and bool(self.__payment_method)
+        return self.__amount_cents > 0 and bool(self.__payment_method)
 
     def send_payment_receipt(self) -> None:
         """Sends a payment receipt."""
-        print(f"Receipt sent for Payment ID {self.__payment_id}")
+        self.__emit("receipt_sent")
 
     def apply_coupon(self, coupon_code: str) -> bool:
-        """Applies a coupon discount if valid."""
-        if coupon_code == "DISCOUNT10":
-            self.__amount *= 0.9
-            print("Coupon applied successfully.")
+        """
+        Redeems a coupon from the coupon registry and applies its discount, rounding half up to the cent.
+
+        :return: False if the code is unknown or its rules (expiry, room type, minimum spend, usage limit) reject this payment.
+        """
+        discount_bp, reason = Payment._coupon_registry.redeem(coupon_code, self)
+        if discount_bp is not None:
+            self.__scale_amount(BASIS_POINTS - discount_bp, "coupon_applied", coupon_code=coupon_code)
             return True
-        print("Invalid coupon code.")
+        self.__emit("coupon_rejected", coupon_code=coupon_code, reason=reason)
         return False
 
-    def record_failed_transaction(self) -> None:
-        """Records a failed transaction."""
-        self.__status = "Failed"
-        print("Payment failed and recorded.")
+    def record_failed_transaction(self) -> bool:
+        """Records a failed transaction if the payment is still pending."""
+        if self.compare_and_set_state(PENDING, FAILED):
+            self.__emit("payment_failed", status=STATE_NAMES[FAILED])
+            return True
+        self.__emit("illegal_transition", from_status=self.get_payment_status(), status=STATE_NAMES[FAILED])
+        return False
 
     def verify_card_details(self, card_number: str) -> bool:
-        """Verifies if a card number is valid (must be 16 digits and numeric)."""
-        return len(card_number) == 16 and card_number.isdigit()
+        """Verifies if a card number is valid (12 to 19 digits, spaces or dashes allowed, passing the Luhn check)."""
+        return CardValidator.is_valid(card_number)
+
+    @staticmethod
+    def reprice_all(payments: list, vat: float = 0, coupon_code: str = None) -> int:
+        """
+        Applies VAT and then a coupon to many payments in one pass over their amounts.
+
+        The result for each payment is exactly what apply_vat followed by apply_coupon would give,
+        but the amounts are read once and scaled as one column of integers. Each new amount is
+        written back under the payment's lock and reported as a payment_amount_changed event,
+        as single changes are; if the amount changed since it was read, the change is scaled
+        rather than lost. The coupon is redeemed once per payment it applies to, with the
+        discount that redemption granted; payments it rejects only get the VAT.
+
+        :param payments: The Payment objects to reprice.
+        :param vat: The VAT percentage to add (0 for none).
+        :param coupon_code: A coupon to apply after VAT, or None.
+        :return: The number of payments the coupon was applied to.
+        """
+        if vat:
+            factor = BASIS_POINTS + to_basis_points(vat)
+            cents = [payment.__amount_cents for payment in payments]
+            for payment, read_cents, amount_cents in zip(payments, cents, scale_all(cents, factor)):
+                payment.__write_scaled_cents(read_cents, amount_cents, factor, vat=vat)
+        if coupon_code is None:
+            return 0
+        redeem = Payment._coupon_registry.redeem
+        accepted = {}  # discount_bp -> payments redeemed at that discount (one group unless the coupon changes)
+        for payment in payments:
+            discount_bp = redeem(coupon_code, payment)[0]
+            if discount_bp is not None:
+                accepted.setdefault(discount_bp, []).append(payment)
+        for discount_bp, group in accepted.items():
+            factor = BASIS_POINTS - discount_bp
+            cents = [payment.__amount_cents for payment in group]
+            for payment, read_cents, amount_cents in zip(group, cents, scale_all(cents, factor)):
+                payment.__write_scaled_cents(read_cents, amount_cents, factor, coupon_code=coupon_code)
+        return sum(map(len, accepted.values()))
 
     def __str__(self) -> str:
         """Returns a string representation of the Payment object."""
-        return f"Payment ID: {self.__payment_id}, Amount: ${self.__amount}, Method: {self.__payment_method}, Status: {self.__status}"
+        return f"Payment ID: {self.__payment_id}, Amount: ${self.get_amount()}, Method: {self.__payment_method}, Status: {self.get_payment_status()}"
+
+
+def benchmark_reprice(payments: int = 1_000_000) -> dict:
+    """
+    Compares Payment.reprice_all with calling apply_vat and apply_coupon on each payment.
+
+    :param payments: The number of payments to reprice.
+    :return: Seconds for each approach and whether both gave the same amounts.
+    """
+    amounts = [f"{100 + i % 900}.{i % 100:02d}" for i in range(payments)]
+    one_by_one = [Payment(i, None, amount, "Credit Card") for i, amount in enumerate(amounts)]
+    batch = [Payment(i, None, amount, "Credit Card") for i, amount in enumerate(amounts)]
+
+    previous = Payment.get_default_sink()
+    Payment.set_default_sink(NotificationSink())  # Time the arithmetic, not the console
+    started = time.perf_counter()
+    for payment in one_by_one:
+        payment.apply_vat(5)
+        payment.apply_coupon("DISCOUNT10")
+    per_object_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    Payment.reprice_all(batch, vat=5, coupon_code="DISCOUNT10")
+    batch_seconds = time.perf_counter() - started
+    Payment.set_default_sink(previous)
+    return {
+        "payments": payments,
+        "per_object_seconds": round(per_object_seconds, 3),
+        "batch_seconds": round(batch_seconds, 3),
+        "identical": all(a.get_amount_cents() == b.get_amount_cents() for a, b in zip(one_by_one, batch)),
+    }
 
 
 # Example Usage
-booking1 = Booking(1001, Guest(301, "Alice Smith", "alice@email.com"), Room(101, "Suite", ["Wi-Fi", "TV", "Mini-Bar"], 150.0), "2025-07-01", "2025-07-05")
-payment1 = Payment(5001, booking1, 600.0, "Credit Card")
+if __name__ == "__main__":
+    from Booking import Booking
+    from Guest import Guest
+    from Room import Room
+
+    Payment.set_default_sink(ConsoleSink())  # Show payment events on the console
+
+    booking1 = Booking(1001, Guest(301, "Alice Smith", "alice@email.com"), Room(101, "Suite", ["Wi-Fi", "TV", "Mini-Bar"], 150.0), "2025-07-01", "2025-07-05")
+    payment1 = Payment(5001, booking1, 600.0, "Credit Card")
+
+    # Testing Getter Methods
+    print(payment1.get_payment_id())  # Output: 5001
+    print(payment1.get_amount())  # Output: 600.0
+    print(payment1.get_payment_method())  # Output: Credit Card
+    print(payment1.get_payment_status())  # Output: Pending
+
+    # Testing Setter Methods
+    payment1.set_amount(650.0)
+    payment1.set_payment_status("Completed")
+
+    # Processing Payment
+    payment1.process_payment()
 
-# Testing Getter Methods
-print(payment1.get_payment_id())  # Output: 5001
-print(payment1.get_amount())  # Output: 600.0
-print(payment1.get_payment_method())  # Output: Credit Card
-print(payment1.get_payment_status())  # Output: Pending
+    # Applying VAT
+    payment1.apply_vat(10)  # Adds 10% VAT
 
-# Testing Setter Methods
-payment1.set_amount(650.0)
-payment1.set_payment_status("Completed")
+    # Printing Updated Payment Info
+    print(payment1)  # Output: Payment ID: 5001, Amount: $715.0, Method: Credit Card, Status: Completed
 
-# Processing Payment
-payment1.process_payment()
+    # Refunds are final: moving back to Pending is rejected
+    payment1.refund_payment()  # Output: Payment refunded successfully.
+    print(payment1.set_payment_status("Pending"))  # Output: Error: Payment 5001 cannot go from Refunded to Pending. / False
+    print([STATE_NAMES[to] for _, _, _, _, to in Payment.get_transition_audit().get_records()])  # Output: ['Completed', 'Refunded']
 
-# Applying VAT
-payment1.apply_vat(10)  # Adds 10% VAT
+    # Splitting exactly: 0.1 + 0.2 adds up to 0.3 in cents
+    payment2 = Payment(5002, booking1, 0.3, "Credit Card")
+    payment2.split_payment(["Cash", "Credit Card"], [0.1, 0.2])  # Output: Payment successfully split across methods: ['Cash', 'Credit Card']
 
-# Printing Updated Payment Info
-print(payment1)  # Output: Payment ID: 5001, Amount: $715.0, Method: Credit Card, Status: Completed
+    print(benchmark_reprice(200_000))
@@ -0,0 +1,240 @@
+# PaymentProcessor class
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+
+
+class PaymentGateway(ABC):
+    """
+    The interface PaymentProcessor charges payments through.
+
+    A gateway must treat repeated calls with the same idempotency key as one charge: once a key
+    was approved, later calls return that approval instead of charging again. A declined key
+    may be tried again.
+    """
+
+    @abstractmethod
+    def charge(self, payment: "Payment", idempotency_key: str) -> tuple:
+        """
+        Charges a payment.
+
+        :param payment: The payment to charge.
+        :param idempotency_key: The key identifying this charge across retries.
+        :return: An (approved, reference) pair; reference is a transaction ID or a decline reason.
+        """
+
+
+class MockGateway(PaymentGateway):
+    """
+    A local stand-in for a card gateway with a configurable delay and decline rate.
+    """
+
+    def __init__(self, latency: float = 0.002, jitter: float = 0.001, decline_rate: float = 0.02, seed: int = None):
+        """
+        Initializes a MockGateway.
+
+        :param latency: The average seconds each charge takes.
+        :param jitter: The most seconds added to or taken from the delay at random.
+        :param decline_rate: The share of charges declined.
+        :param seed: Seed for delays and declines, for repeatable runs.
+        """
+        self.__latency = latency
+        self.__jitter = jitter
+        self.__decline_rate = decline_rate
+        self.__rng = random.Random(seed)
+        self.__charges = {}  # idempotency key -> (True, reference) for approved charges
+        self.__lock = threading.Lock()
+
+    def charge(self, payment: "Payment", idempotency_key: str) -> tuple:
+        """Charges a payment once per idempotency key, sleeping to simulate the network; declines are not remembered."""
+        with self.__lock:
+            previous = self.__charges.get(idempotency_key)
+            if previous is not None:
+                return previous
+            delay = max(0.0, self.__latency + self.__rng.uniform(-self.__jitter, self.__jitter))
+            declined = self.__rng.random() < self.__decline_rate
+        time.sleep(delay)
+        if declined:
+            return False, "card_declined"
+        with self.__lock:
+            return self.__charges.setdefault(idempotency_key, (True, f"txn-{idempotency_key}"))
+
+    def get_charge_count(self) -> int:
+        """Returns the number of distinct approved charges."""
+        return len(self.__charges)
+
+
+class PaymentProcessor:
+    """
+    Charges batches of pending payments concurrently, never charging the same payment twice.
+
+    Each payment gets an idempotency key (by default from its ID and amount). A key is claimed
+    under a lock before it is charged, so duplicates in a batch, concurrent batches and reruns
+    reuse a completed outcome instead of calling the gateway again. Failed charges release
+    their key, so a payment moved back to Pending can be retried. Payments are charged by a
+    bounded thread pool, since gateway calls spend their time waiting on the network. Outcomes
+    are returned as dicts and nothing is printed.
+    """
+
+    COMPLETED = "Completed"
+    FAILED = "Failed"
+    DUPLICATE = "Duplicate"  # The key was already charged; the earlier outcome is reused
+    SKIPPED = "Skipped"  # The payment was not pending
+    NOT_RECORDED = "Not recorded"  # The gateway approved the charge, but the payment had left Pending
+
+    def __init__(self, gateway: PaymentGateway, max_workers: int = 16, max_pending: int = None):
+        """
+        Initializes a PaymentProcessor.
+
+        :param gateway: The gateway payments are charged through.
+        :param max_workers: The number of worker threads.
+        :param max_pending: The most payments queued for the workers at once (default: 4 per worker).
+        """
+        self.__gateway = gateway
+        self.__max_workers = max_workers
+        self.__max_pending = max_pending or max_workers * 4
+        self.__outcomes = {}  # idempotency key -> outcome dict, or None while the charge is in flight
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def idempotency_key(payment: "Payment") -> str:
+        """Returns the default idempotency key: the same payment for the same amount is one charge."""
+        return f"{payment.get_payment_id()}:{payment.get_amount_cents()}"
+
+    def __claim(self, key: str, pending: bool) -> dict:
+        """
+        Claims a key for charging.
+
+        :return: None if the caller should charge the payment, otherwise a dict with the status
+            to report: DUPLICATE (and the earlier reference, or None while that charge is in
+            flight) or SKIPPED.
+        """
+        with self.__lock:
+            if key in self.__outcomes:
+                earlier = self.__outcomes[key]
+                return {"status": self.DUPLICATE, "reference": earlier and earlier["reference"]}
+            if not pending:
+                return {"status": self.SKIPPED}
+            self.__outcomes[key] = None
+            return None
+
+    def __charge(self, payment: "Payment", key: str) -> dict:
+        started = time.perf_counter()
+        try:
+            approved, reference = self.__gateway.charge(payment, key)
+        except Exception as error:  # A gateway error is a failed charge, not a failed batch
+            approved, reference = False, f"gateway_error: {error}"
+        latency = time.perf_counter() - started
+        if not approved:
+            payment.record_failed_transaction()
+            status = self.FAILED
+        elif payment.process_payment():
+            status = self.COMPLETED
+        else:
+            status = self.NOT_RECORDED  # Money was taken; the reference is needed to reconcile or refund it
+        outcome = {"payment_id": payment.get_payment_id(), "idempotency_key": key,
+                   "status": status, "reference": reference, "latency": latency}
+        with self.__lock:
+            if approved:
+                self.__outcomes[key] = outcome
+            else:
+                del self.__outcomes[key]  # Only approved charges are sticky; a failed one may be retried
+        return outcome
+
+    def process_batch(self, payments: list, key_function=None) -> list:
+        """
+        Charges every pending payment in a batch.
+
+        :param payments: The Payment objects to charge.
+        :param key_function: Returns the idempotency key of a payment (default: idempotency_key).
+        :return: One outcome dict per payment, in batch order. Charged payments have status
+            COMPLETED or FAILED with the gateway reference and latency in seconds, or
+            NOT_RECORDED if the gateway approved but the payment was no longer Pending by then;
+            the others are DUPLICATE (with the earlier outcome's reference) or SKIPPED.
+        """
+        key_function = key_function or self.idempotency_key
+        outcomes = [None] * len(payments)
+        slots = threading.BoundedSemaphore(self.__max_pending)
+        futures = []
+        with ThreadPoolExecutor(self.__max_workers, thread_name_prefix="PaymentProcessor") as pool:
+            for index, payment in enumerate(payments):
+                key = key_function(payment)
+                earlier = self.__claim(key, payment.get_payment_status() == "Pending")
+                if earlier is not None:
+                    outcomes[index] = {"payment_id": payment.get_payment_id(), "idempotency_key": key,
+                                       "status": earlier["status"], "reference": earlier.get("reference")}
+                    continue
+                slots.acquire()
+                future = pool.submit(self.__charge, payment, key)
+                future.add_done_callback(lambda _: slots.release())
+                futures.append((index, future))
+        for index, future in futures:
+            outcomes[index] = future.result()
+        return outcomes
+
+    @staticmethod
+    def summarize(outcomes: list, elapsed: float) -> dict:
+        """
+        Summarizes a batch: counts per status, p50/p99 gateway latency and throughput.
+
+        :param outcomes: The outcomes returned by process_batch.
+        :param elapsed: The wall-clock seconds the batch took.
+        """
+        counts = {}
+        for outcome in outcomes:
+            counts[outcome["status"]] = counts.get(outcome["status"], 0) + 1
+        latencies = sorted(outcome["latency"] for outcome in outcomes if "latency" in outcome)
+        summary = {"payments": len(outcomes), **counts}
+        if latencies:
+            summary["p50_ms"] = round(latencies[len(latencies) // 2] * 1000, 2)
+            summary["p99_ms"] = round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000, 2)
+        summary["payments_per_second"] = round(len(latencies) / elapsed) if elapsed > 0 else 0
+        return summary
+
+    def __str__(self) -> str:
+        """Returns a string representation of the PaymentProcessor object."""
+        return f"PaymentProcessor(Workers: {self.__max_workers}, Keys: {len(self.__outcomes)})"
+
+
+def benchmark_batch(payments: int = 5_000, worker_counts: tuple = (1, 8, 32), latency: float = 0.002) -> list:
+    """
+    Charges batches of pending payments against a MockGateway with different pool sizes.
+
+    Every tenth payment appears twice in the batch, to exercise the idempotency keys.
+
+    :param payments: The number of distinct payments per batch.
+    :param worker_counts: The pool sizes to measure.
+    :param latency: The mock gateway's average delay in seconds.
+    :return: One summary dict per pool size, plus the number of gateway charges made.
+    """
+    from Payment import Payment
+
+    results = []
+    for workers in worker_counts:
+        batch = [Payment(i, None, 100 + i % 400, "Credit Card") for i in range(payments)]
+        batch += batch[::10]
+        gateway = MockGateway(latency=latency, seed=workers)
+        processor = PaymentProcessor(gateway, max_workers=workers)
+        started = time.perf_counter()
+        outcomes = processor.process_batch(batch)
+        summary = processor.summarize(outcomes, time.perf_counter() - started)
+        summary["workers"] = workers
+        summary["gateway_charges"] = gateway.get_charge_count()
+        results.append(summary)
+    return results
+
+
+# Example Usage
+if __name__ == "__main__":
+    from Payment import Payment
+
+    processor = PaymentProcessor(MockGateway(decline_rate=0.0, seed=1), max_workers=4)
+    payment1 = Payment(5001, None, 600.0, "Credit Card")
+    outcomes = processor.process_batch([payment1, payment1])
+    print([outcome["status"] for outcome in outcomes])  # Output: ['Completed', 'Duplicate']
+    print(payment1.get_payment_status())  # Output: Completed
+
+    for row in benchmark_batch(2_000):
+        print(row)
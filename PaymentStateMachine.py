@@ -0,0 +1,216 @@
+# PaymentStateMachine module
+import threading
+import time
+from collections import deque
+from itertools import count
+
+
+# Payment states as small integers; STATE_NAMES[code] is the status string callers see
+PENDING, COMPLETED, REFUNDED, FAILED = range(4)
+STATE_NAMES = ("Pending", "Completed", "Refunded", "Failed")
+STATE_CODES = {name: code for code, name in enumerate(STATE_NAMES)}
+
+# TRANSITIONS[from_state] is a bitmask of the states it may move to
+TRANSITIONS = (
+    1 << COMPLETED | 1 << FAILED,  # Pending: charged or declined
+    1 << REFUNDED,  # Completed: refunded
+    0,  # Refunded: final
+    1 << PENDING,  # Failed: retried
+)
+
+
+def to_state(status: str) -> int:
+    """
+    Returns the state code of a status string.
+
+    :raises ValueError: If the status is not one of STATE_NAMES.
+    """
+    code = STATE_CODES.get(status)
+    if code is None:
+        raise ValueError(f"Unknown payment status: {status!r} (expected one of {', '.join(STATE_NAMES)})")
+    return code
+
+
+def can_transition(from_state: int, to_state: int) -> bool:
+    """Checks whether the transition table allows moving from one state to another."""
+    return bool(TRANSITIONS[from_state] >> to_state & 1)
+
+
+class TransitionAudit:
+    """
+    An append-only ring buffer of payment state transitions.
+
+    Recording is a single deque append, which is atomic, so transitions never wait on a lock
+    or on disk. Callers record a transition while they still hold the lock that made it, so
+    the records of one payment are in the order its transitions happened; records of different
+    payments may interleave. Memory is bounded by capacity: if the buffer is not drained in time the oldest
+    records are overwritten and counted as dropped. drain writes records out, and start_draining
+    does so from a background thread.
+    """
+
+    def __init__(self, capacity: int = 65_536):
+        """
+        Initializes an empty TransitionAudit.
+
+        :param capacity: The most records held in memory.
+        """
+        self.__records = deque(maxlen=capacity)
+        self.__sequence = count()  # next() on a count is atomic, so no lock is needed
+        self.__drained = 0
+        self.__last_drained = -1  # Sequence number of the last record drained
+        self.__drainer = None
+        self.__stop = threading.Event()
+        self.__drain_lock = threading.Lock()  # Only one drain runs at a time
+
+    def record(self, payment_id: int, from_state: int, to_state: int) -> None:
+        """Appends a (sequence, time, payment_id, from_state, to_state) record."""
+        self.__records.append((next(self.__sequence), time.time(), payment_id, from_state, to_state))
+
+    def get_records(self) -> list:
+        """Returns the records still in memory, oldest first."""
+        return list(self.__records)
+
+    def get_dropped(self) -> int:
+        """
+        Returns how many records were overwritten before they were drained.
+
+        Records of different payments can be appended slightly out of sequence order, so this
+        scans the buffer for the highest sequence number instead of trusting the last record.
+        """
+        records = list(self.__records)
+        recorded = max((record[0] for record in records), default=self.__last_drained) + 1
+        return max(0, recorded - self.__drained - len(records))
+
+    def drain(self, stream) -> int:
+        """
+        Writes every record in memory to a text stream as tab-separated lines and removes it.
+
+        Each line starts with the record's sequence number, so records lost to overwriting show
+        up as gaps in the log.
+
+        :param stream: The text stream to append to.
+        :return: The number of records written.
+        """
+        with self.__drain_lock:
+            lines = []
+            records = self.__records
+            while records:
+                try:
+                    sequence, recorded_at, payment_id, from_state, to_state = records.popleft()
+                except IndexError:
+                    break
+                self.__last_drained = max(self.__last_drained, sequence)
+                lines.append(f"{sequence}\t{recorded_at:.6f}\t{payment_id}\t{STATE_NAMES[from_state]}\t{STATE_NAMES[to_state]}\n")
+            if lines:
+                stream.write("".join(lines))
+                stream.flush()
+            self.__drained += len(lines)
+            return len(lines)
+
+    def start_draining(self, path: str, interval: float = 1.0) -> None:
+        """
+        Starts a background thread that appends the records to a file every interval seconds.
+
+        :param path: The audit log file.
+        :param interval: Seconds between drains.
+        """
+        if self.__drainer is not None:
+            return
+        self.__stop.clear()
+
+        def run() -> None:
+            with open(path, "a", encoding="utf-8") as log:
+                while not self.__stop.wait(interval):
+                    self.drain(log)
+                self.drain(log)
+
+        self.__drainer = threading.Thread(target=run, name="TransitionAudit", daemon=True)
+        self.__drainer.start()
+
+    def stop_draining(self) -> None:
+        """Stops the background thread after a final drain."""
+        if self.__drainer is not None:
+            self.__stop.set()
+            self.__drainer.join()
+            self.__drainer = None
+
+    def __len__(self) -> int:
+        """Returns the number of records in memory."""
+        return len(self.__records)
+
+    def __str__(self) -> str:
+        """Returns a string representation of the TransitionAudit object."""
+        return f"TransitionAudit(In memory: {len(self.__records)}, Drained: {self.__drained})"
+
+
+def benchmark_contention(payments: int = 20_000, threads: int = 8) -> dict:
+    """
+    Has several worker threads race to process, fail and refund the same payments.
+
+    :param payments: The number of pending payments.
+    :param threads: The number of racing threads.
+    :return: Transitions per second, whether every payment was processed or failed exactly once,
+        whether each payment's audit records chain in order, and how many records were written
+        and dropped.
+    """
+    import io
+
+    from NotificationSink import NotificationSink
+    from Payment import Payment
+
+    previous_sink, previous_audit = Payment.get_default_sink(), Payment.get_transition_audit()
+    Payment.set_default_sink(NotificationSink())  # Time the transitions, not the console
+    audit = TransitionAudit(capacity=payments * 2)
+    Payment.set_transition_audit(audit)
+    batch = [Payment(i, None, 100, "Credit Card") for i in range(payments)]
+    wins = [0] * threads
+
+    def worker(index: int) -> None:
+        won = 0
+        for payment in batch:
+            if index % 2 == 0:
+                won += payment.process_payment()
+            else:
+                won += payment.record_failed_transaction()
+            payment.refund_payment()
+        wins[index] = won
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    started = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    Payment.set_default_sink(previous_sink)
+    Payment.set_transition_audit(previous_audit)
+    recorded = len(audit)
+    states = {}
+    in_order = True
+    for _, _, payment_id, from_state, to_state in audit.get_records():
+        in_order = in_order and states.get(payment_id, PENDING) == from_state
+        states[payment_id] = to_state
+    audit.drain(io.StringIO())
+    return {
+        "threads": threads,
+        "attempts_per_second": round(payments * threads * 2 / elapsed),
+        "exactly_once": sum(wins) == payments,
+        "audit_in_order": in_order,
+        "audit_records": recorded,
+        "dropped": audit.get_dropped(),
+    }
+
+
+# Example Usage
+if __name__ == "__main__":
+    import sys
+
+    print(can_transition(PENDING, COMPLETED), can_transition(REFUNDED, PENDING))  # Output: True False
+
+    audit = TransitionAudit(capacity=2)
+    for payment_id in (5001, 5002, 5003):
+        audit.record(payment_id, PENDING, COMPLETED)
+    print(audit.get_dropped())  # Output: 1
+    audit.drain(sys.stdout)  # Output: two lines for payments 5002 and 5003
+
+    print(benchmark_contention())
@@ -0,0 +1,188 @@
+# PricingEngine class
+from array import array
+from bisect import bisect_right
+
+from AmenityRegistry import AMENITIES
+from RoomCalendar import to_ordinal
+
+
+class DiscountRule:
+    """
+    A discount percentage that applies to rooms matching a room type, an amenity and/or a date range.
+    """
+
+    def __init__(self, discount: float, room_type: str = None, amenity: str = None, start_date: str = None, end_date: str = None):
+        """
+        Initializes a DiscountRule. Criteria left as None match everything.
+
+        :param discount: The discount percentage (0-100).
+        :param room_type: Only rooms of this type are discounted.
+        :param amenity: Only rooms offering this amenity are discounted.
+        :param start_date: The first night discounted, in YYYY-MM-DD format.
+        :param end_date: The first night no longer discounted, in YYYY-MM-DD format.
+        """
+        self.__discount = discount
+        self.__room_type = room_type
+        self.__amenity = amenity
+        self.__start = None if start_date is None else to_ordinal(start_date)
+        self.__end = None if end_date is None else to_ordinal(end_date)
+
+    def get_discount(self) -> float:
+        """Returns the discount percentage."""
+        return self.__discount
+
+    def get_start(self) -> int:
+        """Returns the ordinal of the first discounted night, or None."""
+        return self.__start
+
+    def get_end(self) -> int:
+        """Returns the ordinal of the first night after the discount, or None."""
+        return self.__end
+
+    def matches_room(self, room_type: str, amenity_mask: int) -> bool:
+        """Checks whether the rule applies to a room with the given type and amenity mask."""
+        if self.__room_type is not None and room_type != self.__room_type:
+            return False
+        if self.__amenity is not None:
+            bit = AMENITIES.get_bit(self.__amenity)
+            return bit >= 0 and bool(amenity_mask >> bit & 1)
+        return True
+
+    def covers(self, day: int) -> bool:
+        """Checks whether the rule applies to the night starting on the given day ordinal."""
+        if self.__start is not None and day < self.__start:
+            return False
+        return self.__end is None or day < self.__end
+
+    def __str__(self) -> str:
+        """Returns a string representation of the DiscountRule object."""
+        return f"DiscountRule({self.__discount}%, Type: {self.__room_type}, Amenity: {self.__amenity}, Dates: {self.__start}-{self.__end})"
+
+
+class PricingEngine:
+    """
+    Applies a set of discount rules to whole price columns and quotes batches of bookings.
+
+    When several rules match a room on a night, the largest discount wins. Rooms sharing
+    a room type and amenity mask always get the same discount, so the rules are evaluated
+    once per distinct (type, amenities) combination rather than once per room.
+    """
+
+    def __init__(self, rules: list = None):
+        """
+        Initializes a PricingEngine.
+
+        :param rules: The DiscountRule objects to apply.
+        """
+        self.__rules = list(rules or [])
+
+    def add_rule(self, rule: DiscountRule) -> None:
+        """Adds a discount rule."""
+        self.__rules.append(rule)
+
+    def remove_rule(self, rule: DiscountRule) -> None:
+        """Removes a discount rule."""
+        if rule in self.__rules:
+            self.__rules.remove(rule)
+
+    def get_rules(self) -> list:
+        """Returns the list of discount rules."""
+        return self.__rules
+
+    def best_discount(self, room_type: str, amenity_mask: int, day: int = None) -> float:
+        """
+        Returns the largest discount that applies to a room.
+
+        :param room_type: The room type.
+        :param amenity_mask: The room's amenity bitmask.
+        :param day: The night to price as a day ordinal, or None to use only undated rules.
+        """
+        best = 0
+        for rule in self.__rules:
+            dated = rule.get_start() is not None or rule.get_end() is not None
+            if (day is None and dated) or (day is not None and not rule.covers(day)):
+                continue
+            if rule.get_discount() > best and rule.matches_room(room_type, amenity_mask):
+                best = rule.get_discount()
+        return best
+
+    def discounted_prices(self, table: "RoomTable", date: str = None) -> array:
+        """
+        Calculates the discounted price of every room in a RoomTable in one pass.
+
+        :param table: The RoomTable to price.
+        :param date: The night to price in YYYY-MM-DD format, or None to use only undated rules.
+        :return: Discounted prices aligned with the table's rows.
+        """
+        day = None if date is None else to_ordinal(date)
+        keys = list(zip(table.get_type_codes(), table.get_amenity_masks()))
+        factors = {}
+        for key in set(keys):
+            factors[key] = 1 - self.best_discount(table.get_type_name(key[0]), key[1], day) / 100
+        return array("d", [price * factors[key] for price, key in zip(table.get_prices(), keys)])
+
+    def reprice(self, table: "RoomTable", date: str = None) -> None:
+        """
+        Writes the discounted prices back into a RoomTable's price column.
+
+        :param table: The RoomTable to reprice.
+        :param date: The night to price in YYYY-MM-DD format, or None to use only undated rules.
+        """
+        table.get_prices()[:] = self.discounted_prices(table, date)
+
+    def quote_bookings(self, bookings: list) -> list:
+        """
+        Quotes the total cost of many bookings at once.
+
+        Each stay is split at the start and end dates of the dated rules, and every piece
+        is priced with the same formula as Room.calculate_discounted_price. A booking's own
+        discount (see Booking.apply_discount) takes part like any other rule.
+
+        :param bookings: The Booking objects to quote.
+        :return: The total cost of each booking, in the same order.
+        """
+        boundaries = sorted({day for rule in self.__rules for day in (rule.get_start(), rule.get_end()) if day is not None})
+        segment_discounts = {}  # (room_type, amenity_mask, segment) -> best rule discount
+        totals = []
+        for booking in bookings:
+            room = booking.get_room()
+            room_type, amenity_mask, price = room.get_room_type(), room.get_amenity_mask(), room.get_price()
+            start, end = booking.get_check_in_day(), booking.get_check_out_day()
+            own_discount = booking.get_discount()
+            total = 0.0
+            segment = bisect_right(boundaries, start)
+            day = start
+            while day < end:
+                segment_end = boundaries[segment] if segment < len(boundaries) and boundaries[segment] < end else end
+                key = (room_type, amenity_mask, segment)
+                discount = segment_discounts.get(key)
+                if discount is None:
+                    discount = self.best_discount(room_type, amenity_mask, day)
+                    segment_discounts[key] = discount
+                total += (segment_end - day) * (price * (1 - max(discount, own_discount) / 100))
+                day = segment_end
+                segment += 1
+            totals.append(total)
+        return totals
+
+    def __str__(self) -> str:
+        """Returns a string representation of the PricingEngine object."""
+        return f"PricingEngine(Rules: {len(self.__rules)})"
+
+
+# Example Usage
+if __name__ == "__main__":
+    from RoomTable import RoomTable
+
+    table = RoomTable()
+    table.add_room(101, "Suite", ["Wi-Fi", "TV", "Jacuzzi"], 300.0)
+    table.add_room(102, "Deluxe", ["Wi-Fi", "TV"], 150.0)
+    table.add_room(103, "Suite", ["Wi-Fi", "Mini-Bar"], 250.0)
+
+    engine = PricingEngine([DiscountRule(10, room_type="Suite"), DiscountRule(20, amenity="Jacuzzi")])
+    print(list(engine.discounted_prices(table)))  # Output: [240.0, 150.0, 225.0]
+
+    # A summer rule on top, for nights from 2025-07-01 to 2025-07-31
+    engine.add_rule(DiscountRule(25, start_date="2025-07-01", end_date="2025-08-01"))
+    print(list(engine.discounted_prices(table, "2025-07-15")))  # Output: [225.0, 112.5, 187.5]
+    print(engine)  # Output: PricingEngine(Rules: 3)
@@ -0,0 +1,129 @@
+# RateCalendar class
+from array import array
+from itertools import accumulate
+
+from RoomCalendar import to_ordinal
+
+
+class RateCalendar:
+    """
+    Stores a nightly rate for every day of a planning horizon, per room type or per room.
+
+    Rates are kept in whole cents in a dense array per key, alongside a prefix-sum array,
+    so the cost of any stay is the difference of two prefix sums no matter how long it is.
+    Prefix sums are rebuilt lazily, once per key after a batch of rate changes.
+    """
+
+    def __init__(self, start_date: str, days: int = 730):
+        """
+        Initializes a RateCalendar.
+
+        :param start_date: The first night covered, in YYYY-MM-DD format.
+        :param days: The number of nights covered.
+        """
+        self.__origin = to_ordinal(start_date)
+        self.__days = days
+        self.__rates = {}  # key -> array of nightly rates in cents
+        self.__prefix = {}  # key -> array of running totals in cents, rebuilt when stale
+
+    @staticmethod
+    def __to_cents(price: float) -> int:
+        return round(price * 100)
+
+    def __day_range(self, start_date, end_date) -> tuple:
+        """Returns the [first, last) day offsets of a date range, clipped to the horizon."""
+        first = min(max(to_ordinal(start_date) - self.__origin, 0), self.__days)
+        last = min(max(to_ordinal(end_date) - self.__origin, first), self.__days)
+        return first, last
+
+    def has_rates(self, key) -> bool:
+        """Checks whether the calendar holds rates for a room type or room number."""
+        return key in self.__rates
+
+    def set_base_rate(self, key, price: float) -> None:
+        """
+        Sets the same nightly rate on every day of the horizon.
+
+        :param key: A room type or room number.
+        :param price: The nightly rate.
+        """
+        self.__rates[key] = array("q", [self.__to_cents(price)]) * self.__days
+        self.__prefix.pop(key, None)
+
+    def set_rate(self, key, start_date: str, end_date: str, price: float) -> int:
+        """
+        Sets the nightly rate for a date range.
+
+        :param key: A room type or room number. It must have a base rate first.
+        :param start_date: The first night with the new rate, in YYYY-MM-DD format.
+        :param end_date: The first night after the new rate, in YYYY-MM-DD format.
+        :param price: The nightly rate.
+        :return: The number of nights updated inside the horizon.
+        """
+        rates = self.__rates.get(key)
+        if rates is None:
+            return 0
+        first, last = self.__day_range(start_date, end_date)
+        rates[first:last] = array("q", [self.__to_cents(price)]) * (last - first)
+        self.__prefix.pop(key, None)
+        return last - first
+
+    def get_rate(self, key, date: str) -> float:
+        """Returns the nightly rate of a key on a date, or None if it is not covered."""
+        rates = self.__rates.get(key)
+        offset = to_ordinal(date) - self.__origin
+        if rates is None or not 0 <= offset < self.__days:
+            return None
+        return rates[offset] / 100
+
+    def __prefix_sums(self, key) -> array:
+        prefix = self.__prefix.get(key)
+        if prefix is None:
+            prefix = array("q", accumulate(self.__rates[key], initial=0))
+            self.__prefix[key] = prefix
+        return prefix
+
+    def quote(self, key, check_in, check_out, fallback_price: float = 0.0) -> float:
+        """
+        Returns the total rate for a stay in O(1).
+
+        :param key: A room type or room number.
+        :param check_in: The first night of the stay.
+        :param check_out: The check-out day (exclusive).
+        :param fallback_price: The nightly rate used for nights outside the horizon or keys without rates.
+        :return: The total cost of the stay.
+        """
+        start, end = to_ordinal(check_in), to_ordinal(check_out)
+        nights = max(end - start, 0)
+        if key not in self.__rates:
+            return nights * fallback_price
+        first, last = self.__day_range(start, end)
+        prefix = self.__prefix_sums(key)
+        covered = prefix[last] - prefix[first]
+        return covered / 100 + (nights - (last - first)) * fallback_price
+
+    def quote_many(self, key, stays: list, fallback_price: float = 0.0) -> list:
+        """
+        Returns the total rate of many stays for the same key.
+
+        :param key: A room type or room number.
+        :param stays: (check_in, check_out) pairs.
+        :param fallback_price: The nightly rate used for nights outside the horizon.
+        """
+        return [self.quote(key, check_in, check_out, fallback_price) for check_in, check_out in stays]
+
+    def __str__(self) -> str:
+        """Returns a string representation of the RateCalendar object."""
+        return f"RateCalendar(Keys: {len(self.__rates)}, Days: {self.__days})"
+
+
+# Example Usage
+if __name__ == "__main__":
+    rates = RateCalendar("2025-01-01", 365)
+    rates.set_base_rate("Suite", 150.0)
+    rates.set_rate("Suite", "2025-07-04", "2025-07-06", 220.0)  # Holiday weekend
+
+    print(rates.get_rate("Suite", "2025-07-04"))  # Output: 220.0
+    print(rates.quote("Suite", "2025-07-01", "2025-07-05"))  # Output: 670.0
+    print(rates.quote("Deluxe", "2025-07-01", "2025-07-05", 120.0))  # Output: 480.0
+    print(rates)  # Output: RateCalendar(Keys: 1, Days: 365)
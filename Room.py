@@ -1,3 +1,6 @@
+from AmenityRegistry import AMENITIES
+from RoomCalendar import to_ordinal
+
 
 #Room Class
 class Room:
@@ -12,15 +15,18 @@ class Room:
         Parameters:
         - room_number (int): Unique number assigned to the room.
         - room_type (str): Type of room (e.g., Single, Double, Suite).
-        - amenities (list): List of amenities available in the room.
+        - amenities (list): List of amenities available in the room, stored as a bitmask.
         - price_per_night (float): Cost of staying per night.
         - availability_status (bool): Whether the room is available (default: True).
         """
         self.__room_number = room_number
         self.__room_type = room_type
-        self.__amenities = amenities  # List of amenities like Wi-Fi, AC, TV, etc.
+        self.__amenity_mask = AMENITIES.to_mask(amenities)  # Bitmask of amenities like Wi-Fi, AC, TV, etc.
         self.__price_per_night = price_per_night
         self.__availability_status = availability_status  # True if the room is available, False otherwise.
+        self.__calendar = None  # RoomCalendar holding the room's date-range bookings, if any.
+        self.__inventory = None  # RoomInventory indexing this room, if any.
+        self.__watchers = ()  # Objects told when the room number changes (e.g., a BookingStore).
 
     # Getter and Setter for room_number
     def get_room_number(self) -> int:
@@ -28,8 +34,50 @@ class Room:
         return self.__room_number
 
     def set_room_number(self, room_number: int) -> None:
-        """Sets a new room number."""
+        """
+        Sets a new room number, moving the room's calendar holds to it.
+
+        The inventory and every watcher are told. If one of them rejects the new number,
+        those already told are moved back and the room keeps its old number.
+
+        Raises:
+        - ValueError: If the calendar already has holds under the new number, or the
+          inventory or a watcher already has another room with it.
+        """
+        old_room_number = self.__room_number
+        if room_number == old_room_number:
+            return
+        if self.__calendar is not None and not self.__calendar.rename_room(old_room_number, room_number):
+            raise ValueError(f"Room {room_number} already has holds in the calendar.")
         self.__room_number = room_number
+        notified = []
+        try:
+            for watcher in self.__get_number_watchers():
+                watcher.on_room_number_changed(self, old_room_number)
+                notified.append(watcher)
+        except ValueError:
+            self.__room_number = old_room_number
+            for watcher in reversed(notified):
+                watcher.on_room_number_changed(self, room_number)
+            if self.__calendar is not None:
+                self.__calendar.rename_room(room_number, old_room_number)
+            raise
+
+    def __get_number_watchers(self) -> tuple:
+        """Returns everything told about room number changes: the inventory first, then the watchers."""
+        if self.__inventory is None:
+            return self.__watchers
+        return (self.__inventory,) + self.__watchers
+
+    # Watchers of the room number
+    def add_watcher(self, watcher) -> None:
+        """Registers an object whose on_room_number_changed(room, old_room_number) is called when the room number changes."""
+        if watcher not in self.__watchers:
+            self.__watchers += (watcher,)
+
+    def remove_watcher(self, watcher) -> None:
+        """Stops telling an object about room number changes."""
+        self.__watchers = tuple(other for other in self.__watchers if other is not watcher)
 
     # Getter and Setter for room_type
     def get_room_type(self) -> str:
@@ -38,22 +86,39 @@ class Room:
 
     def set_room_type(self, room_type: str) -> None:
         """Updates the room type."""
+        old_room_type = self.__room_type
         self.__room_type = room_type
+        if self.__inventory is not None:
+            self.__inventory.on_room_type_changed(self, old_room_type)
 
     # Getter and Setter for amenities
     def get_amenities(self) -> list:
         """Returns the list of amenities available in the room."""
-        return self.__amenities
+        return AMENITIES.to_names(self.__amenity_mask)
+
+    def get_amenity_mask(self) -> int:
+        """Returns the room's amenities encoded as a bitmask of the shared amenity registry."""
+        return self.__amenity_mask
+
+    def has_amenity(self, amenity: str) -> bool:
+        """Checks whether the room offers an amenity."""
+        bit = AMENITIES.get_bit(amenity)
+        return bit >= 0 and bool(self.__amenity_mask >> bit & 1)
 
     def add_amenity(self, amenity: str) -> None:
         """Adds a new amenity to the room if it's not already present."""
-        if amenity not in self.__amenities:
-            self.__amenities.append(amenity)
+        bit = 1 << AMENITIES.intern(amenity)
+        if not self.__amenity_mask & bit:
+            self.__amenity_mask |= bit
+            if self.__inventory is not None:
+                self.__inventory.on_amenity_added(self, amenity)
 
     def remove_amenity(self, amenity: str) -> None:
         """Removes an existing amenity from the room."""
-        if amenity in self.__amenities:
-            self.__amenities.remove(amenity)
+        if self.has_amenity(amenity):
+            self.__amenity_mask &= ~(1 << AMENITIES.get_bit(amenity))
+            if self.__inventory is not None:
+                self.__inventory.on_amenity_removed(self, amenity)
 
     # Getter and Setter for price_per_night
     def get_price(self) -> float:
@@ -62,7 +127,10 @@ class Room:
 
     def update_price(self, new_price: float) -> None:
         """Updates the price per night of the room."""
+        old_price = self.__price_per_night
         self.__price_per_night = new_price
+        if self.__inventory is not None:
+            self.__inventory.on_price_changed(self, old_price)
 
     # Getter and Setter for availability_status
     def check_availability(self) -> bool:
@@ -77,9 +145,58 @@ class Room:
         """Marks the room as available when a guest checks out."""
         self.__availability_status = True
 
-    def schedule_maintenance(self, date: str) -> None:
-        """Marks the room as unavailable due to scheduled maintenance."""
+    def schedule_maintenance(self, date: str) -> bool:
+        """
+        Marks the room as unavailable due to scheduled maintenance.
+
+        If the room has a calendar, the maintenance day is also blocked there
+        so no booking can be placed over it.
+
+        Returns:
+        - bool: False if a booking already holds that day, in which case nothing changes.
+        """
+        if self.__calendar is not None:
+            day = to_ordinal(date)
+            if not self.__calendar.reserve(self.__room_number, day, day + 1, ("maintenance", self.__room_number, day)):
+                return False
         self.__availability_status = False
+        return True
+
+    # Getter and Setter for calendar
+    def get_calendar(self) -> "RoomCalendar":
+        """Returns the RoomCalendar tracking this room's bookings, or None."""
+        return self.__calendar
+
+    def set_calendar(self, calendar: "RoomCalendar") -> None:
+        """Attaches the room to a RoomCalendar so bookings can be tracked by date range."""
+        self.__calendar = calendar
+        if calendar is not None:
+            calendar.add_room(self.__room_number)
+
+    # Getter and Setter for inventory
+    def get_inventory(self) -> "RoomInventory":
+        """Returns the RoomInventory indexing this room, or None."""
+        return self.__inventory
+
+    def set_inventory(self, inventory: "RoomInventory") -> None:
+        """Links the room to the RoomInventory that indexes it (called by RoomInventory.add_room)."""
+        self.__inventory = inventory
+
+    def is_available_for(self, check_in_date: str, check_out_date: str) -> bool:
+        """
+        Checks whether the room is free for a date range.
+
+        Parameters:
+        - check_in_date (str): The first night of the stay in YYYY-MM-DD format.
+        - check_out_date (str): The check-out date in YYYY-MM-DD format.
+
+        Returns:
+        - bool: True if no booking or maintenance overlaps the range. Rooms without
+          a calendar fall back to the availability status.
+        """
+        if self.__calendar is None:
+            return self.__availability_status
+        return self.__calendar.is_available(self.__room_number, check_in_date, check_out_date)
 
     def calculate_discounted_price(self, discount: float) -> float:
         """
@@ -98,7 +215,7 @@ class Room:
         return {
             "room_number": self.__room_number,
             "room_type": self.__room_type,
-            "amenities": self.__amenities,
+            "amenities": self.get_amenities(),
             "price_per_night": self.__price_per_night,
             "availability_status": self.__availability_status
         }
@@ -112,21 +229,22 @@ class Room:
 
 
 # Example Usage
-room1 = Room(101, "Suite", ["Wi-Fi", "TV", "Mini-Bar"], 150.0)
-
-# Testing Getter Methods
-print(room1.get_room_number())  # Output: 101
-print(room1.get_room_type())  # Output: Suite
-print(room1.get_amenities())  # Output: ['Wi-Fi', 'TV', 'Mini-Bar']
-print(room1.get_price())  # Output: 150.0
-print(room1.check_availability())  # Output: True
-
-# Testing Setter Methods
-room1.set_room_number(202)
-room1.set_room_type("Deluxe Suite")
-room1.add_amenity("Jacuzzi")
-room1.update_price(200.0)
-room1.update_status(False)  # Mark room as occupied
-
-# Printing Updated Room Info
-print(room1)  # Output: Room 202: Deluxe Suite, Price: $200.0/night, Status: Occupied
+if __name__ == "__main__":
+    room1 = Room(101, "Suite", ["Wi-Fi", "TV", "Mini-Bar"], 150.0)
+
+    # Testing Getter Methods
+    print(room1.get_room_number())  # Output: 101
+    print(room1.get_room_type())  # Output: Suite
+    print(room1.get_amenities())  # Output: ['Wi-Fi', 'TV', 'Mini-Bar']
+    print(room1.get_price())  # Output: 150.0
+    print(room1.check_availability())  # Output: True
+
+    # Testing Setter Methods
+    room1.set_room_number(202)
+    room1.set_room_type("Deluxe Suite")
+    room1.add_amenity("Jacuzzi")
+    room1.update_price(200.0)
+    room1.update_status(False)  # Mark room as occupied
+
+    # Printing Updated Room Info
+    print(room1)  # Output: Room 202: Deluxe Suite, Price: $200.0/night, Status: Occupied
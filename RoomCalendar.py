@@ -0,0 +1,289 @@
+# RoomCalendar class
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import date
+
+
+def to_ordinal(day) -> int:
+    """
+    Converts a date given as "YYYY-MM-DD", a date object or a day ordinal into a day ordinal.
+
+    :param day: The date to convert.
+    :return: The proleptic Gregorian ordinal of the date.
+    """
+    if isinstance(day, int):
+        return day
+    if isinstance(day, date):
+        return day.toordinal()
+    return date.fromisoformat(day).toordinal()
+
+
+class RoomCalendar:
+    """
+    Tracks which date ranges each room is held for, using one sorted interval list per room.
+
+    Every hold is a half-open range [check_in, check_out) so a guest can check in on the
+    day the previous guest checks out. Holds in the same room never overlap, which keeps
+    both the start and end lists sorted and lets every lookup use binary search.
+
+    A hold is spread over several parallel lists, so every public method runs under the calendar's
+    own lock. One calendar can therefore be shared by threads working on different rooms, such as
+    AllocationService's lock stripes, without relying on the GIL.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty RoomCalendar.
+        """
+        self.__starts = {}  # room_number -> sorted list of start ordinals
+        self.__ends = {}  # room_number -> end ordinals, aligned with starts
+        self.__holders = {}  # room_number -> booking IDs, aligned with starts
+        self.__holds = {}  # booking_id -> (room_number, start, end)
+        self.__lock = threading.RLock()  # Reentrant: move and rename_room call other locked methods
+
+    def add_room(self, room_number: int) -> None:
+        """
+        Registers a room with an empty calendar.
+
+        :param room_number: The number of the room to register.
+        """
+        with self.__lock:
+            if room_number not in self.__starts:
+                self.__starts[room_number] = []
+                self.__ends[room_number] = []
+                self.__holders[room_number] = []
+
+    def remove_room(self, room_number: int) -> None:
+        """
+        Removes a room and all of its holds from the calendar.
+
+        :param room_number: The number of the room to remove.
+        """
+        with self.__lock:
+            for booking_id in self.__holders.pop(room_number, []):
+                del self.__holds[booking_id]
+            self.__starts.pop(room_number, None)
+            self.__ends.pop(room_number, None)
+
+    def get_rooms(self) -> list:
+        """Returns the numbers of all rooms tracked by the calendar."""
+        with self.__lock:
+            return list(self.__starts)
+
+    def __find_slot(self, room_number: int, start: int, end: int) -> int:
+        """
+        Returns the index where a hold for [start, end) would be inserted, or -1 if it overlaps an existing hold.
+        """
+        starts = self.__starts[room_number]
+        index = bisect_left(starts, end)
+        if index > 0 and self.__ends[room_number][index - 1] > start:
+            return -1
+        return index
+
+    def is_available(self, room_number: int, check_in, check_out) -> bool:
+        """
+        Checks whether a room is free for the whole date range in O(log n).
+
+        :param room_number: The number of the room to check.
+        :param check_in: The first night of the range.
+        :param check_out: The day the range ends (exclusive).
+        :return: True if no hold overlaps the range, False otherwise.
+        """
+        with self.__lock:
+            if room_number not in self.__starts:
+                return False
+            start, end = to_ordinal(check_in), to_ordinal(check_out)
+            return start < end and self.__find_slot(room_number, start, end) >= 0
+
+    def get_overlapping(self, room_number: int, check_in, check_out) -> list:
+        """
+        Returns the IDs of the holds in a room that overlap the given date range.
+
+        :param room_number: The number of the room to check.
+        :param check_in: The first night of the range.
+        :param check_out: The day the range ends (exclusive).
+        :return: Booking IDs in chronological order.
+        """
+        with self.__lock:
+            if room_number not in self.__starts:
+                return []
+            start, end = to_ordinal(check_in), to_ordinal(check_out)
+            ends = self.__ends[room_number]
+            first = bisect_right(ends, start)
+            last = bisect_left(self.__starts[room_number], end)
+            return self.__holders[room_number][first:last]
+
+    def find_conflict(self, room_number: int, check_in, check_out, ignore_booking_id=None):
+        """
+        Returns the ID of a hold in a room that overlaps the given date range, in O(log n).
+
+        Holds never overlap each other, so only the last one or two holds starting before
+        the range ends can clash with it.
+
+        :param room_number: The number of the room to check.
+        :param check_in: The first night of the range.
+        :param check_out: The day the range ends (exclusive).
+        :param ignore_booking_id: A booking whose own hold should not count as a conflict.
+        :return: The conflicting booking ID, or None if the range is free.
+        """
+        with self.__lock:
+            if room_number not in self.__starts:
+                return None
+            start, end = to_ordinal(check_in), to_ordinal(check_out)
+            index = bisect_left(self.__starts[room_number], end) - 1
+            while index >= 0 and self.__ends[room_number][index] > start:
+                holder = self.__holders[room_number][index]
+                if holder != ignore_booking_id:
+                    return holder
+                index -= 1
+            return None
+
+    def get_free_rooms(self, check_in, check_out) -> list:
+        """
+        Returns the numbers of all rooms free for the whole date range.
+
+        Each room is checked in O(log n), where n is the number of holds in that room.
+
+        :param check_in: The first night of the range.
+        :param check_out: The day the range ends (exclusive).
+        """
+        with self.__lock:
+            start, end = to_ordinal(check_in), to_ordinal(check_out)
+            if start >= end:
+                return []
+            return [room_number for room_number in self.__starts if self.__find_slot(room_number, start, end) >= 0]
+
+    def reserve(self, room_number: int, check_in, check_out, booking_id) -> bool:
+        """
+        Holds a room for a date range on behalf of a booking.
+
+        :param room_number: The number of the room to hold.
+        :param check_in: The first night of the stay.
+        :param check_out: The check-out day (exclusive).
+        :param booking_id: The ID of the booking taking the hold.
+        :return: True if the hold was taken, False if the range is invalid or already taken.
+        """
+        with self.__lock:
+            start, end = to_ordinal(check_in), to_ordinal(check_out)
+            if start >= end or booking_id in self.__holds:
+                return False
+            self.add_room(room_number)
+            index = self.__find_slot(room_number, start, end)
+            if index < 0:
+                return False
+            self.__starts[room_number].insert(index, start)
+            self.__ends[room_number].insert(index, end)
+            self.__holders[room_number].insert(index, booking_id)
+            self.__holds[booking_id] = (room_number, start, end)
+            return True
+
+    def release(self, booking_id) -> bool:
+        """
+        Releases the hold taken by a booking.
+
+        :param booking_id: The ID of the booking whose hold is released.
+        :return: True if a hold was released, False if the booking held nothing.
+        """
+        with self.__lock:
+            hold = self.__holds.pop(booking_id, None)
+            if hold is None:
+                return False
+            room_number, start, _ = hold
+            index = bisect_left(self.__starts[room_number], start)
+            del self.__starts[room_number][index]
+            del self.__ends[room_number][index]
+            del self.__holders[room_number][index]
+            return True
+
+    def move(self, booking_id, room_number: int, check_in, check_out) -> bool:
+        """
+        Moves a booking's hold to a new room and/or date range.
+
+        The old hold is kept if the new one cannot be taken, so a failed move changes nothing.
+
+        :param booking_id: The ID of the booking to move.
+        :param room_number: The number of the room to hold.
+        :param check_in: The new first night of the stay.
+        :param check_out: The new check-out day (exclusive).
+        :return: True if the booking now holds the new range, False otherwise.
+        """
+        with self.__lock:
+            old_hold = self.__holds.get(booking_id)
+            self.release(booking_id)
+            if self.reserve(room_number, check_in, check_out, booking_id):
+                return True
+            if old_hold is not None:
+                self.reserve(old_hold[0], old_hold[1], old_hold[2], booking_id)
+            return False
+
+    def rename_hold(self, old_booking_id, new_booking_id) -> bool:
+        """
+        Moves a hold to a new booking ID, keeping its room and dates.
+
+        :param old_booking_id: The ID the hold is kept under.
+        :param new_booking_id: The ID to keep it under from now on.
+        :return: False if the new ID already holds something, in which case nothing changes.
+            True otherwise, including when the old ID held nothing.
+        """
+        with self.__lock:
+            if new_booking_id == old_booking_id:
+                return True
+            if new_booking_id in self.__holds:
+                return False
+            hold = self.__holds.pop(old_booking_id, None)
+            if hold is None:
+                return True
+            room_number, start, _ = hold
+            self.__holders[room_number][bisect_left(self.__starts[room_number], start)] = new_booking_id
+            self.__holds[new_booking_id] = hold
+            return True
+
+    def rename_room(self, old_room_number: int, new_room_number: int) -> bool:
+        """
+        Moves a room's holds to a new room number.
+
+        :param old_room_number: The number the room is tracked under.
+        :param new_room_number: The number to track it under from now on.
+        :return: False if the new number already has holds, in which case nothing changes.
+        """
+        with self.__lock:
+            if new_room_number == old_room_number:
+                return True
+            if self.__starts.get(new_room_number):
+                return False
+            if old_room_number not in self.__starts:
+                self.add_room(new_room_number)
+                return True
+            starts = self.__starts[new_room_number] = self.__starts.pop(old_room_number)
+            ends = self.__ends[new_room_number] = self.__ends.pop(old_room_number)
+            holders = self.__holders[new_room_number] = self.__holders.pop(old_room_number)
+            for booking_id, start, end in zip(holders, starts, ends):
+                self.__holds[booking_id] = (new_room_number, start, end)
+            return True
+
+    def get_hold(self, booking_id):
+        """
+        Returns the hold of a booking as (room_number, check_in_ordinal, check_out_ordinal), or None.
+        """
+        with self.__lock:
+            return self.__holds.get(booking_id)
+
+    def __str__(self) -> str:
+        """Returns a string representation of the RoomCalendar object."""
+        return f"RoomCalendar(Rooms: {len(self.__starts)}, Holds: {len(self.__holds)})"
+
+
+# Example Usage
+if __name__ == "__main__":
+    calendar = RoomCalendar()
+    calendar.add_room(101)
+    calendar.add_room(102)
+
+    print(calendar.reserve(101, "2025-07-01", "2025-07-05", 1001))  # Output: True
+    print(calendar.reserve(101, "2025-07-04", "2025-07-06", 1002))  # Output: False
+    print(calendar.is_available(101, "2025-07-05", "2025-07-08"))  # Output: True
+    print(calendar.get_free_rooms("2025-07-02", "2025-07-03"))  # Output: [102]
+
+    calendar.release(1001)
+    print(calendar.is_available(101, "2025-07-01", "2025-07-05"))  # Output: True
+    print(calendar)  # Output: RoomCalendar(Rooms: 2, Holds: 0)
@@ -0,0 +1,221 @@
+# RoomInventory class
+from bisect import bisect_left, bisect_right, insort
+
+from AmenityRegistry import AMENITIES
+
+
+class RoomInventory:
+    """
+    Holds a hotel's rooms and indexes them by room type, price and amenity.
+
+    Rooms added to the inventory report their own changes back to it, so the
+    indexes stay current when a room's type, price or amenities are updated.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty RoomInventory.
+        """
+        self.__rooms = {}  # room_number -> Room
+        self.__by_type = {}  # room_type -> {room_number: Room}
+        self.__by_price = {}  # price_per_night -> {room_number: Room}
+        self.__prices = []  # Sorted distinct prices present in __by_price
+        self.__by_amenity = {}  # amenity -> {room_number: Room}
+
+    # Index maintenance helpers
+    @staticmethod
+    def __index_add(index: dict, key, room: "Room") -> None:
+        index.setdefault(key, {})[room.get_room_number()] = room
+
+    @staticmethod
+    def __index_remove(index: dict, key, room_number: int) -> bool:
+        """Removes a room from an index bucket and returns True if the bucket became empty."""
+        bucket = index.get(key)
+        if bucket is None:
+            return False
+        bucket.pop(room_number, None)
+        if not bucket:
+            del index[key]
+            return True
+        return False
+
+    def __price_add(self, price: float, room: "Room") -> None:
+        if price not in self.__by_price:
+            insort(self.__prices, price)
+        self.__index_add(self.__by_price, price, room)
+
+    def __price_remove(self, price: float, room_number: int) -> None:
+        if self.__index_remove(self.__by_price, price, room_number):
+            del self.__prices[bisect_left(self.__prices, price)]
+
+    def __index_room(self, room: "Room") -> None:
+        self.__index_add(self.__by_type, room.get_room_type(), room)
+        self.__price_add(room.get_price(), room)
+        for amenity in room.get_amenities():
+            self.__index_add(self.__by_amenity, amenity, room)
+
+    def __unindex_room(self, room: "Room", room_number: int) -> None:
+        self.__index_remove(self.__by_type, room.get_room_type(), room_number)
+        self.__price_remove(room.get_price(), room_number)
+        for amenity in room.get_amenities():
+            self.__index_remove(self.__by_amenity, amenity, room_number)
+
+    def add_room(self, room: "Room") -> bool:
+        """
+        Adds a room to the inventory and indexes it.
+
+        :param room: The Room object to add.
+        :return: True if the room was added, False if its room number is already taken.
+        """
+        if room.get_room_number() in self.__rooms:
+            return False
+        self.__rooms[room.get_room_number()] = room
+        self.__index_room(room)
+        room.set_inventory(self)
+        return True
+
+    def remove_room(self, room_number: int) -> "Room":
+        """
+        Removes a room from the inventory.
+
+        :param room_number: The number of the room to remove.
+        :return: The removed Room object, or None if it was not in the inventory.
+        """
+        room = self.__rooms.pop(room_number, None)
+        if room is not None:
+            self.__unindex_room(room, room_number)
+            room.set_inventory(None)
+        return room
+
+    def get_room(self, room_number: int) -> "Room":
+        """Returns the room with the given number, or None."""
+        return self.__rooms.get(room_number)
+
+    def get_all_rooms(self) -> list:
+        """Returns every room in the inventory."""
+        return list(self.__rooms.values())
+
+    def get_rooms_by_type(self, room_type: str) -> list:
+        """Returns all rooms of the given type."""
+        return list(self.__by_type.get(room_type, {}).values())
+
+    def get_rooms_in_price_range(self, min_price: float = None, max_price: float = None) -> list:
+        """
+        Returns all rooms whose price per night lies within the given bounds (inclusive).
+
+        :param min_price: The lowest price to include, or None for no lower bound.
+        :param max_price: The highest price to include, or None for no upper bound.
+        :return: Rooms ordered from cheapest to most expensive.
+        """
+        first = 0 if min_price is None else bisect_left(self.__prices, min_price)
+        last = len(self.__prices) if max_price is None else bisect_right(self.__prices, max_price)
+        return [room for price in self.__prices[first:last] for room in self.__by_price[price].values()]
+
+    def get_rooms_under(self, price: float) -> list:
+        """Returns all rooms strictly cheaper than the given price per night."""
+        last = bisect_left(self.__prices, price)
+        return [room for room_price in self.__prices[:last] for room in self.__by_price[room_price].values()]
+
+    def get_rooms_with_amenity(self, amenity: str) -> list:
+        """Returns all rooms offering the given amenity."""
+        return list(self.__by_amenity.get(amenity, {}).values())
+
+    def filter_by_amenities(self, required: list = (), excluded: list = ()) -> list:
+        """
+        Returns all rooms that have every required amenity and none of the excluded ones.
+
+        The smallest bucket among the required amenities is scanned and each room in it
+        is checked with a single bitwise test against its amenity mask.
+
+        :param required: Amenity names every returned room must offer.
+        :param excluded: Amenity names no returned room may offer.
+        """
+        if any(AMENITIES.get_bit(amenity) < 0 for amenity in required):
+            return []
+        required_mask = AMENITIES.lookup_mask(required)
+        excluded_mask = AMENITIES.lookup_mask(excluded)
+        if required:
+            candidates = min((self.__by_amenity.get(amenity, {}) for amenity in required), key=len).values()
+        else:
+            candidates = self.__rooms.values()
+        return [room for room in candidates if AMENITIES.matches(room.get_amenity_mask(), required_mask, excluded_mask)]
+
+    def reprice_type(self, room_type: str, new_price: float) -> int:
+        """
+        Sets the price per night of every room of a type.
+
+        Only the rooms of that type are visited, so the cost is proportional to their count.
+
+        :param room_type: The room type to reprice.
+        :param new_price: The new price per night.
+        :return: The number of rooms repriced.
+        """
+        rooms = self.get_rooms_by_type(room_type)
+        for room in rooms:
+            room.update_price(new_price)
+        return len(rooms)
+
+    # Change notifications sent by Room
+    def on_room_number_changed(self, room: "Room", old_room_number: int) -> None:
+        """
+        Re-keys a room whose number has changed.
+
+        :raises ValueError: If another room in the inventory already has the new number; nothing changes.
+        """
+        other = self.__rooms.get(room.get_room_number())
+        if other is not None and other is not room:
+            raise ValueError(f"Room number {room.get_room_number()} is already taken in the inventory.")
+        self.__rooms.pop(old_room_number, None)
+        self.__unindex_room(room, old_room_number)
+        self.__rooms[room.get_room_number()] = room
+        self.__index_room(room)
+
+    def on_room_type_changed(self, room: "Room", old_room_type: str) -> None:
+        """Moves a room between room type buckets."""
+        self.__index_remove(self.__by_type, old_room_type, room.get_room_number())
+        self.__index_add(self.__by_type, room.get_room_type(), room)
+
+    def on_price_changed(self, room: "Room", old_price: float) -> None:
+        """Moves a room between price buckets."""
+        self.__price_remove(old_price, room.get_room_number())
+        self.__price_add(room.get_price(), room)
+
+    def on_amenity_added(self, room: "Room", amenity: str) -> None:
+        """Adds a room to an amenity's bucket."""
+        self.__index_add(self.__by_amenity, amenity, room)
+
+    def on_amenity_removed(self, room: "Room", amenity: str) -> None:
+        """Removes a room from an amenity's bucket."""
+        self.__index_remove(self.__by_amenity, amenity, room.get_room_number())
+
+    def __len__(self) -> int:
+        """Returns the number of rooms in the inventory."""
+        return len(self.__rooms)
+
+    def __str__(self) -> str:
+        """Returns a string representation of the RoomInventory object."""
+        return f"RoomInventory(Rooms: {len(self.__rooms)}, Types: {len(self.__by_type)}, Amenities: {len(self.__by_amenity)})"
+
+
+# Example Usage
+if __name__ == "__main__":
+    from Room import Room
+
+    inventory = RoomInventory()
+    inventory.add_room(Room(101, "Suite", ["Wi-Fi", "TV", "Jacuzzi"], 300.0))
+    inventory.add_room(Room(102, "Deluxe", ["Wi-Fi", "TV"], 150.0))
+    inventory.add_room(Room(103, "Suite", ["Wi-Fi", "Mini-Bar"], 280.0))
+
+    print([room.get_room_number() for room in inventory.get_rooms_by_type("Suite")])  # Output: [101, 103]
+    print([room.get_room_number() for room in inventory.get_rooms_under(200.0)])  # Output: [102]
+    print([room.get_room_number() for room in inventory.get_rooms_with_amenity("Jacuzzi")])  # Output: [101]
+
+    # Bulk reprice only touches the Suites
+    inventory.reprice_type("Suite", 180.0)
+    print([room.get_room_number() for room in inventory.get_rooms_under(200.0)])  # Output: [102, 101, 103]
+
+    # Indexes follow changes made directly on a room
+    inventory.get_room(102).set_room_type("Suite")
+    inventory.get_room(101).remove_amenity("Jacuzzi")
+    print(len(inventory.get_rooms_by_type("Suite")), inventory.get_rooms_with_amenity("Jacuzzi"))  # Output: 3 []
+    print(inventory)  # Output: RoomInventory(Rooms: 3, Types: 1, Amenities: 3)
@@ -0,0 +1,417 @@
+# RoomTable class
+import tracemalloc
+from array import array
+from bisect import bisect_left
+
+from AmenityRegistry import AMENITIES
+
+
+class RoomTable:
+    """
+    Stores a large room portfolio column by column in typed arrays instead of one object per room.
+
+    Each room is a row across five columns: room number, room type code, price per night,
+    availability status and amenity bitmask. Rows are found by room number through two
+    sorted arrays rather than a dict, so the index costs 16 bytes per room. RoomView objects give existing callers the
+    familiar Room methods on top of a row, and bulk operations work on whole columns.
+    """
+
+    MAX_AMENITIES = 64  # The amenity column holds unsigned 64-bit masks
+
+    def __init__(self):
+        """
+        Initializes an empty RoomTable.
+        """
+        self.__room_numbers = array("q")
+        self.__type_codes = array("H")
+        self.__prices = array("d")
+        self.__statuses = array("b")
+        self.__amenity_masks = array("Q")
+        self.__index_numbers = array("q")  # Sorted room numbers, searched with binary search
+        self.__index_rows = array("q")  # Row index of each entry in __index_numbers
+        self.__type_names = []  # type code -> room type name
+        self.__type_codes_by_name = {}  # room type name -> type code
+
+    @classmethod
+    def from_rooms(cls, rooms: list) -> "RoomTable":
+        """
+        Builds a RoomTable from existing Room objects.
+
+        :param rooms: The Room objects to copy into the table.
+        :return: A new RoomTable holding one row per room.
+        """
+        table = cls()
+        for room in rooms:
+            table.add_room(room.get_room_number(), room.get_room_type(), room.get_amenities(), room.get_price(), room.check_availability())
+        return table
+
+    def get_type_code(self, room_type: str) -> int:
+        """Returns the code of a room type, registering it if it is new."""
+        code = self.__type_codes_by_name.get(room_type)
+        if code is None:
+            code = len(self.__type_names)
+            self.__type_codes_by_name[room_type] = code
+            self.__type_names.append(room_type)
+        return code
+
+    @classmethod
+    def check_amenity_mask(cls, mask: int) -> int:
+        """Returns the mask unchanged, or raises ValueError if it does not fit in the amenity column."""
+        if mask >> cls.MAX_AMENITIES:
+            raise ValueError(f"RoomTable supports at most {cls.MAX_AMENITIES} distinct amenities.")
+        return mask
+
+    def add_room(self, room_number: int, room_type: str, amenities: list, price_per_night: float, availability_status: bool = True) -> "RoomView":
+        """
+        Appends a room to the table.
+
+        :param room_number: Unique number assigned to the room.
+        :param room_type: Type of room (e.g., Single, Double, Suite).
+        :param amenities: List of amenities available in the room.
+        :param price_per_night: Cost of staying per night.
+        :param availability_status: Whether the room is available (default: True).
+        :return: A RoomView for the new row, or None if the room number is already taken.
+        """
+        if self.__find(room_number) >= 0:
+            return None
+        mask = self.check_amenity_mask(AMENITIES.to_mask(amenities))
+        self.__index_insert(room_number, len(self.__room_numbers))
+        self.__room_numbers.append(room_number)
+        self.__type_codes.append(self.get_type_code(room_type))
+        self.__prices.append(price_per_night)
+        self.__statuses.append(1 if availability_status else 0)
+        self.__amenity_masks.append(mask)
+        return RoomView(self, room_number)
+
+    def remove_room(self, room_number: int) -> bool:
+        """
+        Removes a room by moving the last row into its place.
+
+        :param room_number: The number of the room to remove.
+        :return: True if the room was removed, False if it was not in the table.
+        """
+        position = self.__find(room_number)
+        if position < 0:
+            return False
+        row = self.__index_rows[position]
+        self.__index_delete(position)
+        last = len(self.__room_numbers) - 1
+        for column in (self.__room_numbers, self.__type_codes, self.__prices, self.__statuses, self.__amenity_masks):
+            column[row] = column[last]
+            column.pop()
+        if row != last:
+            self.__index_rows[self.__find(self.__room_numbers[row])] = row
+        return True
+
+    # Room number index, kept as two aligned arrays sorted by room number
+    def __find(self, room_number: int) -> int:
+        """Returns the index position of a room number, or -1 if it is not in the table."""
+        position = bisect_left(self.__index_numbers, room_number)
+        if position < len(self.__index_numbers) and self.__index_numbers[position] == room_number:
+            return position
+        return -1
+
+    def __index_insert(self, room_number: int, row: int) -> None:
+        position = bisect_left(self.__index_numbers, room_number)
+        if position == len(self.__index_numbers):
+            self.__index_numbers.append(room_number)
+            self.__index_rows.append(row)
+        else:
+            self.__index_numbers.insert(position, room_number)
+            self.__index_rows.insert(position, row)
+
+    def __index_delete(self, position: int) -> None:
+        del self.__index_numbers[position]
+        del self.__index_rows[position]
+
+    def get_room(self, room_number: int) -> "RoomView":
+        """Returns a RoomView for the given room number, or None."""
+        if self.__find(room_number) < 0:
+            return None
+        return RoomView(self, room_number)
+
+    def get_all_rooms(self):
+        """Yields a RoomView for every row in the table."""
+        for room_number in self.__room_numbers:
+            yield RoomView(self, room_number)
+
+    # Column access used by RoomView and bulk operations
+    def get_row(self, room_number: int) -> int:
+        """Returns the row index of a room number, or raises KeyError if it is not in the table."""
+        position = self.__find(room_number)
+        if position < 0:
+            raise KeyError(room_number)
+        return self.__index_rows[position]
+
+    def get_room_numbers(self) -> array:
+        """Returns the room number column."""
+        return self.__room_numbers
+
+    def get_type_codes(self) -> array:
+        """Returns the room type code column."""
+        return self.__type_codes
+
+    def get_type_name(self, code: int) -> str:
+        """Returns the room type name for a type code."""
+        return self.__type_names[code]
+
+    def get_prices(self) -> array:
+        """Returns the price per night column."""
+        return self.__prices
+
+    def get_statuses(self) -> array:
+        """Returns the availability status column (1 for available, 0 otherwise)."""
+        return self.__statuses
+
+    def get_amenity_masks(self) -> array:
+        """Returns the amenity bitmask column."""
+        return self.__amenity_masks
+
+    def rename_room(self, old_room_number: int, new_room_number: int) -> bool:
+        """Changes a room's number, returning False if the new number is already taken."""
+        if self.__find(new_room_number) >= 0:
+            return False
+        row = self.get_row(old_room_number)
+        self.__index_delete(self.__find(old_room_number))
+        self.__index_insert(new_room_number, row)
+        self.__room_numbers[row] = new_room_number
+        return True
+
+    # Bulk operations over whole columns
+    def calculate_discounted_prices(self, discount: float) -> array:
+        """
+        Calculates the discounted price of every room in one pass.
+
+        Uses the same formula as Room.calculate_discounted_price, so each value matches the scalar result.
+
+        :param discount: Discount percentage to be applied.
+        :return: Discounted prices aligned with the table's rows.
+        """
+        factor = 1 - discount / 100
+        return array("d", [price * factor for price in self.__prices])
+
+    def filter_by_status(self, available: bool = True) -> list:
+        """Returns the numbers of all rooms with the given availability status."""
+        wanted = 1 if available else 0
+        numbers = self.__room_numbers
+        return [numbers[row] for row, status in enumerate(self.__statuses) if status == wanted]
+
+    def filter_by_type(self, room_type: str) -> list:
+        """Returns the numbers of all rooms of the given type."""
+        code = self.__type_codes_by_name.get(room_type)
+        if code is None:
+            return []
+        numbers = self.__room_numbers
+        return [numbers[row] for row, room_code in enumerate(self.__type_codes) if room_code == code]
+
+    def filter_by_amenities(self, required: list = (), excluded: list = ()) -> list:
+        """Returns the numbers of all rooms that have every required amenity and none of the excluded ones."""
+        if any(AMENITIES.get_bit(amenity) < 0 for amenity in required):
+            return []
+        required_mask = AMENITIES.lookup_mask(required)
+        excluded_mask = AMENITIES.lookup_mask(excluded)
+        numbers = self.__room_numbers
+        return [numbers[row] for row, mask in enumerate(self.__amenity_masks) if mask & required_mask == required_mask and not mask & excluded_mask]
+
+    def update_statuses(self, room_numbers: list, new_status: bool) -> None:
+        """Sets the availability status of many rooms at once."""
+        value = 1 if new_status else 0
+        statuses = self.__statuses
+        for room_number in room_numbers:
+            statuses[self.get_row(room_number)] = value
+
+    def __len__(self) -> int:
+        """Returns the number of rooms in the table."""
+        return len(self.__room_numbers)
+
+    def __str__(self) -> str:
+        """Returns a string representation of the RoomTable object."""
+        return f"RoomTable(Rooms: {len(self.__room_numbers)}, Types: {len(self.__type_names)})"
+
+
+class RoomView:
+    """
+    A lightweight, Room-compatible handle onto one row of a RoomTable.
+
+    Views hold only the table and the room number, so they can be created on demand and thrown away.
+    """
+
+    __slots__ = ("_table", "_room_number")
+
+    def __init__(self, table: RoomTable, room_number: int):
+        """
+        Initializes a RoomView.
+
+        :param table: The RoomTable that stores the room.
+        :param room_number: The number of the room this view reads and writes.
+        """
+        self._table = table
+        self._room_number = room_number
+
+    def get_room_number(self) -> int:
+        """Returns the room number."""
+        return self._room_number
+
+    def set_room_number(self, room_number: int) -> None:
+        """
+        Sets a new room number.
+
+        :raises ValueError: If the table already has another room with that number, as Room.set_room_number does.
+        """
+        if room_number == self._room_number:
+            return
+        if not self._table.rename_room(self._room_number, room_number):
+            raise ValueError(f"Room number {room_number} is already taken in the table.")
+        self._room_number = room_number
+
+    def get_room_type(self) -> str:
+        """Returns the room type."""
+        return self._table.get_type_name(self._table.get_type_codes()[self._table.get_row(self._room_number)])
+
+    def set_room_type(self, room_type: str) -> None:
+        """Updates the room type."""
+        self._table.get_type_codes()[self._table.get_row(self._room_number)] = self._table.get_type_code(room_type)
+
+    def get_amenities(self) -> list:
+        """Returns the list of amenities available in the room."""
+        return AMENITIES.to_names(self.get_amenity_mask())
+
+    def get_amenity_mask(self) -> int:
+        """Returns the room's amenities encoded as a bitmask of the shared amenity registry."""
+        return self._table.get_amenity_masks()[self._table.get_row(self._room_number)]
+
+    def has_amenity(self, amenity: str) -> bool:
+        """Checks whether the room offers an amenity."""
+        bit = AMENITIES.get_bit(amenity)
+        return bit >= 0 and bool(self.get_amenity_mask() >> bit & 1)
+
+    def add_amenity(self, amenity: str) -> None:
+        """Adds a new amenity to the room if it's not already present."""
+        row = self._table.get_row(self._room_number)
+        masks = self._table.get_amenity_masks()
+        masks[row] = self._table.check_amenity_mask(masks[row] | 1 << AMENITIES.intern(amenity))
+
+    def remove_amenity(self, amenity: str) -> None:
+        """Removes an existing amenity from the room."""
+        if self.has_amenity(amenity):
+            row = self._table.get_row(self._room_number)
+            masks = self._table.get_amenity_masks()
+            masks[row] &= ~(1 << AMENITIES.get_bit(amenity))
+
+    def get_price(self) -> float:
+        """Returns the price per night for the room."""
+        return self._table.get_prices()[self._table.get_row(self._room_number)]
+
+    def update_price(self, new_price: float) -> None:
+        """Updates the price per night of the room."""
+        self._table.get_prices()[self._table.get_row(self._room_number)] = new_price
+
+    def check_availability(self) -> bool:
+        """Returns the availability status of the room."""
+        return self._table.get_statuses()[self._table.get_row(self._room_number)] == 1
+
+    def update_status(self, new_status: bool) -> None:
+        """Updates the availability status of the room."""
+        self._table.get_statuses()[self._table.get_row(self._room_number)] = 1 if new_status else 0
+
+    def release_room(self) -> None:
+        """Marks the room as available when a guest checks out."""
+        self.update_status(True)
+
+    def schedule_maintenance(self, date: str) -> bool:
+        """Marks the room as unavailable due to scheduled maintenance (always succeeds without a calendar)."""
+        self.update_status(False)
+        return True
+
+    def get_calendar(self) -> None:
+        """Table rows are not attached to a RoomCalendar."""
+        return None
+
+    def get_inventory(self) -> None:
+        """Table rows are not indexed by a RoomInventory."""
+        return None
+
+    def add_watcher(self, watcher) -> None:
+        """Views are created on demand, so they keep no watchers."""
+
+    def remove_watcher(self, watcher) -> None:
+        """Views are created on demand, so they keep no watchers."""
+
+    def calculate_discounted_price(self, discount: float) -> float:
+        """Calculates the price of the room after applying a discount."""
+        return self.get_price() * (1 - discount / 100)
+
+    def get_room_info(self) -> dict:
+        """Returns a dictionary containing all the room details."""
+        return {
+            "room_number": self._room_number,
+            "room_type": self.get_room_type(),
+            "amenities": self.get_amenities(),
+            "price_per_night": self.get_price(),
+            "availability_status": self.check_availability()
+        }
+
+    def __eq__(self, other) -> bool:
+        """Two views are equal when they point at the same room of the same table."""
+        return isinstance(other, RoomView) and other._table is self._table and other._room_number == self._room_number
+
+    def __hash__(self) -> int:
+        return hash((id(self._table), self._room_number))
+
+    def __str__(self) -> str:
+        """Returns a string representation of the room, matching Room.__str__."""
+        availability = "Available" if self.check_availability() else "Occupied"
+        return f"Room {self._room_number}: {self.get_room_type()}, Price: ${self.get_price()}/night, Status: {availability}"
+
+
+def benchmark_memory(room_count: int = 100_000) -> dict:
+    """
+    Compares the memory used by Room objects with a RoomTable holding the same rooms.
+
+    :param room_count: The number of rooms to build.
+    :return: Bytes allocated by each representation and the ratio between them.
+    """
+    from Room import Room
+
+    amenity_sets = (["Wi-Fi", "TV"], ["Wi-Fi", "TV", "Mini-Bar"], ["Wi-Fi", "TV", "Jacuzzi"], ["Wi-Fi"])
+    room_types = ("Single", "Double", "Deluxe", "Suite")
+
+    tracemalloc.start()
+    rooms = [Room(100_000 + i, room_types[i % 4], amenity_sets[i % 4], 100.0 + i % 300) for i in range(room_count)]
+    object_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    table = RoomTable()
+    for i in range(room_count):
+        table.add_room(100_000 + i, room_types[i % 4], amenity_sets[i % 4], 100.0 + i % 300)
+    table_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del rooms, table
+    return {
+        "rooms": room_count,
+        "room_objects_bytes": object_bytes,
+        "room_table_bytes": table_bytes,
+        "ratio": object_bytes / table_bytes,
+    }
+
+
+# Example Usage
+if __name__ == "__main__":
+    table = RoomTable()
+    table.add_room(101, "Suite", ["Wi-Fi", "TV", "Mini-Bar"], 150.0)
+    table.add_room(102, "Deluxe", ["Wi-Fi", "TV"], 120.0, False)
+
+    # Views behave like Room objects
+    room = table.get_room(101)
+    print(room.get_amenities())  # Output: ['Wi-Fi', 'TV', 'Mini-Bar']
+    room.update_price(200.0)
+    print(room)  # Output: Room 101: Suite, Price: $200.0/night, Status: Available
+
+    # Bulk operations
+    print(list(table.calculate_discounted_prices(10)))  # Output: [180.0, 108.0]
+    print(table.filter_by_status(True))  # Output: [101]
+
+    # Memory footprint compared with Room objects
+    print(benchmark_memory(10_000))
@@ -0,0 +1,152 @@
+# SpecialRequestQueue class
+import heapq
+import threading
+from itertools import count
+
+from RoomCalendar import to_ordinal
+from SpecialRequestRegistry import SPECIAL_REQUESTS, SpecialRequestRegistry
+
+
+class SpecialRequestQueue:
+    """
+    A central queue of special requests ordered by the check-in day of their booking.
+
+    Each request is a heap entry, so pulling the k requests due by a day costs O(k log n) and
+    never looks at other bookings. Entries are not removed when a booking is cancelled, moved or
+    removed; every booking has a generation number that is replaced on such changes, and stale
+    entries are dropped when they reach the top of the heap. Moved bookings get fresh entries for
+    their new day. Generations come from one counter for the whole queue, so a booking that is
+    removed and added again never makes its old entries current.
+    """
+
+    def __init__(self, registry: SpecialRequestRegistry = SPECIAL_REQUESTS):
+        """
+        Initializes an empty SpecialRequestQueue.
+
+        :param registry: The registry that decodes request codes.
+        """
+        self.__registry = registry
+        self.__heap = []  # (check_in_day, tie_breaker, generation, booking, code)
+        self.__tie_breaker = count()  # Keeps entries for the same day in the order they were added
+        self.__generations = count()  # Never reused, unlike a per-booking counter restarting at 0
+        self.__keys = {}  # id(booking) -> (generation, check_in_day, active)
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def __is_active(booking: "Booking") -> bool:
+        return booking.get_status() != "Cancelled"
+
+    def add_booking(self, booking: "Booking") -> None:
+        """
+        Queues a booking's special requests and follows the booking from then on.
+
+        Requests the booking receives later are queued automatically.
+
+        :param booking: The Booking object to follow.
+        """
+        with self.__lock:
+            if id(booking) not in self.__keys:
+                self.__keys[id(booking)] = (next(self.__generations), booking.get_check_in_day(), self.__is_active(booking))
+                self.__push_all(booking)
+        booking.set_request_queue(self)
+
+    def remove_booking(self, booking: "Booking") -> None:
+        """Stops following a booking; its queued requests are dropped lazily."""
+        with self.__lock:
+            self.__keys.pop(id(booking), None)
+        booking.set_request_queue(None)
+
+    def __push_all(self, booking: "Booking") -> None:
+        """Queues every request of a booking under its current generation (caller holds the lock)."""
+        generation, check_in_day, active = self.__keys[id(booking)]
+        if active:
+            for code in booking.get_special_request_codes():
+                heapq.heappush(self.__heap, (check_in_day, next(self.__tie_breaker), generation, booking, code))
+
+    def push(self, booking: "Booking", code: int) -> None:
+        """Queues one new request of a followed booking (called by Booking.add_special_request)."""
+        with self.__lock:
+            key = self.__keys.get(id(booking))
+            if key is not None and key[2]:
+                heapq.heappush(self.__heap, (key[1], next(self.__tie_breaker), key[0], booking, code))
+
+    def on_booking_changed(self, booking: "Booking") -> None:
+        """Re-queues a booking's requests if its check-in day or cancellation changed (called by Booking)."""
+        with self.__lock:
+            key = self.__keys.get(id(booking))
+            if key is None:
+                return
+            _, check_in_day, active = key
+            if check_in_day == booking.get_check_in_day() and active == self.__is_active(booking):
+                return
+            self.__keys[id(booking)] = (next(self.__generations), booking.get_check_in_day(), self.__is_active(booking))
+            self.__push_all(booking)
+
+    def __is_current(self, entry: tuple) -> bool:
+        key = self.__keys.get(id(entry[3]))
+        return key is not None and key[0] == entry[2]
+
+    def __pop_current(self, day: int) -> list:
+        """Pops every entry due on or before a day, keeping only current ones (caller holds the lock)."""
+        entries = []
+        while self.__heap and self.__heap[0][0] <= day:
+            entry = heapq.heappop(self.__heap)
+            if self.__is_current(entry):
+                entries.append(entry)
+        return entries
+
+    def pop_due(self, day) -> list:
+        """
+        Removes and returns every request due on or before a day, earliest check-in first.
+
+        :param day: The day as an ordinal, date or YYYY-MM-DD string.
+        :return: A list of (booking, request_text) pairs.
+        """
+        with self.__lock:
+            entries = self.__pop_current(to_ordinal(day))
+        return [(entry[3], self.__registry.get_text(entry[4])) for entry in entries]
+
+    def peek_due(self, day) -> list:
+        """
+        Returns the requests due on or before a day without removing them.
+
+        :param day: The day as an ordinal, date or YYYY-MM-DD string.
+        :return: A list of (booking, request_text) pairs, earliest check-in first.
+        """
+        with self.__lock:
+            entries = self.__pop_current(to_ordinal(day))
+            for entry in entries:
+                heapq.heappush(self.__heap, entry)
+        return [(entry[3], self.__registry.get_text(entry[4])) for entry in entries]
+
+    def __len__(self) -> int:
+        """Returns the number of heap entries, including stale ones not yet dropped."""
+        return len(self.__heap)
+
+    def __str__(self) -> str:
+        """Returns a string representation of the SpecialRequestQueue object."""
+        return f"SpecialRequestQueue(Bookings: {len(self.__keys)}, Entries: {len(self.__heap)})"
+
+
+# Example Usage
+if __name__ == "__main__":
+    from Booking import Booking
+    from Guest import Guest
+    from Room import Room
+
+    guest1 = Guest(301, "Alice Smith", "alice@email.com")
+    booking1 = Booking(1001, guest1, Room(101, "Suite", ["Wi-Fi"], 150.0), "2025-07-01", "2025-07-05")
+    booking2 = Booking(1002, guest1, Room(102, "Double", ["TV"], 100.0), "2025-07-03", "2025-07-04")
+
+    requests = SpecialRequestQueue()
+    requests.add_booking(booking1)
+    requests.add_booking(booking2)
+    booking1.add_special_request("Extra towels")
+    booking2.add_special_request("extra  TOWELS")
+    booking2.add_special_request("Late check-out")
+
+    print(booking2.get_special_requests())  # Output: ['Extra towels', 'Late check-out']
+    print([(booking.get_booking_id(), text) for booking, text in requests.pop_due("2025-07-01")])  # Output: [(1001, 'Extra towels')]
+
+    booking2.cancel_booking()
+    print(requests.pop_due("2025-07-31"))  # Output: []
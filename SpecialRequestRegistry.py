@@ -0,0 +1,70 @@
+# SpecialRequestRegistry class
+import threading
+
+
+class SpecialRequestRegistry:
+    """
+    Interns special requests as small integer codes, so bookings store codes instead of strings.
+
+    Requests are matched after trimming, collapsing whitespace and ignoring case, so
+    "Extra towels" and "extra  towels " share one code. The first spelling seen is kept as the text.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty SpecialRequestRegistry.
+        """
+        self.__codes = {}  # normalized request -> code
+        self.__texts = []  # code -> request text
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def normalize(request: str) -> str:
+        """Returns the key two requests share when they mean the same thing."""
+        return " ".join(request.split()).casefold()
+
+    def intern(self, request: str) -> int:
+        """
+        Returns the code of a request, registering it if it is new.
+
+        :param request: The request text (e.g., Extra towels).
+        :return: The code assigned to the request.
+        """
+        key = self.normalize(request)
+        code = self.__codes.get(key)
+        if code is None:
+            with self.__lock:
+                code = self.__codes.get(key)
+                if code is None:
+                    code = len(self.__texts)
+                    self.__texts.append(" ".join(request.split()))
+                    self.__codes[key] = code
+        return code
+
+    def get_code(self, request: str) -> int:
+        """Returns the code of a request, or -1 if it was never registered."""
+        return self.__codes.get(self.normalize(request), -1)
+
+    def get_text(self, code: int) -> str:
+        """Returns the request text for a code."""
+        return self.__texts[code]
+
+    def __len__(self) -> int:
+        """Returns the number of registered requests."""
+        return len(self.__texts)
+
+    def __str__(self) -> str:
+        """Returns a string representation of the SpecialRequestRegistry object."""
+        return f"SpecialRequestRegistry(Requests: {len(self.__texts)})"
+
+
+# Shared registry used by every Booking
+SPECIAL_REQUESTS = SpecialRequestRegistry()
+
+
+# Example Usage
+if __name__ == "__main__":
+    registry = SpecialRequestRegistry()
+    towels = registry.intern("Extra towels")
+    print(registry.intern("  extra TOWELS") == towels)  # Output: True
+    print(registry.get_text(towels))  # Output: Extra towels